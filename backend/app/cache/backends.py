@@ -0,0 +1,112 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class CacheBackend:
+    """Интерфейс хранилища кэша."""
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Возвращает значение по ключу или None."""
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: int):
+        """Сохраняет значение на ttl секунд."""
+        raise NotImplementedError
+
+    async def add(self, key: str, value: Any, ttl: int) -> bool:
+        """Сохраняет значение на ttl секунд, если ключа ещё нет."""
+        raise NotImplementedError
+
+    async def incr(self, key: str) -> int:
+        """
+        Увеличивает целочисленное значение ключа на единицу, сохраняя
+        срок жизни ключа.
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        """Освобождает ресурсы хранилища."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Кэш в памяти процесса с вытеснением давно не использованных записей.
+
+    Подходит для одного процесса приложения: при нескольких процессах
+    каждый хранит свою копию, а сброс виден только в одном из них.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+
+    async def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key, value, ttl):
+        self._store(key, value, time.monotonic() + ttl)
+
+    async def add(self, key, value, ttl):
+        if await self.get(key) is not None:
+            return False
+        self._store(key, value, time.monotonic() + ttl)
+        return True
+
+    async def incr(self, key):
+        value = (await self.get(key) or 0) + 1
+        entry = self._entries.get(key)
+        self._store(key, value, entry[1] if entry is not None else None)
+        return value
+
+    def _store(self, key, value, expires_at):
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Кэш в Redis, общий для всех процессов приложения.
+
+    Значения хранятся в формате JSON.
+
+    Параметры:
+    - url (str): Адрес сервера Redis.
+    - client: Готовый клиент redis.asyncio; если не передан, создаётся
+    по url.
+    """
+
+    def __init__(self, url: str, client=None):
+        if client is None:
+            from redis import asyncio as redis
+
+            client = redis.from_url(url)
+        self._client = client
+
+    async def get(self, key):
+        raw = await self._client.get(key)
+        return None if raw is None else json.loads(raw)
+
+    async def set(self, key, value, ttl):
+        await self._client.set(key, json.dumps(value), ex=ttl)
+
+    async def add(self, key, value, ttl):
+        return bool(await self._client.set(key, json.dumps(value),
+                                           ex=ttl, nx=True))
+
+    async def incr(self, key):
+        return await self._client.incr(key)
+
+    async def close(self):
+        await self._client.aclose()
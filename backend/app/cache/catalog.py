@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import time
+from itertools import chain
+from typing import Any, Awaitable, Callable
+
+from cache.backends import (CacheBackend, MemoryCacheBackend,
+                            RedisCacheBackend)
+from config import CACHE_BACKEND, CACHE_MAX_SIZE, CACHE_TTL, REDIS_URL
+from models.category import Category
+from models.product import Product
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Ключ текущей версии каталога
+VERSION_KEY = "catalog:version"
+
+# Признак изменения каталога в сессии базы данных
+CHANGED_FLAG = "catalog_changed"
+
+# Задача сброса кэша, запущенная после коммита сессии
+INVALIDATION_TASK = "catalog_invalidation"
+
+# Модели, изменение которых меняет версию каталога
+CATALOG_MODELS = (Category, Product)
+
+# Запущенные сбросы кэша, которые никто не ожидает (админ-панель)
+_pending_invalidations = set()
+
+
+class CatalogCache:
+    """
+    Кэш чтения каталога товаров и категорий.
+
+    Ключи записей содержат версию каталога, поэтому для сброса кэша
+    достаточно увеличить версию: старые записи больше не читаются
+    и удаляются по истечении TTL или вытесняются. Версия увеличивается
+    после коммита любой сессии, изменившей товары или категории,
+    включая сессии админ-панели. Сама версия также живёт не дольше TTL,
+    что ограничивает устаревание данных, изменённых в обход ORM.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+
+    async def get_version(self) -> int:
+        """Текущая версия каталога."""
+        version = await self.backend.get(VERSION_KEY)
+        if version is None:
+            # Начальная версия зависит от времени запуска, чтобы версии
+            # не повторялись после перезапуска с кэшем в памяти.
+            await self.backend.add(VERSION_KEY, time.time_ns() // 1000,
+                                   self.ttl)
+            version = await self.backend.get(VERSION_KEY)
+        return version
+
+    async def get_or_load(self, entity: str,
+                          loader: Callable[[], Awaitable[Any]],
+                          *params) -> Any:
+        """
+        Возвращает данные из кэша или загружает их через loader.
+
+        Параметры:
+        - entity (str): Название кэшируемой сущности.
+        - loader: Функция загрузки данных из базы; результат должен
+        сериализоваться в JSON. Значение None не кэшируется.
+        - params: Параметры запроса, входящие в ключ.
+
+        Возвращает:
+        - Данные из кэша или результат loader.
+        """
+        version = await self.get_version()
+        key = ":".join(["catalog", str(version), entity,
+                        *(str(param) for param in params)])
+        cached = await self.backend.get(key)
+        if cached is not None:
+            return cached
+        value = await loader()
+        if value is not None:
+            await self.backend.set(key, value, self.ttl)
+        return value
+
+    async def invalidate(self):
+        """Сбрасывает кэш каталога, увеличивая его версию."""
+        await self.get_version()
+        await self.backend.incr(VERSION_KEY)
+
+
+def mark_catalog_changed(session: AsyncSession):
+    """
+    Отмечает, что в транзакции сессии изменён каталог.
+
+    Кэш сбрасывается после успешного коммита, чтобы параллельный запрос
+    не успел закэшировать данные, которые ещё не зафиксированы.
+    """
+    session.info[CHANGED_FLAG] = True
+
+
+async def invalidate_if_changed(session: AsyncSession):
+    """Дожидается сброса кэша каталога после коммита сессии."""
+    task = session.info.pop(INVALIDATION_TASK, None)
+    if task is not None:
+        await task
+
+
+@event.listens_for(Session, "after_flush")
+def _track_catalog_changes(session: Session, flush_context):
+    """Отмечает изменение каталога, если flush затронул его модели."""
+    if any(isinstance(instance, CATALOG_MODELS)
+           for instance in chain(session.new, session.dirty,
+                                 session.deleted)):
+        session.info[CHANGED_FLAG] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session):
+    """
+    Запускает сброс кэша каталога после коммита, изменившего каталог.
+
+    Событие синхронное, поэтому сброс выполняется отдельной задачей;
+    get_db дожидается её до ответа клиенту.
+    """
+    if not session.info.pop(CHANGED_FLAG, False):
+        return
+    task = asyncio.get_running_loop().create_task(catalog_cache.invalidate())
+    session.info[INVALIDATION_TASK] = task
+    _pending_invalidations.add(task)
+    task.add_done_callback(_finish_invalidation)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_catalog_changes(session: Session):
+    """Откат отменяет изменения каталога в сессии."""
+    session.info.pop(CHANGED_FLAG, None)
+
+
+def _finish_invalidation(task: asyncio.Task):
+    _pending_invalidations.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Не удалось сбросить кэш каталога",
+                     exc_info=task.exception())
+
+
+def create_backend() -> CacheBackend:
+    """Создаёт хранилище кэша согласно настройкам."""
+    if CACHE_BACKEND == "redis":
+        return RedisCacheBackend(REDIS_URL)
+    if CACHE_BACKEND == "memory":
+        return MemoryCacheBackend(CACHE_MAX_SIZE)
+    raise ValueError(f"Неизвестное хранилище кэша: {CACHE_BACKEND}")
+
+
+# Глобальный кэш каталога
+catalog_cache = CatalogCache(create_backend(), CACHE_TTL)
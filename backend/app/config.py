@@ -5,3 +5,38 @@ from dotenv import load_dotenv
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///example.db")
+
+# Настройки пула соединений с базой данных
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in (
+    "1", "true", "yes")
+
+# Настройки драйвера asyncpg
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+DB_COMMAND_TIMEOUT = float(os.getenv("DB_COMMAND_TIMEOUT", "60"))
+
+# Режим отладки: добавляет в ответы заголовки со статистикой SQL-запросов
+DEBUG = os.getenv("DEBUG", "false").lower() in ("1", "true", "yes")
+
+# Сколько одинаковых SQL-запросов за один HTTP-запрос считать проблемой N+1
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "5"))
+
+# Кэш каталога: "memory" — в памяти процесса, "redis" — общий в Redis
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+CACHE_TTL = int(os.getenv("CACHE_TTL", "300"))
+CACHE_MAX_SIZE = int(os.getenv("CACHE_MAX_SIZE", "1024"))
+
+# ETag и ответы 304 для каталога. Версия каталога хранится в кэше, поэтому
+# с CACHE_BACKEND=memory ETag корректен только при одном процессе
+# приложения: при нескольких воркерах без Redis отключите настройку
+CATALOG_ETAGS = os.getenv("CATALOG_ETAGS", "true").lower() in (
+    "1", "true", "yes")
+
+# Номер шарда генератора номеров заказов (0–1023), уникальный для каждого
+# процесса приложения на всех хостах; обязателен, приложение без него
+# не запускается
+ORDER_SHARD_ID = os.getenv("ORDER_SHARD_ID")
@@ -1,6 +1,19 @@
-from config import DATABASE_URL
+import time
+
+from config import (DATABASE_URL, DB_COMMAND_TIMEOUT, DB_MAX_OVERFLOW,
+                    DB_POOL_PRE_PING, DB_POOL_RECYCLE, DB_POOL_SIZE,
+                    DB_POOL_TIMEOUT, DB_STATEMENT_CACHE_SIZE)
+from sqlalchemy import event, make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Асинхронные драйверы для синхронных схем подключения
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
 
 
 # Базовый класс для моделей
@@ -8,10 +21,95 @@ class Base(DeclarativeBase):
     pass
 
 
+class MonitoredQueuePool(AsyncAdaptedQueuePool):
+    """
+    Пул соединений, учитывающий ожидание свободного соединения.
+    Ожиданием считается выдача, при которой все постоянные соединения
+    пула уже заняты: запрос уходит в переполнение или в очередь.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_count = 0
+        self.wait_count = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def _do_get(self):
+        self.checkout_count += 1
+        if self.checkedout() < self.size():
+            return super()._do_get()
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            self.wait_count += 1
+            self.wait_time_total += waited
+            self.wait_time_max = max(self.wait_time_max, waited)
+
+    def stats(self) -> dict:
+        """Текущее состояние пула соединений."""
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "checkout_count": self.checkout_count,
+            "wait_count": self.wait_count,
+            "wait_time_total": self.wait_time_total,
+            "wait_time_max": self.wait_time_max,
+        }
+
+
+def build_engine_url(database_url: str):
+    """Подставляет в адрес базы данных асинхронный драйвер."""
+    url = make_url(database_url)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.drivername,
+                                                url.drivername))
+
+
+def build_engine_options(url) -> dict:
+    """Параметры пула и драйвера для выбранной СУБД."""
+    if url.get_backend_name() == "sqlite":
+        return {}
+    options = {
+        "poolclass": MonitoredQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+            "command_timeout": DB_COMMAND_TIMEOUT,
+        }
+    return options
+
+
+def get_pool_stats() -> dict:
+    """Статистика пула соединений движка."""
+    if isinstance(engine.pool, MonitoredQueuePool):
+        return engine.pool.stats()
+    return {"status": engine.pool.status()}
+
+
 # Создание движка для базы данных
-engine = create_async_engine(
-    DATABASE_URL.replace('postgresql', 'postgresql+asyncpg'), echo=False)
+engine_url = build_engine_url(DATABASE_URL)
+engine = create_async_engine(engine_url, echo=False,
+                             **build_engine_options(engine_url))
 
 # Глобальная фабрика сессий
 SessionLocal = sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """Включает проверку внешних ключей и ON DELETE для SQLite."""
+    if engine.dialect.name == "sqlite":
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
@@ -1,12 +1,54 @@
-from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
+from cache.catalog import catalog_cache, invalidate_if_changed
+from config import CATALOG_ETAGS
 from database import SessionLocal
+from fastapi import HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
-@asynccontextmanager
-async def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        await db.close()
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """
+    Сессия базы данных на время одного HTTP-запроса.
+
+    Репозитории только отправляют изменения в базу через flush(),
+    а единственный коммит выполняется после успешной обработки запроса.
+    После коммита сбрасывается кэш каталога, если запрос его изменил.
+    При ошибке транзакция откатывается.
+    """
+    async with SessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+            await invalidate_if_changed(session)
+        except Exception:
+            await session.rollback()
+            raise
+
+
+async def catalog_etag(request: Request, response: Response):
+    """
+    Условные GET-запросы к каталогу.
+
+    ETag строится по версии каталога, которая меняется при каждом
+    изменении товаров или категорий. Если клиент прислал совпадающий
+    If-None-Match, запрос завершается ответом 304 до обращения к базе
+    данных и сериализации.
+
+    Отключается настройкой CATALOG_ETAGS: это нужно при нескольких
+    процессах с кэшем в памяти, где каждый процесс видит лишь
+    собственные изменения каталога.
+    """
+    if not CATALOG_ETAGS:
+        return
+    etag = f'"catalog-{await catalog_cache.get_version()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {
+            tag.strip().removeprefix("W/")
+            for tag in if_none_match.split(",")
+        }
+        if etag in candidates or "*" in candidates:
+            raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
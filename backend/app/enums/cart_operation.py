@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class CartOperationType(str, Enum):
+    SET = "set"
+    ADD = "add"
+    REMOVE = "remove"
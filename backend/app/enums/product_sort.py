@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ProductSort(str, Enum):
+    ID = "id"
+    PRICE = "price"
+    NAME = "name"
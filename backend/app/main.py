@@ -1,18 +1,39 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from sqladmin import Admin
 
+from cache.catalog import catalog_cache
 from database import engine
 from admin import (UserAdmin, ProductAdmin, OrderAdmin,
                    CartItemAdmin, CategoryAdmin)
-from routers import cart, category, order, product, user
+from metrics import SQLMetricsMiddleware, instrument_engine
+from routers import cart, category, metrics, order, product, user
+from utils.generate_id import init_order_number_generator
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Проверяет настройки при запуске и освобождает ресурсы приложения
+    при остановке.
+    """
+    init_order_number_generator()
+    yield
+    await catalog_cache.backend.close()
+
 
 # Создание экземпляра FastAPI
 app = FastAPI(
     title="Интернет-магазин E-Commerce",
     description="REST API для интернет-магазина E-Commerce",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# Сбор статистики SQL-запросов по каждому HTTP-запросу
+instrument_engine(engine)
+app.add_middleware(SQLMetricsMiddleware)
 
 # Подключение всех маршрутизаторов
 app.include_router(product.router)
@@ -20,6 +41,7 @@ app.include_router(category.router)
 app.include_router(cart.router)
 app.include_router(order.router)
 app.include_router(user.router)
+app.include_router(metrics.router)
 
 # Маршруты Админ панели
 admin = Admin(app, engine)
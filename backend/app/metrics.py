@@ -0,0 +1,176 @@
+import logging
+import re
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+
+from config import DEBUG, N_PLUS_ONE_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestStats:
+    """Статистика SQL-запросов в рамках одного HTTP-запроса."""
+
+    statement_count: int = 0
+    db_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: str = ""
+    statements: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float):
+        """Учитывает выполненный SQL-запрос."""
+        self.statement_count += 1
+        self.db_time += duration
+        self.statements[statement] += 1
+        if duration > self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_statement = statement
+
+    @property
+    def repeated_statements(self) -> int:
+        """Наибольшее число повторов одного и того же запроса."""
+        return max(self.statements.values(), default=0)
+
+    @property
+    def is_n_plus_one(self) -> bool:
+        """Признак проблемы N+1: один запрос повторяется слишком часто."""
+        return self.repeated_statements >= N_PLUS_ONE_THRESHOLD
+
+
+@dataclass
+class RouteMetrics:
+    """Накопленные метрики одного маршрута."""
+
+    requests: int = 0
+    request_time: float = 0.0
+    statements: int = 0
+    db_time: float = 0.0
+    slowest_statement_time: float = 0.0
+    n_plus_one: int = 0
+
+
+_current_stats: ContextVar = ContextVar("sql_request_stats", default=None)
+_route_metrics = defaultdict(RouteMetrics)
+
+
+def instrument_engine(engine):
+    """Подключает подсчёт SQL-запросов к событиям движка."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters,
+                              context, executemany):
+        conn.info.setdefault("query_start_time", []).append(
+            time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters,
+                             context, executemany):
+        duration = time.perf_counter() - conn.info[
+            "query_start_time"].pop()
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, duration)
+
+
+def _header_safe(statement: str, limit: int = 200) -> str:
+    """Приводит текст SQL-запроса к виду, допустимому в заголовке."""
+    statement = re.sub(r"\s+", " ", statement).strip()
+    return statement.encode("latin-1", "replace").decode("latin-1")[:limit]
+
+
+class SQLMetricsMiddleware:
+    """
+    ASGI-middleware, собирающее по каждому запросу количество
+    SQL-запросов, суммарное время работы с базой, самый медленный запрос
+    и признаки проблемы N+1. В режиме отладки статистика добавляется
+    в заголовки ответа.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = RequestStats()
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start" and DEBUG:
+                headers = list(message.get("headers", []))
+                headers += [
+                    (b"x-db-statements", str(stats.statement_count).encode()),
+                    (b"x-db-time-ms", f"{stats.db_time * 1000:.2f}".encode()),
+                    (b"x-db-slowest-ms",
+                     f"{stats.slowest_time * 1000:.2f}".encode()),
+                    (b"x-db-slowest-statement",
+                     _header_safe(stats.slowest_statement).encode("latin-1")),
+                ]
+                if stats.is_n_plus_one:
+                    headers.append(
+                        (b"x-db-n-plus-one",
+                         str(stats.repeated_statements).encode()))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current_stats.reset(token)
+            # Шаблон маршрута вместо пути, чтобы не плодить метки
+            route = getattr(scope.get("route"), "path", "unmatched")
+            self._observe(scope["method"], route, stats,
+                          time.perf_counter() - started)
+
+    @staticmethod
+    def _observe(method: str, route: str, stats: RequestStats,
+                 request_time: float):
+        """Сохраняет статистику запроса в накопленные метрики маршрута."""
+        metrics = _route_metrics[(method, route)]
+        metrics.requests += 1
+        metrics.request_time += request_time
+        metrics.statements += stats.statement_count
+        metrics.db_time += stats.db_time
+        metrics.slowest_statement_time = max(
+            metrics.slowest_statement_time, stats.slowest_time)
+        if stats.is_n_plus_one:
+            metrics.n_plus_one += 1
+            logger.warning(
+                "Возможная проблема N+1 в %s %s: запрос повторён %d раз: %s",
+                method, route, stats.repeated_statements,
+                stats.statements.most_common(1)[0][0])
+
+
+_METRIC_DEFINITIONS = (
+    ("http_requests_total", "counter",
+     "Количество обработанных HTTP-запросов.", "requests"),
+    ("http_request_duration_seconds_total", "counter",
+     "Суммарное время обработки HTTP-запросов.", "request_time"),
+    ("db_statements_total", "counter",
+     "Количество выполненных SQL-запросов.", "statements"),
+    ("db_duration_seconds_total", "counter",
+     "Суммарное время выполнения SQL-запросов.", "db_time"),
+    ("db_slowest_statement_seconds", "gauge",
+     "Время самого медленного SQL-запроса.", "slowest_statement_time"),
+    ("db_n_plus_one_requests_total", "counter",
+     "Количество запросов с признаками проблемы N+1.", "n_plus_one"),
+)
+
+
+def render_prometheus() -> str:
+    """Формирует метрики маршрутов в текстовом формате Prometheus."""
+    lines = []
+    for name, metric_type, description, attribute in _METRIC_DEFINITIONS:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for (method, route), metrics in sorted(_route_metrics.items()):
+            labels = f'method="{method}",route="{route}"'
+            lines.append(f"{name}{{{labels}}} {getattr(metrics, attribute)}")
+    return "\n".join(lines) + "\n"
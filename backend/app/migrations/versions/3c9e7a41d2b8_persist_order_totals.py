@@ -0,0 +1,44 @@
+"""Persist order totals and product price snapshot
+
+Revision ID: 3c9e7a41d2b8
+Revises: 45ac982f3480
+Create Date: 2026-10-18 10:12:31.402815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e7a41d2b8'
+down_revision: Union[str, Sequence[str], None] = '45ac982f3480'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orders', sa.Column('total_amount', sa.Integer(),
+                                      server_default='0', nullable=False))
+    op.add_column('order_product', sa.Column('price', sa.Integer(),
+                                             nullable=True))
+    # Фиксируем текущие цены для уже оформленных заказов
+    op.execute(
+        "UPDATE order_product SET price = products.price "
+        "FROM products WHERE products.id = order_product.product_id"
+    )
+    op.execute(
+        "UPDATE orders SET total_amount = COALESCE("
+        "(SELECT SUM(order_product.price) FROM order_product "
+        "WHERE order_product.order_id = orders.id), 0)"
+    )
+    op.alter_column('order_product', 'price',
+                    existing_type=sa.Integer(), nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('order_product', 'price')
+    op.drop_column('orders', 'total_amount')
@@ -0,0 +1,42 @@
+"""Add ON DELETE CASCADE to foreign keys
+
+Revision ID: 5a1f0c9d3e62
+Revises: 8f2d5b6c1e47
+Create Date: 2026-10-18 11:47:09.563201
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a1f0c9d3e62'
+down_revision: Union[str, Sequence[str], None] = '8f2d5b6c1e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (таблица, колонка, связанная таблица, связанная колонка)
+FOREIGN_KEYS = (
+    ('products', 'category_id', 'categories', 'id'),
+    ('order_product', 'order_id', 'orders', 'id'),
+    ('cart_items', 'chat_id', 'users', 'chat_id'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, referent, remote_column in FOREIGN_KEYS:
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referent, [column],
+                              [remote_column], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, referent, remote_column in FOREIGN_KEYS:
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referent, [column],
+                              [remote_column])
@@ -0,0 +1,59 @@
+"""Add quantity to order lines
+
+Revision ID: 8f2d5b6c1e47
+Revises: 3c9e7a41d2b8
+Create Date: 2026-10-18 11:04:52.118390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2d5b6c1e47'
+down_revision: Union[str, Sequence[str], None] = '3c9e7a41d2b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('order_product', sa.Column('quantity', sa.Integer(),
+                                             server_default='1',
+                                             nullable=False))
+    # Повторяющиеся товары в одном заказе сворачиваем в одну строку:
+    # каждая прежняя строка означала одну единицу товара. Используется
+    # только переносимый SQL (GROUP BY), без ctid и UPDATE ... FROM
+    op.execute(
+        "CREATE TABLE order_product_dedup AS "
+        "SELECT order_id, product_id, COUNT(*) AS quantity, "
+        "MAX(price) AS price FROM order_product "
+        "WHERE order_id IS NOT NULL AND product_id IS NOT NULL "
+        "GROUP BY order_id, product_id"
+    )
+    op.execute("DELETE FROM order_product")
+    op.execute(
+        "INSERT INTO order_product (order_id, product_id, quantity, price) "
+        "SELECT order_id, product_id, quantity, price "
+        "FROM order_product_dedup"
+    )
+    op.execute("DROP TABLE order_product_dedup")
+    with op.batch_alter_table('order_product') as batch_op:
+        batch_op.alter_column('order_id', existing_type=sa.Integer(),
+                              nullable=False)
+        batch_op.alter_column('product_id', existing_type=sa.Integer(),
+                              nullable=False)
+        batch_op.create_primary_key('order_product_pkey',
+                                    ['order_id', 'product_id'])
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('order_product') as batch_op:
+        batch_op.drop_constraint('order_product_pkey', type_='primary')
+        batch_op.alter_column('product_id', existing_type=sa.Integer(),
+                              nullable=True)
+        batch_op.alter_column('order_id', existing_type=sa.Integer(),
+                              nullable=True)
+        batch_op.drop_column('quantity')
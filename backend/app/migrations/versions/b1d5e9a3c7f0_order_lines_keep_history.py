@@ -0,0 +1,68 @@
+"""Keep order lines when products are deleted
+
+Revision ID: b1d5e9a3c7f0
+Revises: f3a7d1c05b92
+Create Date: 2026-10-19 10:12:36.481925
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b1d5e9a3c7f0'
+down_revision: Union[str, Sequence[str], None] = 'f3a7d1c05b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('order_product', sa.Column('product_name', sa.String(),
+                                             nullable=True))
+    # Снимок названия для уже оформленных заказов
+    op.execute(
+        "UPDATE order_product SET product_name = COALESCE(("
+        "SELECT products.name FROM products "
+        "WHERE products.id = order_product.product_id), '')"
+    )
+    with op.batch_alter_table('order_product') as batch_op:
+        batch_op.drop_constraint('order_product_pkey', type_='primary')
+        batch_op.drop_constraint('order_product_product_id_fkey',
+                                 type_='foreignkey')
+        batch_op.add_column(sa.Column('id', sa.Integer(), sa.Identity(),
+                                      nullable=False))
+        batch_op.create_primary_key('order_product_pkey', ['id'])
+        batch_op.create_unique_constraint(
+            'uq_order_product_order_id_product_id',
+            ['order_id', 'product_id'])
+        batch_op.alter_column('product_id', existing_type=sa.Integer(),
+                              nullable=True)
+        batch_op.alter_column('product_name', existing_type=sa.String(),
+                              nullable=False)
+        batch_op.create_foreign_key('order_product_product_id_fkey',
+                                    'products', ['product_id'], ['id'],
+                                    ondelete='SET NULL')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Строки удалённых товаров нельзя вернуть в составной ключ
+    op.execute("DELETE FROM order_product WHERE product_id IS NULL")
+    with op.batch_alter_table('order_product') as batch_op:
+        batch_op.drop_constraint('order_product_product_id_fkey',
+                                 type_='foreignkey')
+        batch_op.drop_constraint('uq_order_product_order_id_product_id',
+                                 type_='unique')
+        batch_op.drop_constraint('order_product_pkey', type_='primary')
+        batch_op.drop_column('id')
+        batch_op.alter_column('product_id', existing_type=sa.Integer(),
+                              nullable=False)
+        batch_op.create_primary_key('order_product_pkey',
+                                    ['order_id', 'product_id'])
+        batch_op.create_foreign_key('order_product_product_id_fkey',
+                                    'products', ['product_id'], ['id'],
+                                    ondelete='CASCADE')
+        batch_op.drop_column('product_name')
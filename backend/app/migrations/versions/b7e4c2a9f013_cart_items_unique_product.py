@@ -0,0 +1,43 @@
+"""Add unique constraint on cart_items chat_id and product_id
+
+Revision ID: b7e4c2a9f013
+Revises: 5a1f0c9d3e62
+Create Date: 2026-10-18 12:26:44.871530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4c2a9f013'
+down_revision: Union[str, Sequence[str], None] = '5a1f0c9d3e62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Объединяем дубликаты товаров в корзине перед созданием ограничения
+    op.execute(
+        "UPDATE cart_items SET quantity = dup.quantity, "
+        "total_price = dup.total_price "
+        "FROM (SELECT MIN(id) AS keep_id, SUM(quantity) AS quantity, "
+        "SUM(total_price) AS total_price FROM cart_items "
+        "GROUP BY chat_id, product_id HAVING COUNT(*) > 1) AS dup "
+        "WHERE cart_items.id = dup.keep_id"
+    )
+    op.execute(
+        "DELETE FROM cart_items a USING cart_items b "
+        "WHERE a.chat_id = b.chat_id AND a.product_id = b.product_id "
+        "AND a.id > b.id"
+    )
+    op.create_unique_constraint('uq_cart_items_chat_id_product_id',
+                                'cart_items', ['chat_id', 'product_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_cart_items_chat_id_product_id', 'cart_items',
+                       type_='unique')
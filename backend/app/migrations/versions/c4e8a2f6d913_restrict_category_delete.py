@@ -0,0 +1,37 @@
+"""Forbid deleting categories that still have products
+
+Revision ID: c4e8a2f6d913
+Revises: b1d5e9a3c7f0
+Create Date: 2026-10-19 10:58:14.270519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a2f6d913'
+down_revision: Union[str, Sequence[str], None] = 'b1d5e9a3c7f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('products') as batch_op:
+        batch_op.drop_constraint('products_category_id_fkey',
+                                 type_='foreignkey')
+        batch_op.create_foreign_key('products_category_id_fkey',
+                                    'categories', ['category_id'], ['id'],
+                                    ondelete='RESTRICT')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('products') as batch_op:
+        batch_op.drop_constraint('products_category_id_fkey',
+                                 type_='foreignkey')
+        batch_op.create_foreign_key('products_category_id_fkey',
+                                    'categories', ['category_id'], ['id'],
+                                    ondelete='CASCADE')
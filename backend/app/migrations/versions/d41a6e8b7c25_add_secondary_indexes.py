@@ -0,0 +1,44 @@
+"""Add secondary indexes for hot queries
+
+Revision ID: d41a6e8b7c25
+Revises: b7e4c2a9f013
+Create Date: 2026-10-18 13:02:17.290664
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41a6e8b7c25'
+down_revision: Union[str, Sequence[str], None] = 'b7e4c2a9f013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_cart_items_product_id'), 'cart_items',
+                    ['product_id'], unique=False)
+    op.create_index(op.f('ix_orders_user_id'), 'orders',
+                    ['user_id'], unique=False)
+    op.create_index(op.f('ix_order_product_product_id'), 'order_product',
+                    ['product_id'], unique=False)
+    op.create_index('ix_products_category_id_id', 'products',
+                    ['category_id', 'id'], unique=False)
+    op.create_index('ix_products_price_id', 'products',
+                    ['price', 'id'], unique=False)
+    op.create_index('ix_products_name_id', 'products',
+                    ['name', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_products_name_id', table_name='products')
+    op.drop_index('ix_products_price_id', table_name='products')
+    op.drop_index('ix_products_category_id_id', table_name='products')
+    op.drop_index(op.f('ix_order_product_product_id'),
+                  table_name='order_product')
+    op.drop_index(op.f('ix_orders_user_id'), table_name='orders')
+    op.drop_index(op.f('ix_cart_items_product_id'), table_name='cart_items')
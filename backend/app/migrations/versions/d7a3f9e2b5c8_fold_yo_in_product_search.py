@@ -0,0 +1,75 @@
+"""Fold ё into е in the SQLite product search index
+
+Revision ID: d7a3f9e2b5c8
+Revises: c4e8a2f6d913
+Create Date: 2026-10-19 14:06:31.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3f9e2b5c8'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a2f6d913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def fold_yo(expression: str) -> str:
+    """Должно совпадать с models.product.fold_yo."""
+    return f"replace(replace({expression}, 'ё', 'е'), 'Ё', 'Е')"
+
+
+def triggers(fold) -> tuple:
+    """Триггеры, поддерживающие products_fts, с преобразованием текста."""
+    return (
+        "CREATE TRIGGER products_fts_ai AFTER INSERT ON products BEGIN "
+        "INSERT INTO products_fts(rowid, name, description) "
+        f"VALUES (new.id, {fold('new.name')}, "
+        f"{fold('new.description')}); END",
+        "CREATE TRIGGER products_fts_ad AFTER DELETE ON products BEGIN "
+        "INSERT INTO products_fts(products_fts, rowid, name, description) "
+        f"VALUES ('delete', old.id, {fold('old.name')}, "
+        f"{fold('old.description')}); END",
+        "CREATE TRIGGER products_fts_au "
+        "AFTER UPDATE OF name, description ON products BEGIN "
+        "INSERT INTO products_fts(products_fts, rowid, name, description) "
+        f"VALUES ('delete', old.id, {fold('old.name')}, "
+        f"{fold('old.description')}); "
+        "INSERT INTO products_fts(rowid, name, description) "
+        f"VALUES (new.id, {fold('new.name')}, "
+        f"{fold('new.description')}); END",
+    )
+
+
+# Пересоздание таблицы products в пакетных миграциях удаляет её
+# триггеры, поэтому они создаются заново, а индекс заполняется повторно
+DROP_TRIGGERS = (
+    "DROP TRIGGER IF EXISTS products_fts_au",
+    "DROP TRIGGER IF EXISTS products_fts_ad",
+    "DROP TRIGGER IF EXISTS products_fts_ai",
+    "INSERT INTO products_fts(products_fts) VALUES ('delete-all')",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for statement in DROP_TRIGGERS + triggers(fold_yo):
+        op.execute(statement)
+    op.execute(
+        "INSERT INTO products_fts(rowid, name, description) "
+        f"SELECT id, {fold_yo('name')}, {fold_yo('description')} "
+        "FROM products")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for statement in DROP_TRIGGERS + triggers(lambda column: column):
+        op.execute(statement)
+    op.execute("INSERT INTO products_fts(products_fts) VALUES ('rebuild')")
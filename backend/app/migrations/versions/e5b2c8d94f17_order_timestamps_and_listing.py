@@ -0,0 +1,56 @@
+"""Add order timestamps and indexes for the order listing
+
+Revision ID: e5b2c8d94f17
+Revises: d41a6e8b7c25
+Create Date: 2026-10-18 15:41:08.517203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b2c8d94f17'
+down_revision: Union[str, Sequence[str], None] = 'd41a6e8b7c25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Условие частичного индекса необработанных заказов
+ACTIVE_STATUSES = sa.text("status IN ('NEW', 'IN_PROGRESS')")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Существующим заказам проставляется время миграции
+    op.add_column('orders', sa.Column(
+        'created_at', sa.DateTime(timezone=True),
+        server_default=sa.text('now()'), nullable=False))
+    op.add_column('orders', sa.Column(
+        'updated_at', sa.DateTime(timezone=True),
+        server_default=sa.text('now()'), nullable=False))
+    op.create_index('ix_orders_created_at_id', 'orders',
+                    ['created_at', 'id'], unique=False)
+    op.create_index('ix_orders_status_created_at_id', 'orders',
+                    ['status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_orders_user_id_created_at_id', 'orders',
+                    ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_orders_active_created_at_id', 'orders',
+                    ['created_at', 'id'], unique=False,
+                    postgresql_where=ACTIVE_STATUSES)
+    # Составной индекс начинается с user_id и заменяет одиночный
+    op.drop_index(op.f('ix_orders_user_id'), table_name='orders')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_orders_user_id'), 'orders',
+                    ['user_id'], unique=False)
+    op.drop_index('ix_orders_active_created_at_id', table_name='orders',
+                  postgresql_where=ACTIVE_STATUSES)
+    op.drop_index('ix_orders_user_id_created_at_id', table_name='orders')
+    op.drop_index('ix_orders_status_created_at_id', table_name='orders')
+    op.drop_index('ix_orders_created_at_id', table_name='orders')
+    op.drop_column('orders', 'updated_at')
+    op.drop_column('orders', 'created_at')
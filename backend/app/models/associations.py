@@ -1,11 +1,23 @@
 from database import Base
-from sqlalchemy import Column, ForeignKey, Integer, Table
+from sqlalchemy import (Column, ForeignKey, Integer, String, Table,
+                        UniqueConstraint)
 
-# Ассоциация заказов и товаров
+# Строки заказов: товар, количество и цена на момент покупки
 order_product = Table(
     "order_product",
     Base.metadata,
-    Column("order_id", Integer, ForeignKey("orders.id")),
+    Column("id", Integer, primary_key=True),
+    Column("order_id", Integer, ForeignKey(
+        "orders.id", ondelete="CASCADE"), nullable=False),
+    # При удалении товара строка заказа сохраняется без ссылки на него
     Column("product_id", Integer, ForeignKey(
-        "products.id", ondelete="CASCADE"))
+        "products.id", ondelete="SET NULL"), nullable=True, index=True),
+    # Название товара на момент оформления заказа
+    Column("product_name", String, nullable=False),
+    Column("quantity", Integer, nullable=False, default=1,
+           server_default="1"),
+    # Цена товара на момент оформления заказа
+    Column("price", Integer, nullable=False),
+    UniqueConstraint("order_id", "product_id",
+                     name="uq_order_product_order_id_product_id")
 )
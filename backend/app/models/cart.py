@@ -1,22 +1,27 @@
 from database import Base
-from sqlalchemy import BigInteger, Float, ForeignKey, Integer
+from sqlalchemy import BigInteger, Float, ForeignKey, Integer, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
 class CartItem(Base):
     __tablename__ = "cart_items"
+    __table_args__ = (
+        UniqueConstraint("chat_id", "product_id",
+                         name="uq_cart_items_chat_id_product_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    chat_id: Mapped[int] = mapped_column(BigInteger,
-                                         ForeignKey("users.chat_id"))
+    chat_id: Mapped[int] = mapped_column(BigInteger, ForeignKey(
+        "users.chat_id", ondelete="CASCADE"))
     product_id: Mapped[int] = mapped_column(Integer, ForeignKey(
-        "products.id", ondelete="CASCADE"))
+        "products.id", ondelete="CASCADE"), index=True)
     quantity: Mapped[int] = mapped_column(Integer, default=1)
     total_price: Mapped[float] = mapped_column(Float, nullable=True)
 
     # Связи с другими моделями
-    user = relationship("User", back_populates="user_cart_items")
-    product = relationship("Product")
+    user = relationship("User", back_populates="user_cart_items",
+                        lazy="raise")
+    product = relationship("Product", lazy="raise")
 
     def __str__(self):
         return str(self.chat_id)
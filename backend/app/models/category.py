@@ -15,7 +15,7 @@ class Category(Base):
 
     # Связь с товарами
     products: Mapped[List[Product]] = relationship(
-        back_populates="category", lazy="selectin")
+        back_populates="category", lazy="raise")
 
     def __str__(self):
         return self.name
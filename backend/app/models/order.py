@@ -1,30 +1,32 @@
-from sqlalchemy import (BigInteger, Enum, ForeignKey,
-                        Integer, String, select, func)
-from sqlalchemy.orm import Mapped, mapped_column, relationship, column_property
+from datetime import datetime
+
+from sqlalchemy import (BigInteger, DateTime, Enum, ForeignKey, Index,
+                        Integer, String, func, text)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database import Base
 from enums.status import Status
-from .associations import order_product
-from models.product import Product
+from models.order_item import OrderItem
 from utils.generate_id import generate_unique_order_number
 
 
-def calculate_total_amount_expression():
-    """Возвращает SQL-выражение для вычисления общей суммы заказа."""
-    return select(
-        func.coalesce(
-            select(func.sum(Product.price))
-            .select_from(order_product.join(Product))
-            .where(order_product.c.order_id == Order.id)
-            .correlate_except(Product)
-            .scalar_subquery(),
-            0
-        )
-    ).scalar_subquery()
-
-
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Keyset-пагинация списка заказов от новых к старым
+        Index("ix_orders_created_at_id", "created_at", "id"),
+        Index("ix_orders_status_created_at_id",
+              "status", "created_at", "id"),
+        Index("ix_orders_user_id_created_at_id",
+              "user_id", "created_at", "id"),
+        # Частичный индекс очереди необработанных заказов
+        Index("ix_orders_active_created_at_id", "created_at", "id",
+              postgresql_where=text("status IN ('NEW', 'IN_PROGRESS')"),
+              sqlite_where=text("status IN ('NEW', 'IN_PROGRESS')")),
+    )
+    # Получать значения created_at и updated_at из базы сразу при вставке
+    # и обновлении, без отдельного запроса при сериализации
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id"))
@@ -34,17 +36,17 @@ class Order(Base):
     status: Mapped[Status] = mapped_column(
         Enum(Status, name="enum_status", native_enum=True),
         nullable=False, default=Status.NEW)
-    total_amount = column_property(select(func.coalesce(
-        select(func.sum(Product.price))
-        .select_from(order_product.join(Product))
-        .where(order_product.c.order_id == id)
-        .correlate_except(Product)
-        .scalar_subquery(),
-        0
-        )
-    ).scalar_subquery())
+    total_amount: Mapped[int] = mapped_column(Integer, nullable=False,
+                                              default=0, server_default="0")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(),
+        onupdate=func.now())
 
     # Связи с другими моделями
-    user = relationship("User", back_populates="orders")
+    user = relationship("User", back_populates="orders", lazy="raise")
     ordered_products = relationship("Product", secondary="order_product",
-                                    back_populates="orders", lazy='selectin')
+                                    back_populates="orders", lazy="raise",
+                                    viewonly=True)
+    items = relationship(OrderItem, lazy="raise", viewonly=True)
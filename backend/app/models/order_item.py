@@ -0,0 +1,12 @@
+from database import Base
+
+from .associations import order_product
+
+
+class OrderItem(Base):
+    """Строка заказа, отображённая на таблицу order_product."""
+
+    __table__ = order_product
+
+    def __str__(self):
+        return f"{self.order_id}:{self.product_id}"
@@ -1,7 +1,10 @@
 from typing import TYPE_CHECKING
 
 from database import Base
-from sqlalchemy import Integer, String, ForeignKey
+from sqlalchemy import (DDL, ForeignKey, Index, Integer, String, event,
+                        func, text)
+# Регистрирует типизированные функции полнотекстового поиска PostgreSQL
+from sqlalchemy.dialects import postgresql  # noqa: F401
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .associations import order_product
@@ -12,6 +15,12 @@ if TYPE_CHECKING:
 
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        # Keyset-пагинация каталога: фильтр по категории и сортировки
+        Index("ix_products_category_id_id", "category_id", "id"),
+        Index("ix_products_price_id", "price", "id"),
+        Index("ix_products_name_id", "name", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
@@ -20,11 +29,88 @@ class Product(Base):
     photo_url: Mapped[str] = mapped_column(String, nullable=True)
 
     # Связи с другими моделями
-    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"))
+    # Категорию с товарами удалить нельзя: иначе вместе с товарами
+    # пропали бы и ссылки из истории заказов
+    category_id: Mapped[int] = mapped_column(ForeignKey(
+        "categories.id", ondelete="RESTRICT"))
     category: Mapped["Category"] = relationship(
-        back_populates="products", lazy="joined")
+        back_populates="products", lazy="raise")
     orders = relationship("Order", secondary="order_product",
-                          back_populates="ordered_products", lazy="selectin")
+                          back_populates="ordered_products", lazy="raise",
+                          viewonly=True)
 
     def __str__(self):
         return self.name
+
+
+# Конфигурация полнотекстового поиска PostgreSQL: без стемминга, чтобы
+# префиксный поиск работал одинаково для русских и латинских названий
+SEARCH_CONFIG = text("'simple'")
+
+
+def product_search_vector():
+    """
+    Поисковый вектор товара для PostgreSQL: совпадения в названии
+    весят больше, чем в описании. Выражение совпадает с выражением
+    GIN-индекса ix_products_search, поэтому запросы используют индекс.
+    """
+    return func.setweight(
+        func.to_tsvector(SEARCH_CONFIG, Product.name), "A"
+    ).op("||")(func.setweight(
+        func.to_tsvector(SEARCH_CONFIG, Product.description), "B"))
+
+
+# Индексы поиска PostgreSQL: полнотекстовый и триграммный по названию
+# (для поиска с опечатками)
+Index("ix_products_search", product_search_vector(),
+      postgresql_using="gin").ddl_if(dialect="postgresql")
+Index("ix_products_name_trgm", Product.name, postgresql_using="gin",
+      postgresql_ops={"name": "gin_trgm_ops"}).ddl_if(dialect="postgresql")
+
+event.listen(Product.__table__, "before_create", DDL(
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+).execute_if(dialect="postgresql"))
+
+
+def fold_yo(expression: str) -> str:
+    """
+    SQL-выражение, заменяющее ё на е: токенизатор unicode61 не считает
+    их одной буквой.
+    """
+    return f"replace(replace({expression}, 'ё', 'е'), 'Ё', 'Е')"
+
+
+# Индекс поиска SQLite: внешняя таблица FTS5 над products, которую
+# поддерживают в актуальном состоянии триггеры. В индекс попадает текст
+# с ё, заменённой на е, поэтому команду 'rebuild', читающую исходный
+# текст из products, использовать нельзя
+PRODUCTS_FTS_DDL = (
+    "CREATE VIRTUAL TABLE products_fts USING fts5("
+    "name, description, content='products', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    # Ранжирование BM25 с большим весом названия
+    "INSERT INTO products_fts(products_fts, rank) "
+    "VALUES ('rank', 'bm25(10.0, 1.0)')",
+    "CREATE TRIGGER products_fts_ai AFTER INSERT ON products BEGIN "
+    "INSERT INTO products_fts(rowid, name, description) "
+    f"VALUES (new.id, {fold_yo('new.name')}, "
+    f"{fold_yo('new.description')}); END",
+    "CREATE TRIGGER products_fts_ad AFTER DELETE ON products BEGIN "
+    "INSERT INTO products_fts(products_fts, rowid, name, description) "
+    f"VALUES ('delete', old.id, {fold_yo('old.name')}, "
+    f"{fold_yo('old.description')}); END",
+    "CREATE TRIGGER products_fts_au "
+    "AFTER UPDATE OF name, description ON products BEGIN "
+    "INSERT INTO products_fts(products_fts, rowid, name, description) "
+    f"VALUES ('delete', old.id, {fold_yo('old.name')}, "
+    f"{fold_yo('old.description')}); "
+    "INSERT INTO products_fts(rowid, name, description) "
+    f"VALUES (new.id, {fold_yo('new.name')}, "
+    f"{fold_yo('new.description')}); END",
+)
+
+for statement in PRODUCTS_FTS_DDL:
+    event.listen(Product.__table__, "after_create",
+                 DDL(statement).execute_if(dialect="sqlite"))
+event.listen(Product.__table__, "after_drop", DDL(
+    "DROP TABLE IF EXISTS products_fts").execute_if(dialect="sqlite"))
@@ -14,8 +14,9 @@ class User(Base):
                                          nullable=False)
 
     # Связи с другими моделями
-    user_cart_items = relationship("CartItem", back_populates="user")
-    orders = relationship("Order", back_populates="user")
+    user_cart_items = relationship("CartItem", back_populates="user",
+                                   lazy="raise")
+    orders = relationship("Order", back_populates="user", lazy="raise")
 
     def __str__(self):
         return str(self.chat_id)
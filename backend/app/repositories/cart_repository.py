@@ -1,14 +1,17 @@
-from typing import List
-from sqlalchemy.orm import selectinload
+from typing import Dict, List
+from sqlalchemy import BigInteger, case, delete, literal
+from sqlalchemy.orm import joinedload
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from enums.cart_operation import CartOperationType
 from models.cart import CartItem
 from models.product import Product
-from schemas.cart import CartItemCreate, CartItemResponse, UpdateCartItemSchema
-from schemas.user import UserCreate
-from services.user_service import UserService
+from models.user import User
+from schemas.cart import (CartItemCreate, CartItemResponse, CartOperation,
+                          UpdateCartItemSchema)
+from utils.dialect_insert import dialect_insert
 
 
 class CartRepository:
@@ -17,54 +20,155 @@ class CartRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def _fetch_user_and_register_if_needed(self, chat_id: int):
+    async def _ensure_user(self, chat_id: int):
         """
-        Получение пользователя по чат ID или регистрация нового пользователя.
-        Возвращает объект пользователя.
+        Регистрация пользователя по чат ID, если он ещё не существует.
+        Выполняется одним запросом INSERT ... ON CONFLICT DO NOTHING.
         """
-        user_service = UserService()
-        user = await user_service.fetch_user_by_chat_id(chat_id, self.session)
-        if not user:
-            new_user = UserCreate(first_name='', address='',
-                                  phone_number=0, chat_id=chat_id)
-            registered_user = await user_service.register_user(
-                new_user, self.session)
-            user = registered_user['data']
-        return user
+        insert = dialect_insert(self.session)
+        stmt = insert(User).values(
+            chat_id=chat_id, first_name='', address='', phone_number=0
+        ).on_conflict_do_nothing(index_elements=[User.chat_id])
+        await self.session.execute(stmt)
+
+    async def _upsert_lines(self, chat_id: int, quantities: Dict[int, int],
+                            increment: bool) -> List[int]:
+        """
+        Создание или обновление строк корзины одним запросом
+        INSERT ... SELECT ... ON CONFLICT DO UPDATE.
+
+        Параметры:
+        - chat_id (int): Чат-идентификатор пользователя.
+        - quantities (Dict[int, int]): Количество по ID товара.
+        - increment (bool): Прибавить количество к имеющемуся в корзине
+        (True) или заменить его (False).
+
+        Возвращает:
+        - ID товаров, строки которых созданы или обновлены; товары,
+        отсутствующие в каталоге, пропускаются.
+        """
+        insert = dialect_insert(self.session)
+        line_quantity = case(quantities, value=Product.id)
+        new_lines = select(
+            literal(chat_id, BigInteger), Product.id,
+            line_quantity, Product.price * line_quantity
+        ).where(Product.id.in_(quantities))
+        stmt = insert(CartItem).from_select(
+            ["chat_id", "product_id", "quantity", "total_price"], new_lines)
+        if increment:
+            quantity = CartItem.quantity + stmt.excluded.quantity
+            product_price = select(Product.price).where(
+                Product.id == stmt.excluded.product_id).scalar_subquery()
+            total_price = quantity * product_price
+        else:
+            quantity = stmt.excluded.quantity
+            total_price = stmt.excluded.total_price
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CartItem.chat_id, CartItem.product_id],
+            set_={"quantity": quantity, "total_price": total_price}
+        ).returning(CartItem.product_id)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
 
     async def add_to_cart(self, cart_item_create: CartItemCreate):
-        """Добавление товара в корзину пользователя"""
+        """
+        Добавление товара в корзину пользователя.
+
+        Строка корзины создаётся или увеличивается атомарным запросом
+        INSERT ... SELECT ... ON CONFLICT DO UPDATE, поэтому повторные
+        нажатия кнопки не создают дубликатов.
+        """
         try:
-            user = await self._fetch_user_and_register_if_needed(
-                cart_item_create.chat_id)
-            product = await self.session.get(
-                Product, cart_item_create.product_id)
-            if not product:
+            chat_id = cart_item_create.chat_id
+            product_id = cart_item_create.product_id
+            await self._ensure_user(chat_id)
+            added = await self._upsert_lines(
+                chat_id, {product_id: cart_item_create.quantity},
+                increment=True)
+            if not added:
                 raise ValueError('Продукт не найден.')
-            stmt = select(CartItem).filter_by(
-                chat_id=user.chat_id, product_id=cart_item_create.product_id)
+            stmt = select(CartItem).options(joinedload(
+                CartItem.product).joinedload(
+                    Product.category)).filter_by(chat_id=chat_id,
+                                                 product_id=product_id)
             result = await self.session.execute(stmt)
-            existing_item = result.scalars().first()
-            if existing_item:
-                existing_item.quantity += cart_item_create.quantity
-                existing_item.total_price = (
-                    product.price * existing_item.quantity)
-            else:
-                total_price = product.price * cart_item_create.quantity
-                new_item = CartItem(
-                    chat_id=user.chat_id,
-                    product_id=product.id,
-                    quantity=cart_item_create.quantity,
-                    total_price=total_price
-                )
-                self.session.add(new_item)
-                existing_item = new_item
-            await self.session.commit()
-            await self.session.refresh(existing_item)
-            return CartItemResponse.model_validate(existing_item).model_dump()
+            cart_item = result.scalar_one()
+            return CartItemResponse.model_validate(cart_item).model_dump()
         except IntegrityError as e:
             print(f'Ошибка целостности данных: {e}')
 
+    @staticmethod
+    def _fold_operations(operations: List[CartOperation]):
+        """
+        Сворачивает последовательность операций в итоговое действие
+        для каждого товара.
+
+        Возвращает:
+        - Кортеж из ID удаляемых товаров, новых количеств (set)
+        и прибавляемых количеств (add).
+        """
+        actions = {}
+        for operation in operations:
+            product_id = operation.product_id
+            quantity = operation.quantity
+            current = actions.get(product_id)
+            if (operation.op is CartOperationType.REMOVE
+                    or operation.op is CartOperationType.SET
+                    and quantity == 0):
+                actions[product_id] = (CartOperationType.REMOVE, 0)
+            elif operation.op is CartOperationType.SET:
+                actions[product_id] = (CartOperationType.SET, quantity)
+            elif current is None:
+                actions[product_id] = (CartOperationType.ADD, quantity)
+            elif current[0] is CartOperationType.REMOVE:
+                actions[product_id] = (
+                    (CartOperationType.SET, quantity) if quantity
+                    else current)
+            else:
+                actions[product_id] = (current[0], current[1] + quantity)
+        removed = [product_id for product_id, (op, _) in actions.items()
+                   if op is CartOperationType.REMOVE]
+        set_quantities = {
+            product_id: quantity
+            for product_id, (op, quantity) in actions.items()
+            if op is CartOperationType.SET
+        }
+        added_quantities = {
+            product_id: quantity
+            for product_id, (op, quantity) in actions.items()
+            if op is CartOperationType.ADD and quantity > 0
+        }
+        return removed, set_quantities, added_quantities
+
+    async def apply_operations(self, chat_id: int,
+                               operations: List[CartOperation]):
+        """
+        Пакетное изменение корзины пользователя.
+
+        Операции сворачиваются по товарам и применяются не более чем
+        тремя запросами: DELETE для удаляемых товаров и по одному
+        INSERT ... ON CONFLICT DO UPDATE для установки и прибавления
+        количества. Фиксация транзакции остаётся за вызывающим кодом.
+        """
+        removed, set_quantities, added_quantities = self._fold_operations(
+            operations)
+        if removed:
+            stmt = delete(CartItem).where(CartItem.chat_id == chat_id,
+                                          CartItem.product_id.in_(removed))
+            await self.session.execute(stmt)
+        if set_quantities or added_quantities:
+            await self._ensure_user(chat_id)
+        for quantities, increment in ((set_quantities, False),
+                                      (added_quantities, True)):
+            if not quantities:
+                continue
+            changed = await self._upsert_lines(chat_id, quantities,
+                                               increment)
+            missing = set(quantities) - set(changed)
+            if missing:
+                raise ValueError(
+                    f'Продукты не найдены: {sorted(missing)}.')
+
     async def find_cart_item_by_product(self, chat_id: int, product_id: int):
         """Поиск элемента корзины по продукту"""
         stmt = select(CartItem).filter_by(chat_id=chat_id,
@@ -86,27 +190,38 @@ class CartRepository:
             setattr(cart_item, key, value)
         if 'quantity' in updated_data:
             cart_item.total_price = product.price * cart_item.quantity
-        await self.session.commit()
-        await self.session.refresh(cart_item)
+        await self.session.flush()
         return cart_item
 
     async def get_cart_items_by_user_id(self, chat_id: int) -> List[CartItem]:
         """Получение элементов корзины по идентификатору пользователя"""
         stmt = select(
-            CartItem).options(selectinload(
-                CartItem.product).selectinload(
+            CartItem).options(joinedload(
+                CartItem.product).joinedload(
                     Product.category)).filter_by(chat_id=chat_id)
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
-    async def clear_cart(self, chat_id: int):
-        """Очистка корзины пользователя"""
-        stmt = select(CartItem).filter_by(chat_id=chat_id)
+    async def take_cart_items(self, chat_id: int) -> Dict[int, int]:
+        """
+        Забирает содержимое корзины одним запросом DELETE ... RETURNING.
+
+        Строки удаляются и возвращаются атомарно, поэтому товар,
+        добавленный в корзину параллельным запросом, либо попадает
+        в результат, либо остаётся в корзине, но не теряется.
+        Фиксация транзакции остаётся за вызывающим кодом.
+
+        Возвращает словарь {product_id: количество}.
+        """
+        stmt = (
+            delete(CartItem).where(CartItem.chat_id == chat_id)
+            .returning(CartItem.product_id, CartItem.quantity)
+        )
         result = await self.session.execute(stmt)
-        items = result.scalars().all()
-        for item in items:
-            await self.session.delete(item)
-        await self.session.commit()
+        quantities: Dict[int, int] = {}
+        for product_id, quantity in result:
+            quantities[product_id] = quantities.get(product_id, 0) + quantity
+        return quantities
 
     async def remove_from_cart(self, chat_id: int, product_id: int):
         """Удаление конкретного элемента из корзины"""
@@ -114,4 +229,4 @@ class CartRepository:
         if not cart_item:
             raise Exception('Товар не найден в корзине.')
         await self.session.delete(cart_item)
-        await self.session.commit()
+        await self.session.flush()
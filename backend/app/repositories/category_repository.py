@@ -1,8 +1,11 @@
+from cache.catalog import mark_catalog_changed
 from models.category import Category
 from schemas.category import CategoryCreate
+from sqlalchemy import delete, exists, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import joinedload, subqueryload
+from models.product import Product
+from sqlalchemy.orm import selectinload
 
 
 class CategoryRepository:
@@ -13,47 +16,67 @@ class CategoryRepository:
 
     async def create_category(self, category_create: CategoryCreate):
         """Создание новой категории."""
-        db_category = Category(name=category_create.name)
+        db_category = Category(name=category_create.name, products=[])
         self.session.add(db_category)
-        await self.session.commit()
-        await self.session.refresh(db_category)
+        await self.session.flush()
+        mark_catalog_changed(self.session)
         return db_category
 
-    async def get_category_by_id(self, category_id: int):
-        """Получить категорию по её ID."""
-        stmt = (
-            select(Category)
-            .where(Category.id == category_id)
-            .options(subqueryload(Category.products))
+    @staticmethod
+    def _summary_select():
+        """
+        Выборка категорий с числом товаров одним запросом GROUP BY,
+        без загрузки самих товаров.
+        """
+        return (
+            select(Category.id, Category.name,
+                   func.count(Product.id).label("product_count"))
+            .outerjoin(Product, Product.category_id == Category.id)
+            .group_by(Category.id, Category.name)
         )
+
+    async def get_category_by_id(self, category_id: int):
+        """Получить категорию по её ID вместе с числом товаров."""
+        stmt = self._summary_select().where(Category.id == category_id)
         result = await self.session.execute(stmt)
-        return result.unique().scalar_one_or_none()
+        row = result.one_or_none()
+        return dict(row._mapping) if row is not None else None
 
     async def find_all_categories(self):
-        """Получить товары выбранной категории."""
-        stmt = select(Category).options(joinedload(Category.products))
+        """Получить список всех категорий с числом товаров в каждой."""
+        stmt = self._summary_select().order_by(Category.id)
         result = await self.session.execute(stmt)
-        return result.unique().scalars().all()
+        return [dict(row._mapping) for row in result]
 
     async def update_category(self, category_id: int, new_name: str):
         """Обновление названия категории по её ID."""
-        stmt = select(Category).where(Category.id == category_id)
+        stmt = (
+            select(Category)
+            .where(Category.id == category_id)
+            .options(selectinload(Category.products).joinedload(
+                Product.category))
+        )
         result = await self.session.execute(stmt)
         category_to_update = result.scalar_one_or_none()
         if category_to_update is None:
             return None
         category_to_update.name = new_name
-        await self.session.commit()
-        await self.session.refresh(category_to_update)
+        await self.session.flush()
+        mark_catalog_changed(self.session)
         return category_to_update
 
+    async def has_products(self, category_id: int) -> bool:
+        """Проверка, есть ли в категории товары."""
+        stmt = select(exists().where(Product.category_id == category_id))
+        result = await self.session.execute(stmt)
+        return result.scalar()
+
     async def delete_category(self, category_id: int):
-        """Удаление категории по её ID."""
-        stmt = select(Category).where(Category.id == category_id)
+        """
+        Удаление категории по её ID одним запросом DELETE.
+        Категорию с товарами база удалить не даёт (ON DELETE RESTRICT).
+        """
+        stmt = delete(Category).where(Category.id == category_id)
         result = await self.session.execute(stmt)
-        category_to_delete = result.scalar_one_or_none()
-        if category_to_delete is None:
-            return False
-        await self.session.delete(category_to_delete)
-        await self.session.commit()
-        return True
+        mark_catalog_changed(self.session)
+        return result.rowcount > 0
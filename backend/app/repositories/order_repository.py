@@ -1,7 +1,14 @@
+from datetime import datetime
+from typing import Dict, List, Sequence
+
+from models.associations import order_product
 from models.order import Order
+from models.product import Product
 from schemas.status import Status
+from sqlalchemy import insert, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
 
 
 class OrderRepository:
@@ -10,40 +17,103 @@ class OrderRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @staticmethod
+    def _details_options():
+        """Загрузка связей, необходимых для ответа с данными заказа."""
+        return (
+            selectinload(Order.ordered_products).joinedload(Product.category),
+            selectinload(Order.items)
+        )
+
     async def create_order(self, order_data: dict):
-        """Создание нового заказа."""
+        """
+        Создание нового заказа.
+
+        Заказ только отправляется в базу (flush) без фиксации транзакции,
+        чтобы оформление заказа завершалось одним коммитом.
+        """
         db_order = Order(**order_data)
         self.session.add(db_order)
-        await self.session.commit()
-        await self.session.refresh(db_order)
+        await self.session.flush()
         return db_order
 
+    async def build_order_lines(self, quantities: Dict[int, int]):
+        """
+        Строки заказа для товаров корзины с фиксацией названия и цены
+        товаров на момент покупки. Товары, удалённые из каталога,
+        пропускаются.
+        """
+        stmt = select(Product.id, Product.name, Product.price).where(
+            Product.id.in_(quantities))
+        result = await self.session.execute(stmt)
+        return [
+            {
+                "product_id": row.id,
+                "product_name": row.name,
+                "quantity": quantities[row.id],
+                "price": row.price
+            }
+            for row in result
+        ]
+
+    async def add_order_lines(self, order_id: int, lines: List[dict]):
+        """Сохранение строк заказа одним пакетным INSERT."""
+        await self.session.execute(
+            insert(order_product),
+            [{"order_id": order_id, **line} for line in lines])
+
     async def get_order_by_id(self, order_id: int):
         """Получение заказа по его ID."""
-        stmt = select(Order).where(Order.id == order_id)
+        stmt = select(Order).options(
+            *self._details_options()).where(Order.id == order_id)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_all_orders(self):
-        """Получение всех заказов."""
-        stmt = select(Order)
-        result = await self.session.execute(stmt)
+    async def get_orders_page(self, limit: int, after_id: int = None,
+                              statuses: Sequence[Status] = None,
+                              user_id: int = None,
+                              created_from: datetime = None,
+                              created_to: datetime = None):
+        """
+        Получение страницы заказов с фильтрами и keyset-пагинацией.
+
+        Заказы упорядочены от новых к старым по (created_at, id), что
+        совпадает с порядком составных индексов таблицы. Курсором служит
+        ID последнего заказа предыдущей страницы.
+        """
+        stmt = select(Order).options(*self._details_options())
+        if statuses:
+            stmt = stmt.where(Order.status.in_(statuses))
+        if user_id is not None:
+            stmt = stmt.where(Order.user_id == user_id)
+        if created_from is not None:
+            stmt = stmt.where(Order.created_at >= created_from)
+        if created_to is not None:
+            stmt = stmt.where(Order.created_at < created_to)
+        if after_id is not None:
+            cursor_value = select(Order.created_at).where(
+                Order.id == after_id).scalar_subquery()
+            stmt = stmt.where(tuple_(Order.created_at, Order.id) < tuple_(
+                cursor_value, after_id))
+        stmt = stmt.order_by(Order.created_at.desc(), Order.id.desc())
+        result = await self.session.execute(stmt.limit(limit))
         return result.scalars().all()
 
     async def update_order_status(self, order_id: int, new_status: Status):
         """Обновление статуса заказа."""
-        stmt = select(Order).where(Order.id == order_id)
+        stmt = select(Order).options(
+            *self._details_options()).where(Order.id == order_id)
         result = await self.session.execute(stmt)
         order = result.scalar_one_or_none()
         if not order:
             raise Exception(f"Заказ с ID {order_id} не найден")
         order.status = new_status
-        await self.session.commit()
-        await self.session.refresh(order)
+        await self.session.flush()
         return order
 
     async def list_orders_by_user_id(self, user_id: int):
         """Получение списка заказов конкретного пользователя."""
-        stmt = select(Order).where(Order.user_id == user_id)
+        stmt = select(Order).options(
+            *self._details_options()).where(Order.user_id == user_id)
         result = await self.session.execute(stmt)
         return result.scalars().all()
@@ -1,9 +1,22 @@
+import re
+
+from cache.catalog import mark_catalog_changed
+from enums.product_sort import ProductSort
 from models.category import Category
-from models.product import Product
+from models.product import SEARCH_CONFIG, Product, product_search_vector
 from schemas.product import ProductCreate
+from sqlalchemy import column, delete, func, or_, table, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import joinedload
+
+# Слова поискового запроса: прочие символы отбрасываются, поэтому
+# синтаксис tsquery и FTS5 в запрос пользователя не попадает
+SEARCH_TERM = re.compile(r"\w+")
+
+# Таблица FTS5 для поиска в SQLite (создаётся вместе с products)
+products_fts = table("products_fts", column("rowid"),
+                     column("products_fts"), column("rank"))
 
 
 class ProductRepository:
@@ -18,46 +31,142 @@ class ProductRepository:
         category = await self.session.get(Category, category_id)
         if category is None:
             raise Exception("Категория не найдена.")
-        db_product = Product(**product_create.model_dump())
-        db_product.category.append(category)
+        db_product = Product(**product_create.model_dump(),
+                             category=category)
         self.session.add(db_product)
-        await self.session.commit()
-        await self.session.refresh(db_product)
+        await self.session.flush()
+        mark_catalog_changed(self.session)
         return db_product
 
     async def get_product_by_id(self, product_id: int):
         """Получение товара по его ID."""
         stmt = select(
             Product).options(
-                selectinload(
+                joinedload(
                     Product.category)).where(Product.id == product_id)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_all_products(self):
-        """Получение всех товаров."""
-        stmt = select(Product).options(joinedload(Product.category))
-        result = await self.session.execute(stmt)
-        return result.unique().scalars().all()
+    @staticmethod
+    def _catalog_select():
+        """
+        Выборка полей товара и его категории для ответов каталога
+        без загрузки ORM-объектов и связанных заказов.
+        """
+        return (
+            select(Product.id, Product.name, Product.description,
+                   Product.price, Product.photo_url,
+                   Category.id.label("category_id"),
+                   Category.name.label("category_name"))
+            .join(Category, Product.category_id == Category.id)
+        )
+
+    @staticmethod
+    def _catalog_rows(result):
+        """Преобразует строки выборки каталога в словари ответа."""
+        return [
+            {
+                "id": row.id,
+                "name": row.name,
+                "description": row.description,
+                "price": row.price,
+                "photo_url": row.photo_url,
+                "category": {"id": row.category_id,
+                             "name": row.category_name}
+            }
+            for row in result
+        ]
+
+    async def get_products_page(self, limit: int, after_id: int = None,
+                                category_id: int = None,
+                                sort_by: ProductSort = ProductSort.ID):
+        """
+        Получение страницы товаров с keyset-пагинацией.
+
+        Выбираются только поля, необходимые для ответа, без загрузки
+        ORM-объектов и связанных заказов. Курсором служит ID последнего
+        товара предыдущей страницы.
+        """
+        stmt = self._catalog_select()
+        if category_id is not None:
+            stmt = stmt.where(Product.category_id == category_id)
+        if sort_by is ProductSort.ID:
+            if after_id is not None:
+                stmt = stmt.where(Product.id > after_id)
+            stmt = stmt.order_by(Product.id)
+        else:
+            sort_column = getattr(Product, sort_by.value)
+            if after_id is not None:
+                cursor_value = select(sort_column).where(
+                    Product.id == after_id).scalar_subquery()
+                stmt = stmt.where(tuple_(sort_column, Product.id) > tuple_(
+                    cursor_value, after_id))
+            stmt = stmt.order_by(sort_column, Product.id)
+        result = await self.session.execute(stmt.limit(limit))
+        return self._catalog_rows(result)
+
+    async def search_products(self, query: str, limit: int,
+                              offset: int = 0):
+        """
+        Полнотекстовый поиск товаров по названию и описанию.
+
+        Каждое слово запроса ищется по префиксу, результаты упорядочены
+        по релевантности. В PostgreSQL используются GIN-индексы
+        tsvector и триграмм (последний находит названия с опечатками),
+        в SQLite — таблица FTS5 products_fts, где ё хранится как е.
+        """
+        terms = SEARCH_TERM.findall(query.lower())
+        if not terms:
+            return []
+        stmt = self._catalog_select()
+        dialect_name = self.session.bind.dialect.name
+        if dialect_name == "postgresql":
+            ts_query = func.to_tsquery(
+                SEARCH_CONFIG, " & ".join(f"{term}:*" for term in terms))
+            search_vector = product_search_vector()
+            relevance = (func.ts_rank_cd(search_vector, ts_query)
+                         + func.similarity(Product.name, query))
+            stmt = stmt.where(or_(
+                search_vector.op("@@")(ts_query),
+                Product.name.op("%")(query)
+            )).order_by(relevance.desc(), Product.id)
+        elif dialect_name == "sqlite":
+            match = " ".join(f'"{term.replace("ё", "е")}"*'
+                             for term in terms)
+            stmt = (
+                stmt.join(products_fts, products_fts.c.rowid == Product.id)
+                .where(products_fts.c.products_fts.op("MATCH")(match))
+                .order_by(products_fts.c.rank, Product.id)
+            )
+        else:
+            raise NotImplementedError(
+                f"Поиск не поддерживается для СУБД {dialect_name}.")
+        result = await self.session.execute(
+            stmt.limit(limit).offset(offset))
+        return self._catalog_rows(result)
 
     async def update_product(self, product_id: int, updated_data: dict):
-        """Обновляет существующий продукт"""
-        stmt = select(Product).where(Product.id == product_id)
+        """Обновляет существующий продукт; None, если он не найден."""
+        stmt = select(Product).options(
+            joinedload(Product.category)).where(Product.id == product_id)
         result = await self.session.execute(stmt)
         product_to_update = result.scalar_one_or_none()
+        if product_to_update is None:
+            return None
 
         for key, value in updated_data.items():
             setattr(product_to_update, key, value)
 
-        await self.session.commit()
-        await self.session.refresh(product_to_update)
+        await self.session.flush()
+        mark_catalog_changed(self.session)
         return product_to_update
 
     async def delete_product(self, product_id: int):
-        """Удаляет продукт по его идентификатору"""
-        stmt = select(Product).where(Product.id == product_id)
+        """
+        Удаляет продукт по его идентификатору одним запросом DELETE.
+        Связанные строки корзин и заказов удаляются каскадно в базе.
+        """
+        stmt = delete(Product).where(Product.id == product_id)
         result = await self.session.execute(stmt)
-        product_to_delete = result.scalar_one_or_none()
-        await self.session.delete(product_to_delete)
-        await self.session.commit()
-        return True
+        mark_catalog_changed(self.session)
+        return result.rowcount > 0
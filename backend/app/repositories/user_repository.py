@@ -14,8 +14,7 @@ class UserRepository:
         """Создание нового пользователя."""
         db_user = User(**user_create.model_dump())
         self.session.add(db_user)
-        await self.session.commit()
-        await self.session.refresh(db_user)
+        await self.session.flush()
         return db_user
 
     async def get_user_by_chat_id(self, chat_id: int):
@@ -1,6 +1,7 @@
 from dependencies import get_db
 from fastapi import APIRouter, Depends
-from schemas.cart import CartItemCreate, UpdateCartItemSchema, ViewCartSchema
+from schemas.cart import (CartBatchSchema, CartItemCreate,
+                          UpdateCartItemSchema, ViewCartSchema)
 from services.cart_service import CartService
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -23,8 +24,7 @@ async def add_to_cart(cart_item: CartItemCreate,
     #### Ответ:
     Сообщение о успешном добавлении товара в корзину.
     """
-    async with db as session:
-        return await CartService.add_to_cart(cart_item, session)
+    return await CartService.add_to_cart(cart_item, db)
 
 
 @router.get("/item-cart/{chat_id}",
@@ -41,8 +41,30 @@ async def view_cart(chat_id: int, db: AsyncSession = Depends(get_db)):
     #### Ответ:
     Содержимое корзины пользователя с итоговой суммой.
     """
-    async with db as session:
-        return await CartService.view_cart(chat_id, session)
+    return await CartService.view_cart(chat_id, db)
+
+
+@router.patch("/item-cart/{chat_id}", summary="Пакетное изменение корзины",
+              response_model=ViewCartSchema)
+async def update_cart(chat_id: int, batch: CartBatchSchema,
+                      db: AsyncSession = Depends(get_db)):
+    """
+    ### Цель метода:
+    Изменение нескольких товаров корзины одним запросом
+    в одной транзакции.
+
+    #### Входящие данные:
+    - `chat_id`: Уникальный идентификатор чата пользователя.
+    - `operations`: Список операций, применяемых по порядку:
+      - `op`: `set` — установить количество (0 удаляет товар),
+      `add` — прибавить количество, `remove` — удалить товар.
+      - `product_id`: Идентификатор товара.
+      - `quantity`: Количество единиц товара.
+
+    #### Ответ:
+    Пересчитанное содержимое корзины пользователя с итоговой суммой.
+    """
+    return await CartService.apply_cart_operations(chat_id, batch, db)
 
 
 @router.put("/item-cart/{chat_id}/{item_id}",
@@ -62,9 +84,8 @@ async def update_cart_item(chat_id: int, item_id: int,
     #### Ответ:
     Сообщение о том, что количество товара обновлено.
     """
-    async with db as session:
-        return await CartService.update_cart_item(chat_id, item_id,
-                                                  data, session)
+    return await CartService.update_cart_item(chat_id, item_id,
+                                              data, db)
 
 
 @router.delete("/item-cart/{chat_id}/{item_id}",
@@ -82,5 +103,4 @@ async def remove_from_cart(chat_id: int, item_id: int,
     #### Ответ:
     Сообщение о том, что товар удалён из корзины.
     """
-    async with db as session:
-        return await CartService.remove_from_cart(chat_id, item_id, session)
+    return await CartService.remove_from_cart(chat_id, item_id, db)
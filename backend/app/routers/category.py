@@ -1,7 +1,9 @@
-from dependencies import get_db
-from fastapi import APIRouter, Depends
+from dependencies import catalog_etag, get_db
+from enums.product_sort import ProductSort
+from fastapi import APIRouter, Depends, Query
 from schemas.category import (CategoryCreate, CategoryResponse,
-                              CategoryResponseList)
+                              CategorySummary)
+from schemas.product import ProductResponse
 from services.category_service import CategoryService
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -23,40 +25,66 @@ async def create_category(category: CategoryCreate,
     #### Ответ:
     Информация о вновь созданной категории.
     """
-    async with db as session:
-        return await CategoryService.create_category(category, session)
+    return await CategoryService.create_category(category, db)
 
 
 @router.get("/categories/", summary="Получение списка всех категорий",
-            response_model=list[CategoryResponseList])
+            response_model=list[CategorySummary],
+            dependencies=[Depends(catalog_etag)])
 async def list_categories(db: AsyncSession = Depends(get_db)):
     """
     ### Цель метода:
     Получение списка всех категорий товаров.
 
     #### Ответ:
-    Полный список категорий товаров.
+    Полный список категорий товаров с числом товаров в каждой.
     """
-    async with db as session:
-        return await CategoryService.list_categories(session)
+    return await CategoryService.list_categories(db)
 
 
 @router.get("/categories/{category_id}",
-            summary="Получить товары выбранной категории",
-            response_model=CategoryResponse)
+            summary="Получить категорию по ID",
+            response_model=CategorySummary,
+            dependencies=[Depends(catalog_etag)])
 async def read_category(category_id: int, db: AsyncSession = Depends(get_db)):
     """
     ### Цель метода:
-    Получение списка товаров определенной категории.
+    Получение категории по её идентификатору.
+
+    #### Входящие данные:
+    - `category_id`: Уникальный идентификатор категории.
+
+    #### Ответ:
+    Категория с числом принадлежащих ей товаров. Сами товары
+    возвращает `/categories/{category_id}/products`.
+    """
+    return await CategoryService.find_category_by_id(category_id, db)
+
+
+@router.get("/categories/{category_id}/products",
+            summary="Получить товары выбранной категории",
+            response_model=list[ProductResponse],
+            dependencies=[Depends(catalog_etag)])
+async def list_category_products(category_id: int,
+                                 limit: int = Query(50, ge=1, le=100),
+                                 after_id: int | None = None,
+                                 sort_by: ProductSort = ProductSort.ID,
+                                 db: AsyncSession = Depends(get_db)):
+    """
+    ### Цель метода:
+    Получение списка товаров определенной категории постранично.
 
     #### Входящие данные:
     - `category_id`: Уникальный идентификатор категории.
+    - `limit`: Количество товаров на странице (по умолчанию 50).
+    - `after_id`: ID последнего товара предыдущей страницы.
+    - `sort_by`: Поле сортировки: `id`, `price` или `name`.
 
     #### Ответ:
-    Список товаров, принадлежащих указанной категории.
+    Страница товаров, принадлежащих указанной категории.
     """
-    async with db as session:
-        return await CategoryService.find_category_by_id(category_id, session)
+    return await CategoryService.list_category_products(
+        category_id, db, limit, after_id, sort_by)
 
 
 @router.put("/categories/{category_id}/", summary="Изменение категории",
@@ -74,10 +102,9 @@ async def edit_category(category_id: int, new_name: str,
     #### Ответ:
     Отредактированная категория.
     """
-    async with db as session:
-        updated_category = await CategoryService.update_category(
-            category_id, new_name, session)
-        return updated_category
+    updated_category = await CategoryService.update_category(
+        category_id, new_name, db)
+    return updated_category
 
 
 @router.delete("/categories/{category_id}/", summary="Удаление категории",
@@ -94,7 +121,6 @@ async def remove_category(category_id: int,
     #### Ответ:
     Сообщение об успешном удалении категории.
     """
-    async with db as session:
-        removed_category = await CategoryService.delete_category(
-            category_id, session)
-        return removed_category
+    removed_category = await CategoryService.delete_category(
+        category_id, db)
+    return removed_category
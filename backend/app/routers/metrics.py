@@ -0,0 +1,34 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from database import get_pool_stats
+from metrics import render_prometheus
+
+router = APIRouter(tags=["Мониторинг"])
+
+
+@router.get("/metrics", summary="Метрики приложения",
+            response_class=PlainTextResponse)
+async def get_metrics():
+    """
+    ### Цель метода:
+    Получение метрик HTTP-маршрутов и работы с базой данных.
+
+    #### Ответ:
+    Метрики в текстовом формате Prometheus: количество запросов,
+    количество и время SQL-запросов, признаки проблемы N+1.
+    """
+    return render_prometheus()
+
+
+@router.get("/metrics/pool", summary="Состояние пула соединений")
+async def get_pool_metrics():
+    """
+    ### Цель метода:
+    Получение состояния пула соединений с базой данных.
+
+    #### Ответ:
+    Размер пула, количество выданных и свободных соединений,
+    переполнение и время ожидания свободного соединения.
+    """
+    return get_pool_stats()
@@ -1,5 +1,8 @@
+from datetime import datetime
+
 from dependencies import get_db
-from fastapi import APIRouter, Depends, HTTPException
+from enums.status import Status
+from fastapi import APIRouter, Depends, HTTPException, Query
 from schemas.order import OrderCreate, OrderResponse
 from schemas.status import OrderStatusUpdate
 from services.order_service import OrderService
@@ -29,10 +32,9 @@ async def create_order(order: OrderCreate,
     - **status**: Текущий статус заказа (по умолчанию `НОВЫЙ`).
     """
     try:
-        async with db as session:
-            service = OrderService()
-            created_order = await service.create_order(order, session)
-            return created_order
+        service = OrderService()
+        created_order = await service.create_order(order, db)
+        return created_order
     except Exception as err:
         raise HTTPException(status_code=400, detail=str(err))
 
@@ -51,25 +53,39 @@ async def list_orders(chat_id: int, db: AsyncSession = Depends(get_db)):
     #### Ответ:
     Список объектов заказов пользователя, с информацией о каждом заказе.
     """
-    async with db as session:
-        user = await UserService.fetch_user_by_chat_id(chat_id, session)
-        orders = await OrderService.list_orders_by_user_id(user.id, session)
-        return orders
+    user = await UserService.fetch_user_by_chat_id(chat_id, db)
+    orders = await OrderService.list_orders_by_user_id(user.id, db)
+    return orders
 
 
 @router.get("/orders/", summary="Получение списка всех заказов",
             response_model=list[OrderResponse])
-async def list_all_orders(db: AsyncSession = Depends(get_db)):
+async def list_all_orders(limit: int = Query(50, ge=1, le=100),
+                          after_id: int | None = None,
+                          status: list[Status] | None = Query(None),
+                          user_id: int | None = None,
+                          created_from: datetime | None = None,
+                          created_to: datetime | None = None,
+                          db: AsyncSession = Depends(get_db)):
     """
     ### Цель метода:
-    Получение полного списка всех заказов в системе.
+    Получение списка заказов в системе постранично, от новых к старым.
+
+    #### Входящие данные:
+    - `limit`: Количество заказов на странице (по умолчанию 50).
+    - `after_id`: ID последнего заказа предыдущей страницы.
+    - `status`: Фильтр по статусу; параметр можно передать несколько раз.
+    - `user_id`: Фильтр по пользователю.
+    - `created_from`: Заказы, созданные не раньше указанного момента.
+    - `created_to`: Заказы, созданные раньше указанного момента.
 
     #### Ответ:
-    Список всех заказов, включающих подробную информацию
-    о продуктах каждого заказа.
+    Страница заказов, включающих подробную информацию о продуктах
+    каждого заказа. Для получения следующей страницы передайте ID
+    последнего заказа в `after_id`.
     """
-    async with db as session:
-        return await OrderService.retrieve_all_orders(session)
+    return await OrderService.retrieve_all_orders(
+        db, limit, after_id, status, user_id, created_from, created_to)
 
 
 @router.put("/orders-status/{order_id}", summary="Обновление статуса заказа",
@@ -94,6 +110,5 @@ async def update_order_status(order_id: int, status_data: OrderStatusUpdate,
     - **status**: Новый статус заказа.
     - **id**: Идентификатор заказа.
     """
-    async with db as session:
-        return await OrderService.update_order_status(order_id,
-                                                      status_data, session)
+    return await OrderService.update_order_status(order_id,
+                                                  status_data, db)
@@ -1,5 +1,6 @@
-from dependencies import get_db
-from fastapi import APIRouter, Depends
+from dependencies import catalog_etag, get_db
+from enums.product_sort import ProductSort
+from fastapi import APIRouter, Depends, Query
 from schemas.product import ProductCreate, ProductResponse, ProductUpdate
 from services.product_service import ProductService
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,28 +25,64 @@ async def create_product(product: ProductCreate, category_id: int,
     #### Ответ:
     Информация о вновь созданном товаре.
     """
-    async with db as session:
-        return await ProductService.create_new_product(product,
-                                                       category_id, session)
+    return await ProductService.create_new_product(product,
+                                                   category_id, db)
 
 
 @router.get("/products/",
             summary="Получение списка всех товаров",
-            response_model=list[ProductResponse])
-async def list_products(db: AsyncSession = Depends(get_db)):
+            response_model=list[ProductResponse],
+            dependencies=[Depends(catalog_etag)])
+async def list_products(limit: int = Query(50, ge=1, le=100),
+                        after_id: int | None = None,
+                        category_id: int | None = None,
+                        sort_by: ProductSort = ProductSort.ID,
+                        db: AsyncSession = Depends(get_db)):
     """
     ### Цель метода:
-    Получение списка всех товаров, имеющихся в магазине.
+    Получение списка товаров, имеющихся в магазине, постранично.
+
+    #### Входящие данные:
+    - `limit`: Количество товаров на странице (по умолчанию 50).
+    - `after_id`: ID последнего товара предыдущей страницы.
+    - `category_id`: Опциональный фильтр по категории.
+    - `sort_by`: Поле сортировки: `id`, `price` или `name`.
+
+    #### Ответ:
+    Страница списка товаров магазина. Для получения следующей страницы
+    передайте ID последнего товара в `after_id`.
+    """
+    return await ProductService.retrieve_all_products(
+        db, limit, after_id, category_id, sort_by)
+
+
+@router.get("/products/search",
+            summary="Поиск товаров",
+            response_model=list[ProductResponse],
+            dependencies=[Depends(catalog_etag)])
+async def search_products(q: str = Query(..., min_length=1, max_length=100),
+                          limit: int = Query(20, ge=1, le=100),
+                          offset: int = Query(0, ge=0, le=1000),
+                          db: AsyncSession = Depends(get_db)):
+    """
+    ### Цель метода:
+    Полнотекстовый поиск товаров по названию и описанию.
+
+    #### Входящие данные:
+    - `q`: Поисковый запрос; каждое слово ищется по началу слова.
+    - `limit`: Количество товаров на странице (по умолчанию 20).
+    - `offset`: Количество пропускаемых результатов.
 
     #### Ответ:
-    Полный список товаров магазина.
+    Список найденных товаров, упорядоченный по релевантности:
+    совпадения в названии важнее совпадений в описании.
     """
-    async with db as session:
-        return await ProductService.retrieve_all_products(session)
+    return await ProductService.search_products(db, q, limit, offset)
 
 
 @router.get("/products/{product_id}", summary="Получение товара по ID",
-            response_model=ProductResponse)
+            response_model=ProductResponse,
+            dependencies=[Depends(catalog_etag)])
 async def read_product(product_id: int, db: AsyncSession = Depends(get_db)):
     """
     ### Цель метода:
@@ -58,8 +95,7 @@ async def read_product(product_id: int, db: AsyncSession = Depends(get_db)):
     #### Ответ:
     Полная информация о данном товаре.
     """
-    async with db as session:
-        return await ProductService.retrieve_product_by_id(product_id, session)
+    return await ProductService.retrieve_product_by_id(product_id, db)
 
 
 @router.put("/products/{product_id}/", summary="Редактирование товара",
@@ -77,10 +113,9 @@ async def edit_product(product_id: int, updates: ProductUpdate,
     #### Ответ:
     Отредактированный объект товара.
     """
-    async with db as session:
-        updated_product = await ProductService.update_product(
-            product_id, updates.model_dump(), session)
-        return updated_product
+    updated_product = await ProductService.update_product(
+        product_id, updates.model_dump(), db)
+    return updated_product
 
 
 @router.delete("/products/{product_id}/", summary="Удаление товара",
@@ -96,7 +131,6 @@ async def remove_product(product_id: int, db: AsyncSession = Depends(get_db)):
     #### Ответ:
     Сообщение об успешном удалении товара.
     """
-    async with db as session:
-        removed_product = await ProductService.delete_product(
-            product_id, session)
-        return removed_product
+    removed_product = await ProductService.delete_product(
+        product_id, db)
+    return removed_product
@@ -25,8 +25,7 @@ async def register_user(user_create: UserCreate = Body(...),
     #### Ответ:
     Информация о зарегистрированном пользователе.
     """
-    async with db as session:
-        return await UserService.register_user(user_create, session)
+    return await UserService.register_user(user_create, db)
 
 
 @router.get("/user/{chat_id}/", summary="Получение пользователя по Chat ID",
@@ -45,8 +44,7 @@ async def get_user_by_chat_id(
     #### Ответ:
     Подробная информация о запрашиваемом пользователе.
     """
-    async with db as session:
-        return await UserService.fetch_user_by_chat_id(chat_id, session)
+    return await UserService.fetch_user_by_chat_id(chat_id, db)
 
 
 @router.patch("/user/{chat_id}/", summary="Изменение данных пользователя",
@@ -67,8 +65,7 @@ async def update_user_data(
     #### Ответ:
     Обновленные данные пользователя.
     """
-    async with db as session:
-        return await UserService.update_user(updates, chat_id, session)
+    return await UserService.update_user(updates, chat_id, db)
 
 
 @router.get("/users/", summary="Получение всех пользователей",
@@ -81,5 +78,4 @@ async def get_all_users(db: AsyncSession = Depends(get_db)):
     #### Ответ:
     Массив объектов с информацией обо всех пользователях.
     """
-    async with db as session:
-        return await UserService.fetch_all_users(session)
+    return await UserService.fetch_all_users(db)
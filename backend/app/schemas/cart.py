@@ -1,7 +1,8 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from enums.cart_operation import CartOperationType
 from schemas.category import CategoryResponseList
 
 
@@ -40,3 +41,14 @@ class ViewCartSchema(BaseModel):
 
 class UpdateCartItemSchema(BaseModel):
     quantity: int
+
+
+class CartOperation(BaseModel):
+    op: CartOperationType
+    product_id: int
+    quantity: int = Field(1, ge=0)
+
+
+class CartBatchSchema(BaseModel):
+    operations: List[CartOperation] = Field(..., min_length=1,
+                                            max_length=100)
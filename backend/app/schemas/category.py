@@ -15,6 +15,10 @@ class CategoryResponseList(CategoryCreate):
         from_attributes = True
 
 
+class CategorySummary(CategoryResponseList):
+    product_count: int
+
+
 class CategoryResponse(CategoryCreate):
     id: int
     products: List[ProductResponse]
@@ -1,4 +1,5 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -14,13 +15,26 @@ class OrderCreate(BaseModel):
     status: Status = Status.NEW
 
 
+class OrderItemResponse(BaseModel):
+    product_id: Optional[int]
+    product_name: str
+    quantity: int
+    price: int
+
+    class Config:
+        from_attributes = True
+
+
 class OrderResponse(BaseModel):
     id: int
     user_id: int
     number: str
     status: Status
     ordered_products: List[ProductResponse]
+    items: List[OrderItemResponse]
     total_amount: int
+    created_at: datetime
+    updated_at: datetime
 
     class Config:
         from_attributes = True
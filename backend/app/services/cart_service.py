@@ -3,7 +3,7 @@ from typing import Any, Dict
 from fastapi import HTTPException
 
 from repositories.cart_repository import CartRepository
-from schemas.cart import (CartItemCreate, CartItemResponse,
+from schemas.cart import (CartBatchSchema, CartItemCreate, CartItemResponse,
                           UpdateCartItemSchema, ViewCartSchema)
 
 
@@ -98,3 +98,25 @@ class CartService:
             return {"message": "Элемент успешно удалён из корзины."}
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
+
+    @staticmethod
+    async def apply_cart_operations(chat_id: int, batch: CartBatchSchema,
+                                    db_session) -> ViewCartSchema:
+        """
+        Применяет набор операций к корзине пользователя в одной транзакции.
+
+        Параметры:
+        - chat_id (int): Чат-идентификатор пользователя.
+        - batch (CartBatchSchema): Операции установки количества,
+        добавления и удаления товаров.
+        - db_session: Текущая сессия базы данных.
+
+        Возвращает:
+        - Пересчитанное содержимое корзины пользователя.
+        """
+        repo = CartRepository(db_session)
+        try:
+            await repo.apply_operations(chat_id, batch.operations)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return await CartService.view_cart(chat_id, db_session)
@@ -1,10 +1,22 @@
+from cache.catalog import catalog_cache
+from enums.product_sort import ProductSort
 from fastapi import HTTPException
 from repositories.category_repository import CategoryRepository
 from schemas.category import CategoryCreate, CategoryResponse
+from services.product_service import ProductService
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+CATEGORY_NOT_EMPTY = ("Нельзя удалить категорию, в которой есть товары: "
+                      "сначала удалите или перенесите их.")
 
 
 class CategoryService:
-    """Класс для управления категориями."""
+    """
+    Класс для управления категориями.
+
+    Ошибки базы данных преобразуются в ответ 400, а HTTPException
+    (404, 409) передаются клиенту без изменений.
+    """
 
     @staticmethod
     async def create_category(category_create: CategoryCreate, db_session):
@@ -25,7 +37,7 @@ class CategoryService:
             serialized_product = CategoryResponse.model_validate(
                 created_category)
             return serialized_product
-        except Exception as e:
+        except SQLAlchemyError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     @staticmethod
@@ -38,17 +50,20 @@ class CategoryService:
         - db_session: Текущая сессия базы данных.
 
         Возвращает:
-        - Экземпляр категории, найденной по указанному ID,
-        или исключение 404, если категория не найдена.
+        - Категория с числом товаров, найденная по указанному ID (из кэша
+        каталога, если он актуален), или исключение 404,
+        если категория не найдена.
         """
         repo = CategoryRepository(db_session)
         try:
-            found_category = await repo.get_category_by_id(category_id)
+            found_category = await catalog_cache.get_or_load(
+                "category", lambda: repo.get_category_by_id(category_id),
+                category_id)
             if found_category is None:
                 raise HTTPException(status_code=404,
                                     detail="Категория не найдена.")
             return found_category
-        except Exception as e:
+        except SQLAlchemyError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     @staticmethod
@@ -60,15 +75,43 @@ class CategoryService:
         - db_session: Текущая сессия базы данных.
 
         Возвращает:
-        - Список всех доступных категорий.
+        - Список всех доступных категорий с числом товаров в каждой
+        (из кэша каталога, если он актуален).
         """
         repo = CategoryRepository(db_session)
         try:
-            categories_list = await repo.find_all_categories()
+            categories_list = await catalog_cache.get_or_load(
+                "categories", repo.find_all_categories)
             return categories_list
-        except Exception as e:
+        except SQLAlchemyError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
+    @staticmethod
+    async def list_category_products(category_id: int, db_session,
+                                     limit: int, after_id: int = None,
+                                     sort_by: ProductSort = ProductSort.ID):
+        """
+        Получение страницы товаров категории.
+
+        Параметры:
+        - category_id (int): Уникальный идентификатор категории.
+        - db_session: Текущая сессия базы данных.
+        - limit (int): Максимальное количество товаров на странице.
+        - after_id (int): ID последнего товара предыдущей страницы.
+        - sort_by (ProductSort): Поле сортировки товаров.
+
+        Возвращает:
+        - Список товаров выбранной страницы или исключение 404,
+        если категория не найдена.
+        """
+        products_list = await ProductService.retrieve_all_products(
+            db_session, limit, after_id, category_id, sort_by)
+        if not products_list and after_id is None:
+            # Пустая первая страница: проверяем, что категория существует
+            await CategoryService.find_category_by_id(category_id,
+                                                      db_session)
+        return products_list
+
     @staticmethod
     async def update_category(category_id: int, new_name: str, db_session):
         """
@@ -91,28 +134,34 @@ class CategoryService:
                 raise HTTPException(status_code=404,
                                     detail="Категория не найдена")
             return updated_category
-        except Exception as e:
+        except SQLAlchemyError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     @staticmethod
     async def delete_category(category_id: int, db_session):
         """
-        Удаляет категорию по её идентификатору.
+        Удаляет пустую категорию по её идентификатору.
 
         Параметры:
         - category_id (int): Идентификатор удаляемой категории.
         - db_session: Текущая сессия базы данных.
 
         Возвращает:
-        - Результат успешного удаления (True) или ошибку 404,
-        если категория не найдена.
+        - Результат успешного удаления, ошибку 404, если категория
+        не найдена, или ошибку 409, если в категории есть товары.
         """
         repo = CategoryRepository(db_session)
         try:
+            if await repo.has_products(category_id):
+                raise HTTPException(status_code=409,
+                                    detail=CATEGORY_NOT_EMPTY)
             deleted_result = await repo.delete_category(category_id)
             if not deleted_result:
                 raise HTTPException(status_code=404,
                                     detail="Категория не найдена")
             return {"message": f"Категория с id={category_id} успешно удалена"}
-        except Exception as e:
+        except IntegrityError:
+            # Товар добавлен в категорию параллельным запросом
+            raise HTTPException(status_code=409, detail=CATEGORY_NOT_EMPTY)
+        except SQLAlchemyError as e:
             raise HTTPException(status_code=400, detail=str(e))
@@ -1,10 +1,12 @@
+from datetime import datetime
+from typing import List
+
 from fastapi import HTTPException
 
-from models.product import Product
 from repositories.cart_repository import CartRepository
 from repositories.order_repository import OrderRepository
 from schemas.order import OrderCreate, OrderResponse
-from schemas.status import OrderStatusUpdate
+from schemas.status import OrderStatusUpdate, Status
 from services.user_service import UserService
 
 
@@ -16,6 +18,12 @@ class OrderService:
         """
         Создание нового заказа.
 
+        Корзина забирается одним запросом DELETE ... RETURNING, и строки
+        заказа и его сумма строятся ровно из забранных позиций, поэтому
+        параллельное изменение корзины не теряет товары и не расходится
+        с суммой заказа. Всё выполняется в транзакции запроса и
+        фиксируется одним коммитом.
+
         Параметры:
         - order_create (OrderCreate): Данные для создания нового заказа.
         - db_session: Текущая сессия базы данных.
@@ -30,22 +38,20 @@ class OrderService:
         if user is None:
             raise Exception("Пользователь не найден.")
         cart_repo = CartRepository(db_session)
-        cart_items = await cart_repo.get_cart_items_by_user_id(
-            order_data.chat_id)
-        if not cart_items:
+        quantities = await cart_repo.take_cart_items(order_data.chat_id)
+        repository = OrderRepository(db_session)
+        lines = await repository.build_order_lines(quantities)
+        if not lines:
             raise Exception("Корзина пуста, невозможно оформить заказ.")
         order_details = {
             "user_id": user.id,
-            "status": order_data.status
+            "status": order_data.status,
+            "total_amount": sum(
+                line["quantity"] * line["price"] for line in lines)
         }
-        repository = OrderRepository(db_session)
         created_order = await repository.create_order(order_details)
-        products_in_order = [await db_session.get(
-            Product, item.product_id) for item in cart_items]
-        created_order.ordered_products.extend(products_in_order)
-        await db_session.commit()
-        await db_session.refresh(created_order)
-        await cart_repo.clear_cart(order_data.chat_id)
+        await repository.add_order_lines(created_order.id, lines)
+        created_order = await repository.get_order_by_id(created_order.id)
         return OrderResponse.model_validate(created_order)
 
     @staticmethod
@@ -71,20 +77,32 @@ class OrderService:
             raise HTTPException(status_code=400, detail=str(e))
 
     @staticmethod
-    async def retrieve_all_orders(db_session):
+    async def retrieve_all_orders(db_session, limit: int = 50,
+                                  after_id: int = None,
+                                  statuses: List[Status] = None,
+                                  user_id: int = None,
+                                  created_from: datetime = None,
+                                  created_to: datetime = None):
         """
-        Получение списка всех заказов.
+        Получение страницы списка заказов.
 
         Параметры:
         - db_session: Текущая сессия базы данных.
+        - limit (int): Количество заказов на странице.
+        - after_id (int): ID последнего заказа предыдущей страницы.
+        - statuses (List[Status]): Фильтр по статусам заказа.
+        - user_id (int): Фильтр по пользователю.
+        - created_from (datetime): Начало периода создания (включительно).
+        - created_to (datetime): Конец периода создания (не включительно).
 
         Возвращает:
-        - Список всех доступных заказов.
+        - Страницу заказов от новых к старым.
         """
         repo = OrderRepository(db_session)
         try:
-            all_orders = await repo.get_all_orders()
-            return all_orders
+            orders_page = await repo.get_orders_page(
+                limit, after_id, statuses, user_id, created_from, created_to)
+            return orders_page
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
 
@@ -1,8 +1,9 @@
+from cache.catalog import catalog_cache
+from enums.product_sort import ProductSort
 from fastapi import HTTPException
 from repositories.product_repository import ProductRepository
 from schemas.product import ProductCreate, ProductResponse
-from sqlalchemy import select
-from models.category import Category
+from sqlalchemy.exc import SQLAlchemyError
 
 
 class ProductService:
@@ -27,18 +28,8 @@ class ProductService:
         try:
             created_product = await repo.create_product(
                 product_create, category_id)
-            category_stmt = select(Category).where(Category.id == category_id)
-            category = await db_session.execute(category_stmt)
-            category_obj = category.scalar_one_or_none()
-            product_dict = {
-                "id": created_product.id,
-                "name": created_product.name,
-                "description": created_product.description,
-                "price": created_product.price,
-                "photo_url": created_product.photo_url,
-                "categories": category_obj
-            }
-            serialized_product = ProductResponse.model_validate(product_dict)
+            serialized_product = ProductResponse.model_validate(
+                created_product)
             return serialized_product
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
@@ -53,34 +44,82 @@ class ProductService:
         - db_session: Текущая сессия базы данных.
 
         Возвращает:
-        - Объект товара, найденный по указанному ID, или исключение 404,
-        если товар не найден.
+        - Товар, найденный по указанному ID (из кэша каталога, если он
+        актуален), или исключение 404, если товар не найден.
         """
         repo = ProductRepository(db_session)
+
+        async def load_product():
+            product = await repo.get_product_by_id(product_id)
+            if product is None:
+                return None
+            return ProductResponse.model_validate(product).model_dump(
+                mode="json")
+
         try:
-            found_product = await repo.get_product_by_id(product_id)
+            found_product = await catalog_cache.get_or_load(
+                "product", load_product, product_id)
             if found_product is None:
                 raise HTTPException(status_code=404, detail="Товар не найден.")
             return found_product
-        except Exception as e:
+        except SQLAlchemyError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     @staticmethod
-    async def retrieve_all_products(db_session):
+    async def retrieve_all_products(db_session, limit: int,
+                                    after_id: int = None,
+                                    category_id: int = None,
+                                    sort_by: ProductSort = ProductSort.ID):
         """
-        Получение списка всех товаров.
+        Получение страницы списка товаров.
 
         Параметры:
         - db_session: Текущая сессия базы данных.
+        - limit (int): Максимальное количество товаров на странице.
+        - after_id (int): ID последнего товара предыдущей страницы.
+        - category_id (int): ID категории для фильтрации товаров.
+        - sort_by (ProductSort): Поле сортировки товаров.
 
         Возвращает:
-        - Список всех имеющихся товаров.
+        - Список товаров выбранной страницы (из кэша каталога,
+        если он актуален).
         """
         repo = ProductRepository(db_session)
         try:
-            products_list = await repo.get_all_products()
+            products_list = await catalog_cache.get_or_load(
+                "products",
+                lambda: repo.get_products_page(
+                    limit, after_id, category_id, sort_by),
+                limit, after_id, category_id, sort_by.value)
             return products_list
-        except Exception as e:
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    @staticmethod
+    async def search_products(db_session, query: str, limit: int,
+                              offset: int = 0):
+        """
+        Полнотекстовый поиск товаров.
+
+        Параметры:
+        - db_session: Текущая сессия базы данных.
+        - query (str): Поисковый запрос.
+        - limit (int): Максимальное количество товаров на странице.
+        - offset (int): Количество пропускаемых результатов.
+
+        Возвращает:
+        - Список найденных товаров по убыванию релевантности (из кэша
+        каталога, если он актуален).
+        """
+        repo = ProductRepository(db_session)
+        query = query.strip()
+        try:
+            products_list = await catalog_cache.get_or_load(
+                "search",
+                lambda: repo.search_products(query, limit, offset),
+                query.lower(), limit, offset)
+            return products_list
+        except SQLAlchemyError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     @staticmethod
@@ -103,7 +142,7 @@ class ProductService:
             if updated_product is None:
                 raise HTTPException(status_code=404, detail="Товар не найден")
             return updated_product
-        except Exception as e:
+        except SQLAlchemyError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
     @staticmethod
@@ -125,5 +164,5 @@ class ProductService:
             if not deleted_result:
                 raise HTTPException(status_code=404, detail="Товар не найден")
             return {"message": f"Товар с id={product_id} успешно удалён."}
-        except Exception as e:
+        except SQLAlchemyError as e:
             raise HTTPException(status_code=400, detail=str(e))
@@ -64,8 +64,7 @@ class UserService:
             user.address = updates.address
         if updates.phone_number:
             user.phone_number = updates.phone_number
-        await db_session.commit()
-        await db_session.refresh(user)
+        await db_session.flush()
         return user
 
     @staticmethod
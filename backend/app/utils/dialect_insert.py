@@ -0,0 +1,15 @@
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+def dialect_insert(session):
+    """
+    Возвращает конструктор INSERT текущей СУБД с поддержкой
+    ON CONFLICT (PostgreSQL или SQLite).
+    """
+    dialect_name = session.bind.dialect.name
+    if dialect_name == "postgresql":
+        return postgresql.insert
+    if dialect_name == "sqlite":
+        return sqlite.insert
+    raise NotImplementedError(
+        f"ON CONFLICT не поддерживается для СУБД {dialect_name}.")
@@ -1,5 +1,129 @@
-import uuid
+import threading
+import time
+from typing import Callable, Optional
 
+from config import ORDER_SHARD_ID
 
-def generate_unique_order_number():
-    return uuid.uuid4().hex[:8].upper()
+# Алфавит Crockford Base32: без I, L, O, U, порядок символов совпадает
+# с порядком их кодов, поэтому строки сортируются как числа
+ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+# Начало отсчёта времени идентификаторов: 2024-01-01 00:00:00 UTC
+EPOCH_MS = 1704067200000
+
+TIMESTAMP_BITS = 41
+SHARD_BITS = 10
+SEQUENCE_BITS = 12
+
+MAX_SHARD_ID = (1 << SHARD_BITS) - 1
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+# 63 бита по 5 бит на символ дают строку фиксированной длины
+NUMBER_LENGTH = 13
+
+
+def encode_base32(value: int, length: int = NUMBER_LENGTH) -> str:
+    """Кодирует число в строку Crockford Base32 фиксированной длины."""
+    chars = []
+    for _ in range(length):
+        value, remainder = divmod(value, 32)
+        chars.append(ALPHABET[remainder])
+    return "".join(reversed(chars))
+
+
+class SnowflakeGenerator:
+    """
+    Генератор номеров заказов в стиле Snowflake.
+
+    Номер состоит из миллисекунд от EPOCH_MS (41 бит), номера шарда
+    (10 бит) и счётчика внутри миллисекунды (12 бит). Номера одного
+    шарда строго возрастают, номера разных шардов не пересекаются,
+    поэтому проверка уникальности перед вставкой не нужна, а новые
+    строки попадают в конец индекса.
+
+    Параметры:
+    - shard_id (int): Номер шарда от 0 до 1023, уникальный для каждого
+    процесса, создающего заказы.
+    - clock (Callable[[], int]): Источник времени в наносекундах.
+    """
+
+    def __init__(self, shard_id: int,
+                 clock: Callable[[], int] = time.time_ns):
+        if not 0 <= shard_id <= MAX_SHARD_ID:
+            raise ValueError(
+                f"Номер шарда должен быть от 0 до {MAX_SHARD_ID}.")
+        self.shard_id = shard_id
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_timestamp = -1
+        self._sequence = 0
+
+    def _now(self) -> int:
+        """Текущее время в миллисекундах от EPOCH_MS."""
+        return self._clock() // 1_000_000 - EPOCH_MS
+
+    def next_id(self) -> int:
+        """
+        Возвращает следующий числовой идентификатор.
+
+        Если часы отстали или счётчик миллисекунды исчерпан, генератор
+        не ждёт, а продолжает с логического времени последнего номера,
+        сохраняя монотонность без блокировки цикла событий.
+        """
+        with self._lock:
+            timestamp = max(self._now(), self._last_timestamp)
+            if timestamp == self._last_timestamp:
+                self._sequence = (self._sequence + 1) & MAX_SEQUENCE
+                if self._sequence == 0:
+                    timestamp += 1
+            else:
+                self._sequence = 0
+            self._last_timestamp = timestamp
+            return ((timestamp << (SHARD_BITS + SEQUENCE_BITS))
+                    | (self.shard_id << SEQUENCE_BITS)
+                    | self._sequence)
+
+    def __call__(self) -> str:
+        """Возвращает следующий номер заказа в виде строки."""
+        return encode_base32(self.next_id())
+
+
+_generator: Optional[Callable[[], str]] = None
+
+
+def create_order_number_generator() -> SnowflakeGenerator:
+    """
+    Создаёт генератор номеров заказов для шарда ORDER_SHARD_ID.
+
+    Номер шарда не выводится автоматически: совпадение номеров у двух
+    процессов приводит к одинаковым номерам заказов.
+    """
+    if not ORDER_SHARD_ID:
+        raise RuntimeError(
+            "Не задан ORDER_SHARD_ID: укажите номер шарда от 0 до "
+            f"{MAX_SHARD_ID}, уникальный для каждого процесса.")
+    return SnowflakeGenerator(int(ORDER_SHARD_ID))
+
+
+def init_order_number_generator() -> None:
+    """
+    Создаёт генератор по настройкам, если он ещё не задан.
+
+    Вызывается при запуске приложения, чтобы отсутствие ORDER_SHARD_ID
+    обнаруживалось сразу, а не при первом заказе.
+    """
+    global _generator
+    if _generator is None:
+        _generator = create_order_number_generator()
+
+
+def set_order_number_generator(generator: Callable[[], str]) -> None:
+    """Заменяет генератор номеров заказов, например на аллокатор блоков."""
+    global _generator
+    _generator = generator
+
+
+def generate_unique_order_number() -> str:
+    """Возвращает номер нового заказа от текущего генератора."""
+    init_order_number_generator()
+    return _generator()
@@ -0,0 +1,64 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Тесты работают с отдельной базой SQLite; переменные окружения должны
+# быть заданы до импорта config
+DB_PATH = Path(tempfile.mkdtemp()) / "test.db"
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ["CACHE_BACKEND"] = "memory"
+os.environ["DEBUG"] = "true"
+os.environ.setdefault("ORDER_SHARD_ID", "1")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from sqlalchemy import text  # noqa: E402
+
+from cache.catalog import catalog_cache  # noqa: E402
+from database import Base, SessionLocal, engine  # noqa: E402
+from models import (associations, cart, category, order,  # noqa: E402,F401
+                    product, user)
+
+CATEGORIES = ((1, "Посуда"), (2, "Техника"))
+PRODUCTS_COUNT = 30
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def database():
+    """
+    Чистая база с каталогом: две категории и PRODUCTS_COUNT товаров
+    с ценой 10 × ID.
+    """
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        for category_id, name in CATEGORIES:
+            await conn.execute(
+                text("INSERT INTO categories (id, name) VALUES (:id, :name)"),
+                {"id": category_id, "name": name})
+        for product_id in range(1, PRODUCTS_COUNT + 1):
+            await conn.execute(
+                text("INSERT INTO products "
+                     "(id, name, description, price, category_id) "
+                     "VALUES (:id, :name, :description, :price, :category)"),
+                {"id": product_id, "name": f"Товар {product_id}",
+                 "description": "Описание", "price": product_id * 10,
+                 "category": 1 if product_id % 2 else 2})
+    await catalog_cache.invalidate()
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(database):
+    """Сессия базы данных для вызова репозиториев напрямую."""
+    async with SessionLocal() as db_session:
+        yield db_session
@@ -0,0 +1,97 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from main import app
+
+pytestmark = pytest.mark.anyio
+
+CHAT_ID = 3003
+
+
+@pytest.fixture
+async def client(database):
+    """HTTP-клиент, вызывающий приложение напрямую через ASGI."""
+    async with AsyncClient(transport=ASGITransport(app=app),
+                           base_url="http://test") as http_client:
+        yield http_client
+
+
+async def patch_cart(client, *operations, chat_id=CHAT_ID):
+    return await client.patch(f"/item-cart/{chat_id}", json={
+        "operations": [
+            {"op": op, "product_id": product_id, "quantity": quantity}
+            for op, product_id, quantity in operations
+        ]})
+
+
+def lines(cart):
+    """Строки корзины: ID товара → (количество, сумма)."""
+    return {item["product"]["id"]: (item["quantity"], item["total_price"])
+            for item in cart["cart_items"]}
+
+
+async def current_cart(client):
+    response = await client.get(f"/item-cart/{CHAT_ID}")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture
+async def filled_cart(client):
+    """Корзина с товарами 1, 2 и 3 (цена товара — 10 × ID)."""
+    response = await patch_cart(client, ("add", 1, 2), ("add", 2, 1),
+                                ("add", 3, 1))
+    assert response.status_code == 200, response.text
+    return client
+
+
+async def test_batch_creates_cart_for_new_user(client):
+    response = await patch_cart(client, ("add", 5, 2), ("set", 6, 1))
+
+    assert response.status_code == 200, response.text
+    assert lines(response.json()) == {5: (2, 100.0), 6: (1, 60.0)}
+    assert response.json()["grand_total"] == 160.0
+
+
+async def test_set_add_and_remove(filled_cart):
+    """
+    add прибавляет к имеющейся строке, set заменяет количество,
+    remove и set 0 удаляют строку; суммы пересчитываются по цене.
+    """
+    response = await patch_cart(
+        filled_cart, ("add", 1, 3), ("set", 2, 4), ("remove", 3, 1),
+        ("add", 4, 2), ("set", 5, 0))
+
+    assert response.status_code == 200, response.text
+    cart = response.json()
+    assert lines(cart) == {1: (5, 50.0), 2: (4, 80.0), 4: (2, 80.0)}
+    assert cart["grand_total"] == 210.0
+    assert lines(await current_cart(filled_cart)) == lines(cart)
+
+
+async def test_operations_apply_in_order(filled_cart):
+    response = await patch_cart(
+        filled_cart, ("remove", 1, 1), ("add", 1, 3), ("set", 2, 5),
+        ("add", 2, 1), ("add", 3, 2), ("set", 3, 0))
+
+    assert response.status_code == 200, response.text
+    assert lines(response.json()) == {1: (3, 30.0), 2: (6, 120.0)}
+
+
+async def test_unknown_product_rolls_back_batch(filled_cart):
+    """Неизвестный товар отменяет весь пакет и даёт 400."""
+    before = lines(await current_cart(filled_cart))
+
+    response = await patch_cart(
+        filled_cart, ("remove", 1, 1), ("set", 2, 9), ("add", 999, 1))
+
+    assert response.status_code == 400
+    assert "999" in response.json()["detail"]
+    assert lines(await current_cart(filled_cart)) == before
+
+
+async def test_empty_batch_is_rejected(client):
+    response = await client.patch(f"/item-cart/{CHAT_ID}",
+                                  json={"operations": []})
+
+    assert response.status_code == 422
@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from enums.cart_operation import CartOperationType
+from repositories.cart_repository import CartRepository
+from schemas.cart import CartOperation
+
+ADD, SET, REMOVE = (CartOperationType.ADD, CartOperationType.SET,
+                    CartOperationType.REMOVE)
+
+
+def operation(op, product_id, quantity=1):
+    return CartOperation(op=op, product_id=product_id, quantity=quantity)
+
+
+def apply_sequentially(cart, operations):
+    """Эталон: применяет операции к корзине по одной."""
+    cart = dict(cart)
+    for item in operations:
+        if item.op is REMOVE or item.op is SET and item.quantity == 0:
+            cart.pop(item.product_id, None)
+        elif item.op is SET:
+            cart[item.product_id] = item.quantity
+        elif item.quantity:
+            cart[item.product_id] = (cart.get(item.product_id, 0)
+                                     + item.quantity)
+    return cart
+
+
+def apply_folded(cart, operations):
+    """Применяет свёрнутые операции так же, как apply_operations."""
+    removed, set_quantities, added_quantities = (
+        CartRepository._fold_operations(operations))
+    cart = {product_id: quantity for product_id, quantity in cart.items()
+            if product_id not in removed}
+    cart.update(set_quantities)
+    for product_id, quantity in added_quantities.items():
+        cart[product_id] = cart.get(product_id, 0) + quantity
+    return cart
+
+
+@pytest.mark.parametrize("operations, expected", [
+    ([operation(ADD, 1, 2), operation(ADD, 1, 3)], ([], {}, {1: 5})),
+    ([operation(SET, 1, 2), operation(ADD, 1, 3)], ([], {1: 5}, {})),
+    ([operation(ADD, 1, 2), operation(SET, 1, 4)], ([], {1: 4}, {})),
+    ([operation(ADD, 1, 2), operation(REMOVE, 1)], ([1], {}, {})),
+    ([operation(REMOVE, 1), operation(ADD, 1, 3)], ([], {1: 3}, {})),
+    ([operation(REMOVE, 1), operation(ADD, 1, 0)], ([1], {}, {})),
+    ([operation(SET, 1, 0)], ([1], {}, {})),
+    ([operation(ADD, 1, 0)], ([], {}, {})),
+    ([operation(ADD, 1), operation(SET, 2, 3), operation(REMOVE, 3)],
+     ([3], {2: 3}, {1: 1})),
+])
+def test_fold_operations(operations, expected):
+    assert CartRepository._fold_operations(operations) == expected
+
+
+def test_folded_operations_match_sequential_application():
+    """Свёрнутые операции дают ту же корзину, что и поочерёдные."""
+    rng = random.Random(20)
+    for _ in range(500):
+        cart = {product_id: rng.randint(1, 5)
+                for product_id in rng.sample(range(1, 6), rng.randint(0, 5))}
+        operations = [
+            operation(rng.choice((ADD, SET, REMOVE)), rng.randint(1, 5),
+                      rng.randint(0, 3))
+            for _ in range(rng.randint(1, 8))
+        ]
+        assert (apply_folded(cart, operations)
+                == apply_sequentially(cart, operations)), operations
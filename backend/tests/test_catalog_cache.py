@@ -0,0 +1,98 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from cache.backends import MemoryCacheBackend
+from cache.catalog import catalog_cache, invalidate_if_changed
+from main import app
+from models.product import Product
+from models.user import User
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_orm_commit_bumps_version(session):
+    """
+    Коммит сессии с изменённым товаром меняет версию каталога, даже если
+    изменение сделано в обход репозиториев, как в админ-панели.
+    """
+    version = await catalog_cache.get_version()
+    product = await session.get(Product, 1)
+    product.price = 999
+    await session.commit()
+    await invalidate_if_changed(session)
+
+    assert await catalog_cache.get_version() > version
+
+
+async def test_unrelated_commit_keeps_version(session):
+    """Изменения вне каталога и откаченные изменения версию не меняют."""
+    version = await catalog_cache.get_version()
+    session.add(User(first_name="Иван", address="Москва",
+                     phone_number="79990000000", chat_id=1))
+    await session.commit()
+    await invalidate_if_changed(session)
+
+    product = await session.get(Product, 1)
+    product.price = 999
+    await session.flush()
+    await session.rollback()
+    await session.commit()
+    await invalidate_if_changed(session)
+
+    assert await catalog_cache.get_version() == version
+
+
+@pytest.fixture
+async def client(database):
+    async with AsyncClient(transport=ASGITransport(app=app),
+                           base_url="http://test") as http_client:
+        yield http_client
+
+
+async def test_etag_and_not_modified(client):
+    """
+    Совпадающий If-None-Match даёт 304 без запросов к базе, а после
+    изменения каталога — новые данные и новый ETag.
+    """
+    response = await client.get("/products/")
+    etag = response.headers["etag"]
+
+    response = await client.get("/products/",
+                                headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["x-db-statements"] == "0"
+
+    response = await client.put("/products/1/", json={
+        "name": "Чайник", "description": "Стальной", "price": 1500})
+    assert response.status_code == 200
+
+    response = await client.get("/products/",
+                                headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()[0]["name"] == "Чайник"
+
+
+async def test_etags_can_be_disabled(client, monkeypatch):
+    """При CATALOG_ETAGS=false ETag не выдаётся и 304 не бывает."""
+    monkeypatch.setattr("dependencies.CATALOG_ETAGS", False)
+
+    response = await client.get("/products/", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
+async def test_memory_backend_incr_keeps_ttl(monkeypatch):
+    """Увеличение версии сохраняет срок жизни ключа."""
+    now = [0.0]
+    monkeypatch.setattr("cache.backends.time.monotonic", lambda: now[0])
+    backend = MemoryCacheBackend(max_size=10)
+    await backend.add("version", 5, 10)
+
+    now[0] = 5.0
+    assert await backend.incr("version") == 6
+    assert await backend.get("version") == 6
+
+    now[0] = 11.0
+    assert await backend.get("version") is None
@@ -0,0 +1,47 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from main import app
+
+pytestmark = pytest.mark.anyio
+
+MISSING_ID = 999
+
+
+@pytest.fixture
+async def client(database):
+    """HTTP-клиент, вызывающий приложение напрямую через ASGI."""
+    async with AsyncClient(transport=ASGITransport(app=app),
+                           base_url="http://test") as http_client:
+        yield http_client
+
+
+@pytest.mark.parametrize("method, url", [
+    ("GET", f"/categories/{MISSING_ID}"),
+    ("GET", f"/categories/{MISSING_ID}/products"),
+    ("PUT", f"/categories/{MISSING_ID}/?new_name=Новая"),
+    ("DELETE", f"/categories/{MISSING_ID}/"),
+])
+async def test_unknown_category_is_404(client, method, url):
+    """Неизвестная категория даёт 404, а не 400 с текстом ошибки 404."""
+    response = await client.request(method, url)
+
+    assert response.status_code == 404
+    assert response.json()["detail"].startswith("Категория не найдена")
+
+
+async def test_empty_category_products(client):
+    """Пустая существующая категория возвращает пустую страницу."""
+    response = await client.post("/categories/", json={"name": "Пустая"})
+    category_id = response.json()["id"]
+
+    response = await client.get(f"/categories/{category_id}/products")
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+async def test_delete_non_empty_category(client):
+    response = await client.delete("/categories/1/")
+
+    assert response.status_code == 409
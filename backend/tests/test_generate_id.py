@@ -0,0 +1,51 @@
+import pytest
+
+from utils import generate_id
+from utils.generate_id import (MAX_SEQUENCE, NUMBER_LENGTH,
+                               SnowflakeGenerator)
+
+# 2025-01-01 00:00:00 UTC в наносекундах
+NOW_NS = 1735689600 * 10**9
+
+
+def test_numbers_increase_within_millisecond():
+    """Номера одной миллисекунды возрастают и сортируются как строки."""
+    generator = SnowflakeGenerator(7, clock=lambda: NOW_NS)
+    numbers = [generator() for _ in range(1000)]
+
+    assert numbers == sorted(numbers)
+    assert len(set(numbers)) == len(numbers)
+    assert all(len(number) == NUMBER_LENGTH for number in numbers)
+
+
+def test_numbers_increase_when_clock_goes_back():
+    """Отставание часов и переполнение счётчика не нарушают порядок."""
+    ticks = iter([NOW_NS] * (MAX_SEQUENCE + 2)
+                 + [NOW_NS - 5 * 10**6] * 10 + [NOW_NS + 10**6] * 10)
+    generator = SnowflakeGenerator(7, clock=lambda: next(ticks))
+    ids = [generator.next_id() for _ in range(MAX_SEQUENCE + 22)]
+
+    assert all(left < right for left, right in zip(ids, ids[1:]))
+
+
+def test_shards_do_not_collide():
+    """Разные шарды в одну миллисекунду выдают разные номера."""
+    first = SnowflakeGenerator(1, clock=lambda: NOW_NS)
+    second = SnowflakeGenerator(2, clock=lambda: NOW_NS)
+
+    assert first() != second()
+
+
+def test_shard_id_is_required(monkeypatch):
+    """Без ORDER_SHARD_ID генератор по умолчанию не создаётся."""
+    monkeypatch.setattr(generate_id, "ORDER_SHARD_ID", None)
+    monkeypatch.setattr(generate_id, "_generator", None)
+
+    with pytest.raises(RuntimeError):
+        generate_id.init_order_number_generator()
+
+
+@pytest.mark.parametrize("shard_id", [-1, 1024])
+def test_shard_id_range(shard_id):
+    with pytest.raises(ValueError):
+        SnowflakeGenerator(shard_id)
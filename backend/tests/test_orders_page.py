@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from enums.status import Status
+from models.order import Order
+from models.user import User
+from repositories.order_repository import OrderRepository
+
+pytestmark = pytest.mark.anyio
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0)
+ORDERS_COUNT = 12
+STATUSES = (Status.NEW, Status.IN_PROGRESS, Status.SENT)
+
+
+@pytest.fixture
+async def orders(session):
+    """
+    Заказы двух пользователей: каждые два заказа созданы в одну минуту,
+    чтобы порядок внутри одинакового created_at задавал ID.
+    """
+    session.add_all([User(id=user_id, chat_id=user_id) for user_id in (1, 2)])
+    await session.flush()
+    session.add_all([
+        Order(id=order_id, user_id=1 + order_id % 2,
+              status=STATUSES[order_id % len(STATUSES)], total_amount=0,
+              created_at=BASE_TIME + timedelta(minutes=order_id // 2))
+        for order_id in range(1, ORDERS_COUNT + 1)
+    ])
+    await session.commit()
+    return OrderRepository(session)
+
+
+def expected_order(order_ids):
+    """ID заказов от новых к старым по (created_at, id)."""
+    return sorted(order_ids, key=lambda order_id: (order_id // 2, order_id),
+                  reverse=True)
+
+
+def ids(page):
+    return [order.id for order in page]
+
+
+async def test_newest_first(orders):
+    page = await orders.get_orders_page(ORDERS_COUNT)
+
+    assert ids(page) == expected_order(range(1, ORDERS_COUNT + 1))
+    assert ids(page)[:3] == [12, 11, 10]
+
+
+async def test_pages_have_no_gaps_or_duplicates(orders):
+    """Обход страницами по курсору after_id выдаёт каждый заказ один раз."""
+    collected, after_id = [], None
+    while True:
+        page = await orders.get_orders_page(5, after_id=after_id)
+        if not page:
+            break
+        collected += ids(page)
+        after_id = page[-1].id
+
+    assert collected == expected_order(range(1, ORDERS_COUNT + 1))
+
+
+async def test_cursor_inside_equal_timestamps(orders):
+    """Курсор на первом из заказов с одинаковым временем не теряет второй."""
+    page = await orders.get_orders_page(3, after_id=9)
+
+    assert ids(page) == [8, 7, 6]
+
+
+@pytest.mark.parametrize("kwargs, predicate", [
+    ({"statuses": [Status.SENT]},
+     lambda order_id: STATUSES[order_id % 3] is Status.SENT),
+    ({"statuses": [Status.NEW, Status.IN_PROGRESS]},
+     lambda order_id: STATUSES[order_id % 3] is not Status.SENT),
+    ({"user_id": 2}, lambda order_id: order_id % 2 == 1),
+    ({"created_from": BASE_TIME + timedelta(minutes=2),
+      "created_to": BASE_TIME + timedelta(minutes=4)},
+     lambda order_id: 2 <= order_id // 2 < 4),
+])
+async def test_filters(orders, kwargs, predicate):
+    matching = [order_id for order_id in range(1, ORDERS_COUNT + 1)
+                if predicate(order_id)]
+    collected, after_id = [], None
+    while True:
+        page = await orders.get_orders_page(2, after_id=after_id, **kwargs)
+        if not page:
+            break
+        collected += ids(page)
+        after_id = page[-1].id
+
+    assert collected == expected_order(matching)
+
+
+async def test_unknown_cursor_returns_empty_page(orders):
+    assert await orders.get_orders_page(5, after_id=999) == []
@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from database import MonitoredQueuePool
+
+pytestmark = pytest.mark.anyio
+
+# Сколько держится занятое соединение, пока следующий запрос ждёт в очереди
+HOLD_SECONDS = 0.2
+
+
+@pytest.fixture
+async def pool_engine(tmp_path):
+    """Движок с пулом из двух соединений без переполнения."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MonitoredQueuePool, pool_size=2, max_overflow=0,
+        pool_timeout=5)
+    yield engine
+    await engine.dispose()
+
+
+async def hold_connection(engine, seconds: float) -> float:
+    """Занимает соединение на заданное время; возвращает время выдачи."""
+    started = time.perf_counter()
+    async with engine.connect():
+        acquired = time.perf_counter() - started
+        await asyncio.sleep(seconds)
+    return acquired
+
+
+async def test_free_checkouts_are_not_waits(pool_engine):
+    """Выдачи в пределах pool_size не считаются ожиданием."""
+    for _ in range(5):
+        await hold_connection(pool_engine, 0)
+    await asyncio.gather(*(hold_connection(pool_engine, 0.01)
+                           for _ in range(2)))
+
+    stats = pool_engine.pool.stats()
+    assert stats["checkout_count"] == 7
+    assert stats["wait_count"] == 0
+    assert stats["wait_time_total"] == 0.0
+
+
+async def test_queued_checkout_wait_is_measured(pool_engine):
+    """Запрос сверх пула ждёт освобождения, и это ожидание учитывается."""
+    holders = [asyncio.create_task(hold_connection(pool_engine,
+                                                   HOLD_SECONDS))
+               for _ in range(2)]
+    await asyncio.sleep(0.05)
+    acquired = await hold_connection(pool_engine, 0)
+    await asyncio.gather(*holders)
+
+    stats = pool_engine.pool.stats()
+    print(f"\nожидание соединения: {acquired * 1000:.1f} мс, "
+          f"учтено пулом: {stats['wait_time_max'] * 1000:.1f} мс")
+    assert stats["checkout_count"] == 3
+    assert stats["wait_count"] == 1
+    assert stats["wait_time_max"] >= HOLD_SECONDS / 2
+    assert stats["wait_time_max"] <= acquired
+    assert stats["wait_time_total"] == stats["wait_time_max"]
@@ -0,0 +1,42 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from main import app
+
+pytestmark = pytest.mark.anyio
+
+MISSING_ID = 999
+PRODUCT = {"name": "Чайник", "description": "Стальной", "price": 1500}
+
+
+@pytest.fixture
+async def client(database):
+    """HTTP-клиент, вызывающий приложение напрямую через ASGI."""
+    async with AsyncClient(transport=ASGITransport(app=app),
+                           base_url="http://test") as http_client:
+        yield http_client
+
+
+@pytest.mark.parametrize("method, url, payload", [
+    ("GET", f"/products/{MISSING_ID}", None),
+    ("PUT", f"/products/{MISSING_ID}/", PRODUCT),
+    ("DELETE", f"/products/{MISSING_ID}/", None),
+])
+async def test_unknown_product_is_404(client, method, url, payload):
+    """Чтение, изменение и удаление неизвестного товара дают 404."""
+    response = await client.request(method, url, json=payload)
+
+    assert response.status_code == 404
+    assert response.json()["detail"].startswith("Товар не найден")
+
+
+async def test_update_and_delete_product(client):
+    response = await client.put("/products/1/", json=PRODUCT)
+    assert response.status_code == 200
+    assert response.json()["name"] == "Чайник"
+
+    response = await client.delete("/products/1/")
+    assert response.status_code == 200
+
+    response = await client.delete("/products/1/")
+    assert response.status_code == 404
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from enums.product_sort import ProductSort
+from enums.status import Status
+from repositories.cart_repository import CartRepository
+from repositories.category_repository import CategoryRepository
+from repositories.order_repository import OrderRepository
+from repositories.product_repository import ProductRepository
+from repositories.user_repository import UserRepository
+from schemas.cart import CartItemCreate
+from schemas.order import OrderCreate
+from services.order_service import OrderService
+
+pytestmark = pytest.mark.anyio
+
+CHAT_ID = 1001
+
+# Строки плана SQLite с полным просмотром, допустимые в горячих запросах
+ALLOWED_SCANS = ("SCAN CONSTANT ROW", "VIRTUAL TABLE")
+
+
+async def place_order(session):
+    """Оформляет заказ, чтобы запросы к заказам возвращали строки."""
+    carts = CartRepository(session)
+    for product_id in (3, 4):
+        await carts.add_to_cart(CartItemCreate(
+            chat_id=CHAT_ID, product_id=product_id, quantity=2))
+    await OrderService.create_order(OrderCreate(
+        first_name="Иван", address="Москва", phone_number="79990000000",
+        chat_id=CHAT_ID), session)
+    await carts.add_to_cart(CartItemCreate(
+        chat_id=CHAT_ID, product_id=5, quantity=1))
+
+
+async def hot_queries(session):
+    """Вызывает репозиторные методы горячих путей API."""
+    products = ProductRepository(session)
+    await products.get_product_by_id(5)
+    await products.get_products_page(10, after_id=4)
+    await products.get_products_page(10, after_id=4, category_id=2)
+    await products.get_products_page(10, after_id=4,
+                                     sort_by=ProductSort.PRICE)
+    await products.search_products("товар", 10)
+
+    categories = CategoryRepository(session)
+    await categories.get_category_by_id(1)
+    await categories.has_products(1)
+
+    users = UserRepository(session)
+    await users.get_user_by_chat_id(CHAT_ID)
+
+    carts = CartRepository(session)
+    await carts.get_cart_items_by_user_id(CHAT_ID)
+    await carts.find_cart_item_by_product(CHAT_ID, 3)
+
+    await carts.take_cart_items(CHAT_ID)
+
+    orders = OrderRepository(session)
+    await orders.get_order_by_id(1)
+    await orders.list_orders_by_user_id(1)
+    now = datetime.now(timezone.utc)
+    await orders.get_orders_page(10, after_id=1)
+    await orders.get_orders_page(10, statuses=[Status.NEW])
+    await orders.get_orders_page(10, user_id=1)
+    await orders.get_orders_page(10, created_from=now - timedelta(days=1))
+
+
+def sequential_scans(plan):
+    """Строки плана с полным просмотром таблицы без индекса."""
+    return [
+        line for line in plan
+        if line.startswith("SCAN ")
+        and not any(allowed in line for allowed in ALLOWED_SCANS)
+    ]
+
+
+async def test_hot_queries_use_indexes(session, database):
+    """
+    Каждый запрос горячих путей выполняется по индексу: EXPLAIN QUERY
+    PLAN не должен содержать полного просмотра таблицы.
+    """
+    await place_order(session)
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(
+                ("SELECT", "UPDATE", "DELETE")):
+            captured.append((statement, parameters))
+
+    event.listen(database.sync_engine, "before_cursor_execute", capture)
+    try:
+        await hot_queries(session)
+    finally:
+        event.remove(database.sync_engine, "before_cursor_execute", capture)
+
+    assert len(captured) >= 20
+    failures = []
+    for statement, parameters in captured:
+        connection = await session.connection()
+        plan = [row[-1] for row in await connection.exec_driver_sql(
+            "EXPLAIN QUERY PLAN " + statement, parameters)]
+        if sequential_scans(plan):
+            failures.append(f"{' '.join(statement.split())}\n  {plan}")
+    assert not failures, "Запросы без индекса:\n" + "\n".join(failures)
@@ -0,0 +1,122 @@
+import json
+
+import pytest
+
+from cache.backends import RedisCacheBackend
+from cache.catalog import VERSION_KEY, CatalogCache
+
+pytestmark = pytest.mark.anyio
+
+TTL = 10
+
+
+class FakeRedis:
+    """
+    Клиент Redis в памяти с командами, которые использует
+    RedisCacheBackend: значения хранятся строками, срок жизни считается
+    по управляемым часам, INCR сохраняет срок жизни ключа.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.data = {}
+        self.closed = False
+
+    def _alive(self, key):
+        entry = self.data.get(key)
+        if entry is None or entry[1] is None or entry[1] > self.now:
+            return entry
+        del self.data[key]
+        return None
+
+    async def get(self, key):
+        entry = self._alive(key)
+        return None if entry is None else entry[0].encode()
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and self._alive(key) is not None:
+            return None
+        expires_at = self.now + ex if ex is not None else None
+        self.data[key] = (value, expires_at)
+        return True
+
+    async def incr(self, key):
+        entry = self._alive(key)
+        value, expires_at = entry if entry is not None else ("0", None)
+        value = int(json.loads(value)) + 1
+        self.data[key] = (str(value), expires_at)
+        return value
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(redis):
+    return CatalogCache(RedisCacheBackend("redis://fake", client=redis), TTL)
+
+
+class Loader:
+    """Загрузчик, считающий обращения к базе данных."""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+async def test_values_round_trip_through_json(redis):
+    backend = RedisCacheBackend("redis://fake", client=redis)
+    await backend.set("key", {"name": "Ёлка", "ids": [1, 2]}, TTL)
+
+    assert await backend.get("key") == {"name": "Ёлка", "ids": [1, 2]}
+    assert await backend.add("key", 1, TTL) is False
+    await backend.close()
+    assert redis.closed
+
+
+async def test_versioned_keys_and_invalidation(cache, redis):
+    """Записи читаются по текущей версии; сброс меняет версию."""
+    loader = Loader([{"id": 1}])
+
+    assert await cache.get_or_load("products", loader, 50) == [{"id": 1}]
+    assert await cache.get_or_load("products", loader, 50) == [{"id": 1}]
+    assert loader.calls == 1
+    version = await cache.get_version()
+    assert any(key.startswith(f"catalog:{version}:products")
+               for key in redis.data)
+
+    await cache.invalidate()
+
+    assert await cache.get_version() == version + 1
+    await cache.get_or_load("products", loader, 50)
+    assert loader.calls == 2
+
+
+async def test_none_is_not_cached(cache):
+    loader = Loader(None)
+
+    await cache.get_or_load("product", loader, 1)
+    await cache.get_or_load("product", loader, 1)
+
+    assert loader.calls == 2
+
+
+async def test_version_expires_with_ttl(cache, redis):
+    """Версия живёт TTL, увеличение версии срок жизни не продлевает."""
+    version = await cache.get_version()
+    redis.now = TTL / 2
+    await cache.invalidate()
+    assert await cache.get_version() == version + 1
+
+    redis.now = TTL + 1
+    assert await redis.get(VERSION_KEY) is None
+    assert await cache.get_version() not in (version, version + 1)
@@ -0,0 +1,97 @@
+import statistics
+import time
+
+import pytest
+from sqlalchemy import text
+
+from repositories.product_repository import ProductRepository
+
+pytestmark = pytest.mark.anyio
+
+# Размер каталога и число повторов в замере времени поиска
+LARGE_CATALOG_SIZE = 20000
+SEARCH_REPEATS = 20
+LARGE_CATALOG_WORDS = ("Чайник", "Кружка", "Тарелка", "Сковорода", "Нож")
+
+
+async def names(session, query):
+    products = await ProductRepository(session).search_products(query, 10)
+    return [product["name"] for product in products]
+
+
+@pytest.fixture
+async def catalog(session):
+    """Товары с ё и е в названиях и описаниях."""
+    await session.execute(text(
+        "INSERT INTO products (id, name, description, price, category_id) "
+        "VALUES (101, 'Ёлка искусственная', 'Зелёная, 180 см', 5000, 1), "
+        "(102, 'Елочные игрушки', 'Набор шаров', 900, 1), "
+        "(103, 'Шарф', 'Тёплый шерстяной', 1500, 2)"))
+    await session.commit()
+    return session
+
+
+@pytest.mark.parametrize("query", ["елка", "ёлка", "ЕЛКА", "Ёлк"])
+async def test_yo_and_ye_are_equal(catalog, query):
+    """Поиск не различает ё и е ни в запросе, ни в названии."""
+    assert await names(catalog, query) == ["Ёлка искусственная"]
+
+
+async def test_yo_prefix(catalog):
+    assert set(await names(catalog, "ел")) == {
+        "Ёлка искусственная", "Елочные игрушки"}
+
+
+async def test_yo_in_description(catalog):
+    assert await names(catalog, "зеленая") == ["Ёлка искусственная"]
+    assert await names(catalog, "теплый") == ["Шарф"]
+
+
+async def test_index_follows_updates_and_deletes(catalog):
+    """Триггеры обновляют индекс при изменении и удалении товара."""
+    await catalog.execute(text(
+        "UPDATE products SET name = 'Ёж садовый' WHERE id = 101"))
+    await catalog.execute(text("DELETE FROM products WHERE id = 103"))
+    await catalog.commit()
+
+    assert await names(catalog, "еж") == ["Ёж садовый"]
+    assert await names(catalog, "елка") == []
+    assert await names(catalog, "шарф") == []
+
+
+async def median_seconds(run) -> float:
+    """Медиана времени выполнения корутины за SEARCH_REPEATS запусков."""
+    timings = []
+    for _ in range(SEARCH_REPEATS):
+        started = time.perf_counter()
+        await run()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+async def test_search_is_faster_than_scan(catalog):
+    """На большом каталоге поиск по FTS быстрее просмотра таблицы LIKE."""
+    await catalog.execute(text(
+        "INSERT INTO products (id, name, description, price, category_id) "
+        "VALUES (:id, :name, :description, 100, 1)"), [
+        {"id": 1000 + number,
+         "name": f"{LARGE_CATALOG_WORDS[number % 5]} модель {number}",
+         "description": f"Серия {number % 97}"}
+        for number in range(LARGE_CATALOG_SIZE)])
+    await catalog.commit()
+    products = ProductRepository(catalog)
+
+    async def search():
+        assert len(await products.search_products("ёлка", 10)) == 1
+
+    async def scan():
+        result = await catalog.execute(text(
+            "SELECT id FROM products WHERE name LIKE '%Ёлк%' "
+            "OR description LIKE '%Ёлк%' LIMIT 10"))
+        assert len(result.all()) == 1
+
+    search_time = await median_seconds(search)
+    scan_time = await median_seconds(scan)
+    print(f"\nпоиск по {LARGE_CATALOG_SIZE} товарам: FTS "
+          f"{search_time * 1000:.2f} мс, LIKE {scan_time * 1000:.2f} мс")
+    assert search_time < scan_time
@@ -0,0 +1,68 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from main import app
+
+pytestmark = pytest.mark.anyio
+
+CHAT_ID = 2002
+CART_PRODUCTS = (2, 3, 4)
+
+
+@pytest.fixture
+async def client(database):
+    """HTTP-клиент, вызывающий приложение напрямую через ASGI."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport,
+                           base_url="http://test") as http_client:
+        yield http_client
+
+
+async def fill_cart(client):
+    """Кладёт в корзину несколько товаров."""
+    for product_id in CART_PRODUCTS:
+        response = await client.post("/item-cart/", json={
+            "chat_id": CHAT_ID, "product_id": product_id, "quantity": 2})
+        assert response.status_code == 200, response.text
+
+
+def statements(response):
+    """Количество SQL-запросов, выполненных при обработке запроса."""
+    return int(response.headers["x-db-statements"])
+
+
+async def test_products_list(client):
+    """Страница каталога — один запрос, повторная отдаётся из кэша."""
+    response = await client.get("/products/")
+    assert response.status_code == 200
+    assert statements(response) == 1
+
+    response = await client.get("/products/")
+    assert response.status_code == 200
+    assert statements(response) == 0
+
+
+async def test_cart_items(client):
+    """Содержимое корзины с товарами читается одним запросом."""
+    await fill_cart(client)
+
+    response = await client.get(f"/item-cart/{CHAT_ID}")
+    assert response.status_code == 200
+    assert statements(response) == 1
+
+
+async def test_create_order(client):
+    """
+    Оформление заказа: пользователь, забор корзины, цены товаров,
+    вставка заказа и строк одним executemany, загрузка заказа
+    с двумя selectin-запросами — число запросов не зависит от размера
+    корзины.
+    """
+    await fill_cart(client)
+
+    response = await client.post("/orders/", json={
+        "first_name": "Иван", "address": "Москва",
+        "phone_number": "79990000000", "chat_id": CHAT_ID})
+    assert response.status_code == 200, response.text
+    assert len(response.json()["items"]) == len(CART_PRODUCTS)
+    assert statements(response) == 8
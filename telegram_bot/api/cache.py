@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogCache:
+    """
+    Кэш каталога с ограниченным временем жизни и вытеснением LRU.
+
+    Свежие записи отдаются без обращения к API. Устаревшие записи
+    в пределах stale_ttl отдаются сразу, а обновляются в фоне.
+    Одновременные запросы одного ключа загружаются один раз. Пустые
+    ответы не кэшируются: они могут означать сбой API.
+    """
+
+    def __init__(self, ttl, stale_ttl, max_size):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._loading = {}
+        self._generation = 0
+
+    async def get_or_load(self, key, loader):
+        """Возвращает значение из кэша или загружает его через loader."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.monotonic() - stored_at
+            if age < self.ttl + self.stale_ttl:
+                self._entries.move_to_end(key)
+                if age < self.ttl:
+                    self.hits += 1
+                else:
+                    self.stale_hits += 1
+                    self._load(key, loader)
+                return value
+        self.misses += 1
+        return await asyncio.shield(self._load(key, loader))
+
+    def _load(self, key, loader):
+        """Запускает загрузку ключа, если она ещё не идёт."""
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._load_and_store(key, loader, self._generation))
+            self._loading[key] = task
+            task.add_done_callback(lambda _: self._loading.pop(key, None))
+        return task
+
+    async def _load_and_store(self, key, loader, generation):
+        value = await loader()
+        if not value:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else value
+        if generation == self._generation:
+            self._store(key, value)
+        return value
+
+    def _store(self, key, value):
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key=None):
+        """
+        Удаляет запись по ключу или весь кэш целиком.
+
+        Загрузки, начатые до полной очистки, не сохраняют результат.
+        """
+        if key is None:
+            self._entries.clear()
+            self._generation += 1
+        else:
+            self._entries.pop(key, None)
+        logger.info('Кэш каталога сброшен: %s', key or 'все записи')
+
+    def stats(self):
+        """Счётчики попаданий и промахов кэша."""
+        return {
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+        }
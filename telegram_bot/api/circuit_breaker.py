@@ -0,0 +1,59 @@
+import time
+
+
+class CircuitBreaker:
+    """
+    Автоматический выключатель запросов к API.
+
+    После серии подряд идущих сбоев выключатель размыкается, и запросы
+    отклоняются сразу, не дожидаясь таймаута. По истечении паузы
+    пропускается один пробный запрос: при успехе выключатель замыкается,
+    при сбое снова размыкается.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow_request(self):
+        """Проверяет, можно ли сейчас отправить запрос."""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self):
+        """Отмечает успешный запрос и замыкает выключатель."""
+        self.state = self.CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def release_probe(self):
+        """
+        Снимает отметку пробного запроса, не меняя состояние: запрос
+        прерван по причине, не связанной с API.
+        """
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        """Отмечает сбой и при необходимости размыкает выключатель."""
+        self._failures += 1
+        self._probe_in_flight = False
+        if (self.state == self.HALF_OPEN
+                or self._failures >= self.failure_threshold):
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
@@ -0,0 +1,320 @@
+import asyncio
+import logging
+import random
+from collections import OrderedDict
+from typing import Any, Optional
+
+import aiohttp
+
+from api.cache import CatalogCache
+from api.circuit_breaker import CircuitBreaker
+from api.request_cache import current_request_cache
+from api.schemas import (Cart, CartOperation, CategorySummary, Order,
+                         OrderCreate, Product, User)
+from config.settings import (API_BREAKER_FAILURES, API_BREAKER_RESET_TIMEOUT,
+                             API_CONNECTION_LIMIT, API_DNS_CACHE_TTL,
+                             API_KEEPALIVE_TIMEOUT, API_READ_TIMEOUT,
+                             API_RETRY_ATTEMPTS, API_RETRY_BACKOFF,
+                             API_RETRY_BACKOFF_MAX, API_TIMEOUT_CONNECT,
+                             API_TIMEOUT_TOTAL, API_URL, API_WRITE_TIMEOUT,
+                             CATALOG_CACHE_MAX_SIZE, CATALOG_CACHE_STALE_TTL,
+                             CATALOG_CACHE_TTL, CATALOG_PAGE_SIZE)
+
+logger = logging.getLogger(__name__)
+
+
+class ApiError(Exception):
+    """Ошибка обращения к REST API."""
+
+
+class ApiUnavailableError(ApiError):
+    """API не ответил или временно отключён выключателем."""
+
+
+class ApiClient:
+    """
+    Общий HTTP-клиент бота для обращения к REST API.
+
+    Одна сессия aiohttp живёт всё время работы бота, поэтому соединения
+    с сервером переиспользуются между нажатиями кнопок. Каждый эндпоинт
+    API представлен отдельным методом с типизированным ответом.
+    При недоступности API методы чтения возвращают пустой результат,
+    а методы записи — False, не задерживая обработку обновлений.
+    Товары и категории читаются через общий для всех пользователей
+    кэш каталога. Для ответов с ETag клиент выполняет условные запросы
+    и при ответе 304 повторно использует сохранённые данные.
+    """
+
+    def __init__(self, api_url):
+        self.api_url = (api_url or '').rstrip('/')
+        self.breaker = CircuitBreaker(API_BREAKER_FAILURES,
+                                      API_BREAKER_RESET_TIMEOUT)
+        self.catalog_cache = CatalogCache(CATALOG_CACHE_TTL,
+                                          CATALOG_CACHE_STALE_TTL,
+                                          CATALOG_CACHE_MAX_SIZE)
+        self._validators = OrderedDict()
+        self._catalog_etag = None
+        self._session = None
+
+    async def start(self):
+        """Создаёт сессию с настроенным пулом соединений."""
+        if self._session is not None:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=API_CONNECTION_LIMIT,
+            keepalive_timeout=API_KEEPALIVE_TIMEOUT,
+            use_dns_cache=True,
+            ttl_dns_cache=API_DNS_CACHE_TTL)
+        timeout = aiohttp.ClientTimeout(total=API_TIMEOUT_TOTAL,
+                                        connect=API_TIMEOUT_CONNECT)
+        self._session = aiohttp.ClientSession(connector=connector,
+                                              timeout=timeout)
+
+    async def close(self):
+        """Закрывает сессию и все открытые соединения."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Текущая сессия клиента."""
+        if self._session is None:
+            raise RuntimeError('HTTP-клиент API не запущен.')
+        return self._session
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Пауза перед повтором: экспоненциальная, со случайным разбросом."""
+        ceiling = min(API_RETRY_BACKOFF_MAX, API_RETRY_BACKOFF * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+    async def _send(self, method: str, endpoint: str, *, timeout: float,
+                    attempts: int = 1, payload=None,
+                    headers=None) -> tuple[int, Any, Any]:
+        """
+        Выполняет запрос к API и возвращает статус, разобранный JSON
+        и заголовки ответа.
+
+        Сетевые ошибки, таймауты и ответы 5xx считаются сбоями: они
+        учитываются выключателем и повторяются, пока не исчерпаны
+        попытки. Если выключатель разомкнут, запрос не отправляется.
+        """
+        url = f"{self.api_url}/{endpoint.lstrip('/')}"
+        last_error = None
+        for attempt in range(attempts):
+            if attempt:
+                await asyncio.sleep(self._backoff(attempt - 1))
+            if not self.breaker.allow_request():
+                raise ApiUnavailableError('API временно отключён.')
+            try:
+                async with self.session.request(
+                        method, url, json=payload, headers=headers,
+                        timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                    if resp.status < 500:
+                        try:
+                            data = await resp.json(content_type=None)
+                        except ValueError:
+                            data = None
+                        self.breaker.record_success()
+                        return resp.status, data, resp.headers
+                    last_error = ApiError(f'{method} {url}: {resp.status}')
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                last_error = error
+            except BaseException:
+                # Отмена или ошибка в самом боте не говорят о сбое API,
+                # но пробный запрос выключателя должен быть завершён
+                self.breaker.release_probe()
+                raise
+            self.breaker.record_failure()
+        raise ApiUnavailableError(
+            f'{method} {url} не выполнен: {last_error!r}') from last_error
+
+    async def _fetch(self, endpoint: str, default=None):
+        """
+        GET-запрос с повторами; при ошибке возвращает default.
+
+        Во время обработки обновления ответ берётся из кэша запросов.
+        """
+        cache = current_request_cache.get()
+        if cache is not None:
+            return await cache.get_or_fetch(
+                endpoint, lambda: self._fetch_uncached(endpoint, default))
+        return await self._fetch_uncached(endpoint, default)
+
+    async def _fetch_uncached(self, endpoint: str, default=None):
+        """
+        Выполняет GET-запрос к API в обход кэша.
+
+        Если для эндпоинта сохранён ETag, запрос отправляется
+        с If-None-Match, и ответ 304 возвращает сохранённые данные.
+        ETag отражает версию всего каталога, поэтому новый ETag
+        в любом ответе сбрасывает кэш каталога.
+        """
+        validator = self._validators.get(endpoint)
+        headers = {'If-None-Match': validator[0]} if validator else None
+        try:
+            status, data, response_headers = await self._send(
+                'GET', endpoint, timeout=API_READ_TIMEOUT,
+                attempts=API_RETRY_ATTEMPTS, headers=headers)
+        except ApiError as error:
+            logger.warning('%s', error)
+            return default
+        if status == 304 and validator:
+            self._validators.move_to_end(endpoint)
+            return validator[1]
+        if status != 200:
+            return default
+        etag = response_headers.get('ETag')
+        if etag:
+            if self._catalog_etag is not None and etag != self._catalog_etag:
+                self.invalidate_catalog()
+            self._catalog_etag = etag
+            self._validators[endpoint] = (etag, data)
+            self._validators.move_to_end(endpoint)
+            while len(self._validators) > CATALOG_CACHE_MAX_SIZE:
+                self._validators.popitem(last=False)
+        return data
+
+    async def _fetch_catalog(self, endpoint: str, default=None):
+        """GET-запрос к каталогу через кэш каталога."""
+        return await self.catalog_cache.get_or_load(
+            endpoint, lambda: self._fetch_uncached(endpoint, default))
+
+    def invalidate_catalog(self, endpoint: Optional[str] = None):
+        """Сбрасывает кэш каталога целиком или для одного эндпоинта."""
+        self.catalog_cache.invalidate(endpoint)
+
+    async def _write(self, method: str, endpoint: str,
+                     payload=None) -> tuple[bool, Any]:
+        """
+        Изменяющий запрос без повторов.
+
+        Возвращает признак успеха и тело ответа.
+        """
+        cache = current_request_cache.get()
+        if cache is not None:
+            cache.clear()
+        try:
+            status, data, _ = await self._send(method, endpoint,
+                                               timeout=API_WRITE_TIMEOUT,
+                                               payload=payload)
+        except ApiError as error:
+            logger.warning('%s', error)
+            return False, None
+        return status == 200, data
+
+    async def _submit(self, method: str, endpoint: str, payload=None) -> bool:
+        """Изменяющий запрос без повторов; возвращает признак успеха."""
+        success, _ = await self._write(method, endpoint, payload)
+        return success
+
+    async def _fetch_all_pages(self, endpoint: str) -> Optional[list]:
+        """
+        Загружает все страницы keyset-списка в обход кэша каталога.
+
+        Страницы запрашиваются по CATALOG_PAGE_SIZE элементов с курсором
+        after_id. Если какая-либо страница не получена, возвращает None,
+        чтобы неполный список не попал в кэш.
+        """
+        separator = '&' if '?' in endpoint else '?'
+        items = []
+        after_id = None
+        while True:
+            page_endpoint = f'{endpoint}{separator}limit={CATALOG_PAGE_SIZE}'
+            if after_id is not None:
+                page_endpoint += f'&after_id={after_id}'
+            page = await self._fetch_uncached(page_endpoint)
+            if page is None:
+                return None
+            items.extend(page)
+            if len(page) < CATALOG_PAGE_SIZE:
+                return items
+            after_id = page[-1]['id']
+
+    async def _fetch_catalog_list(self, endpoint: str) -> list:
+        """Полный постраничный список каталога через кэш каталога."""
+        items = await self.catalog_cache.get_or_load(
+            endpoint, lambda: self._fetch_all_pages(endpoint))
+        return items or []
+
+    async def get_products(self) -> list[Product]:
+        """Все товары каталога."""
+        return await self._fetch_catalog_list('products/')
+
+    async def load_all_products(self) -> Optional[list[Product]]:
+        """
+        Все товары каталога в обход кэша каталога.
+
+        Неизменившиеся страницы читаются условными запросами.
+        При недоступности API возвращает None.
+        """
+        return await self._fetch_all_pages('products/')
+
+    async def get_product(self, product_id) -> Optional[Product]:
+        """Товар по его ID."""
+        return await self._fetch_catalog(f'products/{product_id}')
+
+    async def get_categories(self) -> list[CategorySummary]:
+        """Список категорий с числом товаров в каждой."""
+        return await self._fetch_catalog('categories/', [])
+
+    async def get_category(self, category_id) -> Optional[CategorySummary]:
+        """Категория по её ID."""
+        return await self._fetch_catalog(f'categories/{category_id}')
+
+    async def get_category_products(self, category_id) -> list[Product]:
+        """Все товары категории."""
+        return await self._fetch_catalog_list(
+            f'categories/{category_id}/products')
+
+    async def get_cart(self, chat_id) -> Optional[Cart]:
+        """Содержимое корзины пользователя."""
+        return await self._fetch(f'item-cart/{chat_id}')
+
+    async def add_to_cart(self, chat_id, product_id, quantity=1) -> bool:
+        """Добавляет товар в корзину."""
+        return await self._submit('POST', 'item-cart/', {
+            'product_id': product_id,
+            'quantity': quantity,
+            'chat_id': chat_id
+        })
+
+    async def update_cart(self, chat_id,
+                          operations: list[CartOperation]) -> Optional[Cart]:
+        """
+        Применяет операции к корзине одним запросом.
+
+        Возвращает пересчитанную корзину или None при ошибке. Корзина
+        сохраняется в кэше запросов, поэтому следующий экран в рамках
+        того же обновления не запрашивает её повторно.
+        """
+        endpoint = f'item-cart/{chat_id}'
+        success, cart = await self._write('PATCH', endpoint,
+                                          {'operations': operations})
+        if not success:
+            return None
+        cache = current_request_cache.get()
+        if cache is not None:
+            cache.store(endpoint, cart)
+        return cart
+
+    async def get_user(self, chat_id) -> Optional[User]:
+        """Данные пользователя по его chat_id."""
+        return await self._fetch(f'user/{chat_id}/')
+
+    async def update_user(self, chat_id, **fields) -> bool:
+        """Меняет указанные поля пользователя."""
+        return await self._submit('PATCH', f'user/{chat_id}/', fields)
+
+    async def create_order(self, order: OrderCreate) -> bool:
+        """Оформляет заказ из содержимого корзины."""
+        return await self._submit('POST', 'orders/', order)
+
+    async def get_orders(self, chat_id) -> list[Order]:
+        """История заказов пользователя."""
+        return await self._fetch(f'orders/{chat_id}', [])
+
+
+# Единый клиент API для всех сервисов бота
+api_client = ApiClient(API_URL)
@@ -0,0 +1,42 @@
+import asyncio
+from contextvars import ContextVar
+from typing import Optional
+
+
+class RequestCache:
+    """
+    Кэш ответов API в пределах обработки одного обновления Telegram.
+
+    Повторные и одновременные GET-запросы к одному эндпоинту во время
+    отрисовки экрана выполняются один раз. Любой изменяющий запрос
+    очищает кэш, чтобы следующий экран получил свежие данные.
+    """
+
+    def __init__(self, update_id, chat_id):
+        self.update_id = update_id
+        self.chat_id = chat_id
+        self._entries = {}
+
+    async def get_or_fetch(self, endpoint, fetch):
+        """Возвращает закэшированный ответ или выполняет запрос."""
+        key = (self.update_id, self.chat_id, endpoint)
+        task = self._entries.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._entries[key] = task
+        return await asyncio.shield(task)
+
+    def store(self, endpoint, value):
+        """Сохраняет уже известный ответ эндпоинта."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._entries[(self.update_id, self.chat_id, endpoint)] = future
+
+    def clear(self):
+        """Сбрасывает все закэшированные ответы."""
+        self._entries.clear()
+
+
+# Кэш текущего обновления; вне обработки обновлений не установлен
+current_request_cache: ContextVar[Optional[RequestCache]] = ContextVar(
+    'current_request_cache', default=None)
@@ -0,0 +1,92 @@
+from typing import Optional, TypedDict
+
+
+class Category(TypedDict):
+    """Категория товаров."""
+
+    id: int
+    name: str
+
+
+class Product(TypedDict):
+    """Товар каталога."""
+
+    id: int
+    name: str
+    description: str
+    price: int
+    photo_url: Optional[str]
+    category: Category
+
+
+class CategorySummary(Category):
+    """Категория с числом товаров в ней."""
+
+    product_count: int
+
+
+class CartItem(TypedDict):
+    """Позиция корзины."""
+
+    id: int
+    product: Product
+    quantity: int
+    total_price: float
+
+
+class CartOperation(TypedDict):
+    """Операция пакетного изменения корзины: set, add или remove."""
+
+    op: str
+    product_id: int
+    quantity: int
+
+
+class Cart(TypedDict):
+    """Содержимое корзины пользователя."""
+
+    cart_items: list[CartItem]
+    grand_total: float
+
+
+class User(TypedDict):
+    """Пользователь магазина."""
+
+    id: int
+    first_name: str
+    address: str
+    phone_number: int
+    chat_id: int
+
+
+class OrderItem(TypedDict):
+    """Строка заказа с зафиксированными названием и ценой."""
+
+    product_id: Optional[int]
+    product_name: str
+    quantity: int
+    price: int
+
+
+class Order(TypedDict):
+    """Заказ пользователя."""
+
+    id: int
+    user_id: int
+    number: str
+    status: str
+    total_amount: int
+    ordered_products: list[Product]
+    items: list[OrderItem]
+    created_at: str
+    updated_at: str
+
+
+class OrderCreate(TypedDict):
+    """Данные для оформления заказа."""
+
+    first_name: str
+    address: str
+    phone_number: str
+    chat_id: int
+    status: str
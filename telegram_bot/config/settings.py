@@ -6,3 +6,50 @@ load_dotenv()
 
 TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 API_URL = os.getenv('API_URL')
+
+# Настройки HTTP-клиента для обращения к API
+API_CONNECTION_LIMIT = int(os.getenv('API_CONNECTION_LIMIT', 50))
+API_KEEPALIVE_TIMEOUT = float(os.getenv('API_KEEPALIVE_TIMEOUT', 30))
+API_DNS_CACHE_TTL = int(os.getenv('API_DNS_CACHE_TTL', 300))
+API_TIMEOUT_TOTAL = float(os.getenv('API_TIMEOUT_TOTAL', 10))
+API_TIMEOUT_CONNECT = float(os.getenv('API_TIMEOUT_CONNECT', 3))
+API_READ_TIMEOUT = float(os.getenv('API_READ_TIMEOUT', 5))
+API_WRITE_TIMEOUT = float(os.getenv('API_WRITE_TIMEOUT', 10))
+
+# Повторы GET-запросов и защита от недоступного API
+API_RETRY_ATTEMPTS = int(os.getenv('API_RETRY_ATTEMPTS', 3))
+API_RETRY_BACKOFF = float(os.getenv('API_RETRY_BACKOFF', 0.2))
+API_RETRY_BACKOFF_MAX = float(os.getenv('API_RETRY_BACKOFF_MAX', 2))
+API_BREAKER_FAILURES = int(os.getenv('API_BREAKER_FAILURES', 5))
+API_BREAKER_RESET_TIMEOUT = float(os.getenv('API_BREAKER_RESET_TIMEOUT', 30))
+
+# Кэш каталога товаров и категорий
+CATALOG_CACHE_TTL = float(os.getenv('CATALOG_CACHE_TTL', 60))
+CATALOG_CACHE_STALE_TTL = float(os.getenv('CATALOG_CACHE_STALE_TTL', 300))
+CATALOG_CACHE_MAX_SIZE = int(os.getenv('CATALOG_CACHE_MAX_SIZE', 512))
+# Размер страницы при чтении списков каталога (не больше лимита API)
+CATALOG_PAGE_SIZE = int(os.getenv('CATALOG_PAGE_SIZE', 100))
+
+# Хранилище состояний диалогов: memory, redis или sqlite
+FSM_STORAGE = os.getenv('FSM_STORAGE', 'memory').lower()
+FSM_REDIS_URL = os.getenv('FSM_REDIS_URL', 'redis://localhost:6379/1')
+FSM_SQLITE_PATH = os.getenv('FSM_SQLITE_PATH', 'fsm_storage.sqlite3')
+# Время жизни брошенных диалогов в секундах (0 — без ограничения)
+FSM_TTL = int(os.getenv('FSM_TTL', 7 * 24 * 60 * 60))
+
+# Режим получения обновлений: polling или webhook
+BOT_MODE = os.getenv('BOT_MODE', 'polling').lower()
+WEBHOOK_URL = os.getenv('WEBHOOK_URL')
+WEBHOOK_PATH = os.getenv('WEBHOOK_PATH', '/webhook')
+WEBHOOK_SECRET = os.getenv('WEBHOOK_SECRET')
+WEBHOOK_HOST = os.getenv('WEBHOOK_HOST', '0.0.0.0')
+WEBHOOK_PORT = int(os.getenv('WEBHOOK_PORT', 8080))
+# Сколько обновлений обрабатывается одновременно во всех чатах
+UPDATE_CONCURRENCY = int(os.getenv('UPDATE_CONCURRENCY', 100))
+# Сколько необработанных обновлений одного чата держать в очереди
+CHAT_QUEUE_LIMIT = int(os.getenv('CHAT_QUEUE_LIMIT', 50))
+
+# Inline-поиск товаров по индексу названий в памяти
+INLINE_INDEX_REFRESH = float(os.getenv('INLINE_INDEX_REFRESH', 60))
+INLINE_RESULTS_LIMIT = int(os.getenv('INLINE_RESULTS_LIMIT', 20))
+INLINE_CACHE_TIME = int(os.getenv('INLINE_CACHE_TIME', 30))
@@ -1,26 +1,14 @@
-import aiohttp
 from aiogram_dialog import DialogManager
 
+from api.client import ApiClient
 from states.main import MainSG
 
 
 class CategoryService:
     """Сервис для работы с категориями через REST API."""
 
-    def __init__(self, api_url):
-        self.api_url = api_url
-
-    async def fetch_categories(self, session):
-        """Получает список категорий из API."""
-        async with session.get(f"{self.api_url}/categories") as response:
-            return await response.json()
-
-    async def fetch_products_by_category(self, session, category_id):
-        """Получает товары определенной категории из API."""
-        async with session.get(
-            f"{self.api_url}/categories/{category_id}"
-        ) as response:
-            return await response.json()
+    def __init__(self, api: ApiClient):
+        self.api = api
 
     async def category_selected(self, callback, select,
                                 manager: DialogManager, category_id):
@@ -41,15 +29,15 @@ class CategoryService:
         user = event.from_user if hasattr(event, 'from_user') else None
         if user is None or user.id is None:
             return {"categories": []}
-        async with aiohttp.ClientSession() as session:
-            categories = await self.fetch_categories(session)
-            formatted_products = [
-                {
-                    "id": category["id"],
-                    "name": category["name"]
-                }
-                for category in categories
-            ]
+        categories = await self.api.get_categories()
+        formatted_products = [
+            {
+                "id": category["id"],
+                "name": category["name"],
+                "product_count": category["product_count"]
+            }
+            for category in categories
+        ]
         return {"categories": formatted_products}
 
     async def get_list_detail_category(self,
@@ -64,16 +52,12 @@ class CategoryService:
             "category_id")
         if not category_id:
             return {"products": []}
-        async with aiohttp.ClientSession() as session:
-            data = await self.fetch_products_by_category(session, category_id)
-            if "products" in data:
-                formatted_products = [
-                    {
-                        "id": product["id"],
-                        "name": product["name"]
-                    }
-                    for product in data["products"]
-                ]
-            else:
-                formatted_products = []
+        products = await self.api.get_category_products(category_id)
+        formatted_products = [
+            {
+                "id": product["id"],
+                "name": product["name"]
+            }
+            for product in products
+        ]
         return {"products": formatted_products}
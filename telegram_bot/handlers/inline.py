@@ -0,0 +1,40 @@
+from aiogram.types import (InlineQuery, InlineQueryResultArticle,
+                           InputTextMessageContent)
+
+from search.catalog_index import CatalogSearchIndex
+
+
+class InlineSearchService:
+    """Inline-поиск товаров по индексу названий в памяти."""
+
+    def __init__(self, index: CatalogSearchIndex, results_limit: int,
+                 cache_time: int):
+        self.index = index
+        self.results_limit = results_limit
+        self.cache_time = cache_time
+
+    @staticmethod
+    def _article(product) -> InlineQueryResultArticle:
+        """Карточка товара в результатах inline-поиска."""
+        message = (
+            f"📌 {product['name']}\n"
+            f"📝 {product['description']}\n"
+            f"📚 Категория: {product['category']['name']}\n"
+            f"💸 Цена: {product['price']} Руб."
+        )
+        return InlineQueryResultArticle(
+            id=str(product['id']),
+            title=product['name'],
+            description=(f"{product['price']} Руб. · "
+                         f"{product['category']['name']}"),
+            thumbnail_url=product.get('photo_url') or None,
+            input_message_content=InputTextMessageContent(
+                message_text=message))
+
+    async def inline_query_handler(self, inline_query: InlineQuery):
+        """Отвечает на inline-запрос товарами из индекса."""
+        products = self.index.search(inline_query.query,
+                                     self.results_limit)
+        await inline_query.answer(
+            [self._article(product) for product in products],
+            cache_time=self.cache_time, is_personal=False)
@@ -1,42 +1,22 @@
-import aiohttp
 from aiogram.types import CallbackQuery
 from aiogram_dialog import DialogManager
 
+from api.client import ApiClient
 from states.main import MainSG
 
 
 class CartService:
     """Сервис для работы с корзиной пользователя через REST API."""
 
-    def __init__(self, api_url):
-        self.api_url = api_url
-
-    async def add_to_cart(self, session, product_id, quantity, chat_id):
-        """Добавляет товар в корзину."""
-        url = f"{self.api_url}/item-cart/"
-        payload = {
-            "product_id": product_id,
-            "quantity": quantity,
-            "chat_id": chat_id
-        }
-        async with session.post(url, json=payload) as resp:
-            return resp.status == 200
-
-    async def fetch_cart(self, session, chat_id):
-        """Получает содержимое корзины по chat_id."""
-        url = f"{self.api_url}/item-cart/{chat_id}"
-        async with session.get(url) as resp:
-            if resp.status == 200:
-                return await resp.json()
-            return None
+    def __init__(self, api: ApiClient):
+        self.api = api
 
     async def handle_add_to_cart(self, query: CallbackQuery,
                                  button, manager: DialogManager):
         """Обрабатывает нажатие кнопки 'Добавить в корзину'."""
         product_id = manager.current_context().dialog_data.get("product_id")
         chat_id = query.from_user.id
-        async with aiohttp.ClientSession() as session:
-            success = await self.add_to_cart(session, product_id, 1, chat_id)
+        success = await self.api.add_to_cart(chat_id, product_id, 1)
         message = ("Товар успешно добавлен в корзину!"
                    if success else "Ошибка. Товар не добавился.")
         await query.bot.send_message(chat_id, message)
@@ -45,8 +25,7 @@ class CartService:
     async def cart_getter(self, dialog_manager: DialogManager, **kwargs):
         """Возвращает список товаров в корзине."""
         chat_id = dialog_manager.event.from_user.id
-        async with aiohttp.ClientSession() as session:
-            cart_data = await self.fetch_cart(session, chat_id)
+        cart_data = await self.api.get_cart(chat_id)
         return cart_data or {}
 
     async def get_item_cart(self, dialog_manager: DialogManager, **kwargs):
@@ -76,21 +55,18 @@ class CartService:
                                  dialog_manager: DialogManager, **kwargs):
         """Возвращает товары в корзине для окна редактирования."""
         chat_id = dialog_manager.event.from_user.id
-        async with aiohttp.ClientSession() as session:
-            cart_data = await self.fetch_cart(session, chat_id)
+        cart_data = await self.api.get_cart(chat_id) or {}
         return {"cart_items": cart_data.get("cart_items", [])}
 
     async def selected_item(self, call: CallbackQuery, widget,
                             manager: DialogManager, item_id):
-        """Выбирает элемент корзины для дальнейшего редактирования."""
-        cart_data = await self.get_edit_cart_data(manager)
-        selected_item = next(
-            (i for i in cart_data["cart_items"] if i["id"] == int(item_id)),
-            None)
-        if not selected_item:
-            raise ValueError("Элемент корзины не найден")
-        manager.current_context().dialog_data[
-            "current_item_id"] = str(selected_item["product"]["id"])
+        """
+        Выбирает элемент корзины для дальнейшего редактирования.
+
+        Идентификатором элемента в списке служит ID товара, поэтому
+        повторно запрашивать корзину не требуется.
+        """
+        manager.current_context().dialog_data["current_item_id"] = item_id
         await manager.switch_to(MainSG.edit_cart_product)
 
     async def product_detail_getter(self,
@@ -113,15 +89,13 @@ class CartService:
         chat_id = manager.event.from_user.id
         product_id = manager.current_context().dialog_data.get(
             "current_item_id")
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.api_url}/item-cart/{chat_id}/{product_id}"
-            async with session.delete(url) as resp:
-                if resp.status == 200:
-                    await call.message.reply(
-                        "Товар успешно удалён из корзины.")
-                    await manager.switch_to(MainSG.item_cart)
-                else:
-                    await call.message.edit_text("Ошибка при удалении товара.")
+        operations = [{"op": "remove", "product_id": product_id,
+                       "quantity": 0}]
+        if await self.api.update_cart(chat_id, operations) is not None:
+            await call.message.reply("Товар успешно удалён из корзины.")
+            await manager.switch_to(MainSG.item_cart)
+        else:
+            await call.message.edit_text("Ошибка при удалении товара.")
 
     async def change_quantity(self, call: CallbackQuery,
                               widget, manager: DialogManager):
@@ -133,19 +107,12 @@ class CartService:
                                      new_value):
         """Обновляет количество товара в корзине."""
         chat_id = call.from_user.id
-        item_id = manager.current_context().dialog_data.get("current_item_id")
-        cart_data = await self.get_edit_cart_data(manager)
-        cart_items = cart_data.get("cart_items", [])
-        current_item = next(
-            (item for item in cart_items if int(item["id"]) == int(item_id)),
-            None)
-        product_id = current_item["product"]["id"]
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.api_url}/item-cart/{chat_id}/{product_id}"
-            async with session.put(url, json={"quantity": new_value}) as resp:
-                if resp.status == 200:
-                    await call.answer("Количество товара успешно изменено.")
-                    await manager.switch_to(MainSG.item_cart)
-                else:
-                    await call.answer(
-                        "Ошибка при изменении количества товара.")
+        product_id = manager.current_context().dialog_data.get(
+            "current_item_id")
+        operations = [{"op": "set", "product_id": product_id,
+                       "quantity": new_value}]
+        if await self.api.update_cart(chat_id, operations) is not None:
+            await call.answer("Количество товара успешно изменено.")
+            await manager.switch_to(MainSG.item_cart)
+        else:
+            await call.answer("Ошибка при изменении количества товара.")
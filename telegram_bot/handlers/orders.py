@@ -1,7 +1,10 @@
-import aiohttp
+import asyncio
+
 from aiogram.types import CallbackQuery
 from aiogram_dialog import DialogManager
 
+from api.client import ApiClient
+from api.schemas import OrderCreate
 from handlers.item_cart import CartService
 from handlers.users import UserService
 from states.main import MainSG
@@ -10,9 +13,9 @@ from states.main import MainSG
 class OrderService:
     """Сервис для обработки заказов."""
 
-    def __init__(self, api_url, user_service: UserService,
+    def __init__(self, api: ApiClient, user_service: UserService,
                  cart_service: CartService):
-        self.api_url = api_url
+        self.api = api
         self.user_service = user_service
         self.cart_service = cart_service
 
@@ -23,11 +26,9 @@ class OrderService:
         Возвращает данные пользователя и содержимое корзины
         для окна оформления заказа.
         """
-        user_data = await self.user_service.get_user(
-            dialog_manager.event.from_user.id)
-        chat_id = dialog_manager.event.from_user.id
-        async with aiohttp.ClientSession() as session:
-            cart_data = await self.cart_service.fetch_cart(session, chat_id)
+        user_data, cart_data = await asyncio.gather(
+            self.user_service.get_user(dialog_manager.event.from_user.id),
+            self.cart_service.cart_getter(dialog_manager))
         if not cart_data.get("cart_items"):
             return {"item_list": "Корзина пуста"}
         result = []
@@ -50,19 +51,16 @@ class OrderService:
         """Формирует и отправляет заказ на сервер."""
         user_data = await self.user_service.get_user(
             dialog_manager.event.from_user.id)
-        payload = {
+        if not user_data:
+            return False
+        payload: OrderCreate = {
             "first_name": user_data["first_name"],
             "address": user_data["address"],
             "phone_number": str(user_data["phone_number"]),
             "chat_id": dialog_manager.event.from_user.id,
             "status": "НОВЫЙ"
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(f"{self.api_url}/orders/",
-                                    json=payload) as resp:
-                if resp.status == 200:
-                    return True
-                return False
+        return await self.api.create_order(payload)
 
     async def confirm_order_handler(self, query: CallbackQuery,
                                     button, manager: DialogManager):
@@ -74,36 +72,32 @@ class OrderService:
             await query.answer("Ошибка при оформлении заказа.",
                                show_alert=True)
 
-    async def fetch_orders(self, session, chat_id):
-        """Получает список заказов пользователя."""
-        async with session.get(f"{self.api_url}/orders/{chat_id}") as response:
-            if response.status == 200:
-                return await response.json()
-            return []
-
     async def my_orders_getter(self, dialog_manager: DialogManager, **kwargs):
         """Возвращает красивую историю заказов пользователя."""
         chat_id = dialog_manager.event.from_user.id
-        async with aiohttp.ClientSession() as session:
-            orders = await self.fetch_orders(session, chat_id)
+        orders = await self.api.get_orders(chat_id)
 
         if len(orders) == 0:
             return {"orders": "📂 История заказов пуста"}
 
         result = []
         for order in orders:
-            ordered_products = order.get("ordered_products", [])
+            items = order.get("items", [])
             products_list = []
-            for product in ordered_products:
+            for item in items:
+                name = item["product_name"]
+                if item["product_id"] is None:
+                    name += " (товар удалён)"
                 product_info = (
-                    f"✨ {product['name']}: 💸 {product['price']} ₽\n"
+                    f"✨ {name}: {item['quantity']} шт. × "
+                    f"💸 {item['price']} ₽\n"
                 )
                 products_list.append(product_info)
 
             order_details = (
                 f"📣 Заказ № {order['number']}\n"
                 f"📝 Статус: {order['status']}\n"
-                f"🛠️ Товаров: {len(ordered_products)} шт.\n"
+                f"🛠️ Товаров: {sum(i['quantity'] for i in items)} шт.\n"
                 f"{''.join(products_list)}"
                 f"💳 Сумма заказа: {order['total_amount']} ₽\n"
             )
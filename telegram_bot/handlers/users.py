@@ -1,32 +1,21 @@
-import aiohttp
-
+from api.client import ApiClient
 from states.main import MainSG
 
 
 class UserService:
     """Сервис для работы с пользователем через REST API."""
 
-    def __init__(self, api_url):
-        self.api_url = api_url
-
-    async def fetch(self, endpoint, method='GET', data=None):
-        """Асинхронный метод для выполнения HTTP-запросов к API."""
-        async with aiohttp.ClientSession() as session:
-            async with session.request(method, f'{self.api_url}/{endpoint}',
-                                       json=data) as resp:
-                return await resp.json(), resp.status
+    def __init__(self, api: ApiClient):
+        self.api = api
 
     async def get_user(self, chat_id):
         """Получает данные пользователя по его chat_id."""
-        user_data, _ = await self.fetch(f'user/{chat_id}')
-        return user_data
+        return await self.api.get_user(chat_id)
 
     async def change_field(self, chat_id, field_name, new_value):
         """Меняет указанное поле пользователя через PATCH-запрос."""
-        _, status = await self.fetch(f'user/{chat_id}',
-                                     method='PATCH',
-                                     data={field_name: new_value})
-        return status == 200
+        return await self.api.update_user(chat_id,
+                                          **{field_name: new_value})
 
     async def user_getter(self, *args, **kwargs):
         """Геттер получения данных пользователя."""
@@ -2,11 +2,17 @@ import asyncio
 
 from aiogram import Bot, Dispatcher
 from aiogram.filters.command import Command
-from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram_dialog import Dialog, setup_dialogs
 
-from config.settings import TELEGRAM_TOKEN
+from api.client import api_client
+from config.settings import (BOT_MODE, INLINE_CACHE_TIME,
+                             INLINE_INDEX_REFRESH, INLINE_RESULTS_LIMIT,
+                             TELEGRAM_TOKEN)
+from handlers.inline import InlineSearchService
 from handlers.main import start_command
+from middlewares.request_cache import RequestCacheMiddleware
+from search.catalog_index import CatalogSearchIndex
+from storage.factory import create_fsm_storage
 from windows.categories import categories_detail_window, categories_list_window
 from windows.item_cart import (change_quantity_window, edit_cart_window,
                                item_cart_window, product_detail_view_window)
@@ -14,6 +20,7 @@ from windows.main import main_window
 from windows.orders import (order_confirmation_window, confirmation_window,
                             my_orders_window)
 from windows.products import product_detail_window, product_list_window
+from webhook.server import run_webhook
 from windows.users import (edit_address_window, edit_first_name_window,
                            edit_phone_number_window, profile_window)
 
@@ -21,7 +28,7 @@ from windows.users import (edit_address_window, edit_first_name_window,
 async def main():
     """Запуск бота."""
     bot = Bot(TELEGRAM_TOKEN)
-    storage = MemoryStorage()
+    storage, events_isolation = create_fsm_storage()
     dialog = Dialog(main_window, product_list_window, product_detail_window,
                     item_cart_window, edit_cart_window, categories_list_window,
                     product_detail_view_window, change_quantity_window,
@@ -29,11 +36,24 @@ async def main():
                     edit_address_window, edit_first_name_window,
                     edit_phone_number_window, order_confirmation_window,
                     confirmation_window, my_orders_window)
-    dp = Dispatcher(storage=storage)
+    dp = Dispatcher(storage=storage, events_isolation=events_isolation)
+    dp.update.outer_middleware(RequestCacheMiddleware())
+    search_index = CatalogSearchIndex(api_client, INLINE_INDEX_REFRESH)
+    inline_service = InlineSearchService(search_index, INLINE_RESULTS_LIMIT,
+                                         INLINE_CACHE_TIME)
+    dp.startup.register(api_client.start)
+    dp.startup.register(search_index.start)
+    dp.shutdown.register(search_index.close)
+    dp.shutdown.register(api_client.close)
     dp.include_router(dialog)
     setup_dialogs(dp)
     dp.message.register(start_command, Command('start'))
-    await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
+    dp.inline_query.register(inline_service.inline_query_handler)
+    if BOT_MODE == 'webhook':
+        await run_webhook(bot, dp)
+    else:
+        await dp.start_polling(
+            bot, allowed_updates=dp.resolve_used_update_types())
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,25 @@
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from api.request_cache import RequestCache, current_request_cache
+
+
+class RequestCacheMiddleware(BaseMiddleware):
+    """Создаёт кэш запросов к API на время обработки обновления."""
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        user = data.get('event_from_user')
+        cache = RequestCache(getattr(event, 'update_id', None),
+                             user.id if user else None)
+        token = current_request_cache.set(cache)
+        try:
+            return await handler(event, data)
+        finally:
+            current_request_cache.reset(token)
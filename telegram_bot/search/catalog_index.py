@@ -0,0 +1,152 @@
+import asyncio
+import bisect
+import heapq
+import logging
+import time
+from typing import Optional
+
+from api.client import ApiClient
+from api.schemas import Product
+from search.trie import PrefixIndex, tokenize
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogSearchIndex:
+    """
+    Индекс названий товаров в памяти для inline-поиска.
+
+    Индекс строится из каталога API и периодически обновляется
+    в фоне: страницы каталога читаются условными запросами, а в дерево
+    вносятся только добавленные, изменённые и удалённые товары.
+    Поиск выполняется целиком в памяти, без обращения к API.
+    """
+
+    def __init__(self, api: ApiClient, refresh_interval: float):
+        self.api = api
+        self.refresh_interval = refresh_interval
+        self.refreshed_at = None
+        self._index = PrefixIndex()
+        self._products = {}
+        # Нормализованные названия для ранжирования результатов
+        self._names = {}
+        # ID товаров в алфавитном порядке названий и позиции в нём
+        self._ordered = []
+        self._ordered_names = []
+        self._rank = {}
+        self._task = None
+
+    def __len__(self):
+        return len(self._products)
+
+    async def start(self):
+        """Запускает фоновое обновление индекса."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def close(self):
+        """Останавливает фоновое обновление индекса."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _refresh_loop(self):
+        """
+        Обновляет индекс сразу и далее с заданным интервалом, записывая
+        в журнал статистику кэша каталога.
+        """
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception('Не удалось обновить индекс поиска')
+            logger.info('Кэш каталога: %s', self.api.catalog_cache.stats())
+            await asyncio.sleep(self.refresh_interval)
+
+    async def _load_catalog(self) -> Optional[dict]:
+        """
+        Загружает весь каталог.
+
+        Возвращает None, если каталог получить не удалось, чтобы
+        сбой API не очистил индекс.
+        """
+        products = await self.api.load_all_products()
+        if products is None:
+            return None
+        return {product['id']: product for product in products}
+
+    async def refresh(self) -> bool:
+        """
+        Синхронизирует индекс с каталогом.
+
+        Возвращает False, если каталог получить не удалось.
+        """
+        catalog = await self._load_catalog()
+        if catalog is None:
+            return False
+        changed = False
+        for product_id in self._products.keys() - catalog.keys():
+            self._index.remove(product_id)
+            del self._products[product_id]
+            del self._names[product_id]
+            changed = True
+        for product_id, product in catalog.items():
+            current = self._products.get(product_id)
+            if current is None or current['name'] != product['name']:
+                self._index.add(product_id, product['name'])
+                self._names[product_id] = ' '.join(tokenize(product['name']))
+                changed = True
+            self._products[product_id] = product
+        if changed:
+            self._reorder()
+        self.refreshed_at = time.monotonic()
+        return True
+
+    def _reorder(self):
+        """Пересчитывает алфавитный порядок товаров."""
+        self._ordered = sorted(self._names, key=lambda product_id: (
+            self._names[product_id], product_id))
+        self._ordered_names = [self._names[product_id]
+                               for product_id in self._ordered]
+        self._rank = {product_id: position
+                      for position, product_id in enumerate(self._ordered)}
+
+    def search(self, query: str, limit: int) -> list[Product]:
+        """
+        Товары, в названии которых есть слова, начинающиеся со слов
+        запроса. Первыми идут товары, название которых начинается
+        с запроса, затем остальные по алфавиту. Пустой запрос
+        возвращает начало каталога по алфавиту.
+        """
+        words = tokenize(query)
+        if not words:
+            return [self._products[product_id]
+                    for product_id in self._ordered[:limit]]
+        prefix = ' '.join(words)
+        # Названия, начинающиеся с запроса, идут подряд в алфавитном
+        # порядке и находятся двоичным поиском
+        position = bisect.bisect_left(self._ordered_names, prefix)
+        result = []
+        while (len(result) < limit
+               and position < len(self._ordered)
+               and self._ordered_names[position].startswith(prefix)):
+            result.append(self._ordered[position])
+            position += 1
+        if len(result) < limit:
+            remaining = self._index.search(query).difference(result)
+            needed = limit - len(result)
+            if len(remaining) * 8 < len(self._ordered):
+                result.extend(heapq.nsmallest(needed, remaining,
+                                              key=self._rank.__getitem__))
+            else:
+                # Совпадений много: их быстрее найти обходом по порядку
+                for product_id in self._ordered:
+                    if product_id in remaining:
+                        result.append(product_id)
+                        if len(result) == limit:
+                            break
+        return [self._products[product_id] for product_id in result]
@@ -0,0 +1,90 @@
+import re
+
+# Слова названия: буквы и цифры, остальные символы разделяют слова
+WORD = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> list[str]:
+    """Разбивает текст на слова в нижнем регистре, ё приводится к е."""
+    return WORD.findall(text.lower().replace('ё', 'е'))
+
+
+class _Node:
+    """Узел префиксного дерева."""
+
+    __slots__ = ('children', 'ids')
+
+    def __init__(self):
+        self.children = {}
+        self.ids = set()
+
+
+class PrefixIndex:
+    """
+    Префиксное дерево слов названий.
+
+    В каждом узле хранится множество ID документов, одно из слов которых
+    начинается с пути к узлу, поэтому поиск по префиксу занимает время,
+    пропорциональное длине префикса, без обхода поддерева. Документы
+    можно добавлять и удалять по одному, не перестраивая дерево.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._words = {}
+
+    def __len__(self):
+        return len(self._words)
+
+    def add(self, doc_id, text: str):
+        """Добавляет документ или заменяет его текст."""
+        if doc_id in self._words:
+            self.remove(doc_id)
+        words = set(tokenize(text))
+        self._words[doc_id] = words
+        for word in words:
+            node = self._root
+            for char in word:
+                node = node.children.setdefault(char, _Node())
+                node.ids.add(doc_id)
+
+    def remove(self, doc_id):
+        """Удаляет документ и опустевшие ветви дерева."""
+        for word in self._words.pop(doc_id, ()):
+            path = [self._root]
+            for char in word:
+                node = path[-1].children.get(char)
+                if node is None:
+                    break
+                node.ids.discard(doc_id)
+                path.append(node)
+            for depth in range(len(path) - 1, 0, -1):
+                if path[depth].ids:
+                    break
+                del path[depth - 1].children[word[depth - 1]]
+
+    def _lookup(self, prefix: str) -> set:
+        """ID документов со словом, начинающимся с prefix."""
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        return node.ids
+
+    def search(self, query: str) -> set:
+        """
+        ID документов, в которых каждое слово запроса является
+        началом какого-либо слова документа.
+        """
+        words = tokenize(query)
+        if not words:
+            return set()
+        # Пересечение начинается с самого редкого префикса
+        candidates = sorted((self._lookup(word) for word in words), key=len)
+        result = set(candidates[0])
+        for ids in candidates[1:]:
+            result &= ids
+            if not result:
+                break
+        return result
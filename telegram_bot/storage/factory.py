@@ -0,0 +1,33 @@
+from aiogram.fsm.storage.base import (BaseEventIsolation, BaseStorage,
+                                      DefaultKeyBuilder)
+from aiogram.fsm.storage.memory import (DisabledEventIsolation,
+                                        MemoryStorage, SimpleEventIsolation)
+
+from config.settings import (FSM_REDIS_URL, FSM_SQLITE_PATH, FSM_STORAGE,
+                             FSM_TTL)
+from storage.serialization import dumps, loads
+from storage.sqlite import SQLiteStorage
+
+
+def create_fsm_storage() -> tuple[BaseStorage, BaseEventIsolation]:
+    """
+    Создаёт хранилище состояний диалогов согласно настройкам.
+
+    Возвращает:
+    - Хранилище и механизм изоляции обработки обновлений одного чата.
+    """
+    ttl = FSM_TTL or None
+    if FSM_STORAGE == 'redis':
+        from aiogram.fsm.storage.redis import RedisStorage
+
+        storage = RedisStorage.from_url(
+            FSM_REDIS_URL,
+            key_builder=DefaultKeyBuilder(with_destiny=True),
+            state_ttl=ttl, data_ttl=ttl,
+            json_dumps=dumps, json_loads=loads)
+        return storage, storage.create_isolation()
+    if FSM_STORAGE == 'sqlite':
+        return SQLiteStorage(FSM_SQLITE_PATH, ttl), SimpleEventIsolation()
+    if FSM_STORAGE == 'memory':
+        return MemoryStorage(), DisabledEventIsolation()
+    raise ValueError(f'Неизвестное хранилище состояний: {FSM_STORAGE}')
@@ -0,0 +1,7 @@
+import json
+from functools import partial
+
+# Компактный JSON для данных диалогов: без пробелов и без экранирования
+# кириллицы, что заметно уменьшает размер записей в хранилище.
+dumps = partial(json.dumps, separators=(',', ':'), ensure_ascii=False)
+loads = json.loads
@@ -0,0 +1,104 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+import aiosqlite
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import (BaseStorage, DefaultKeyBuilder,
+                                      KeyBuilder, StateType, StorageKey)
+
+from storage.serialization import dumps, loads
+
+# Через сколько записей удалять просроченные ключи
+PURGE_EVERY = 1000
+
+
+class SQLiteStorage(BaseStorage):
+    """
+    Хранилище состояний диалогов в файле SQLite.
+
+    Не требует внешних сервисов и сохраняет диалоги между перезапусками
+    бота. Файл может использоваться несколькими процессами на одном
+    сервере (режим WAL); для нескольких серверов нужен Redis.
+    Ключи с истёкшим сроком жизни не читаются и периодически удаляются.
+    """
+
+    def __init__(self, path: str, ttl: Optional[int] = None,
+                 key_builder: Optional[KeyBuilder] = None):
+        self.path = path
+        self.ttl = ttl
+        self.key_builder = key_builder or DefaultKeyBuilder(with_destiny=True)
+        self._connection = None
+        self._connect_lock = asyncio.Lock()
+        self._writes = 0
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """Открывает соединение и создаёт таблицу при первом обращении."""
+        async with self._connect_lock:
+            if self._connection is None:
+                connection = await aiosqlite.connect(self.path)
+                await connection.execute('PRAGMA journal_mode=WAL')
+                await connection.execute('PRAGMA synchronous=NORMAL')
+                await connection.execute(
+                    'CREATE TABLE IF NOT EXISTS fsm_storage ('
+                    'key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+                    'expires_at REAL) WITHOUT ROWID')
+                await connection.execute(
+                    'CREATE INDEX IF NOT EXISTS ix_fsm_storage_expires_at '
+                    'ON fsm_storage (expires_at)')
+                await connection.commit()
+                self._connection = connection
+                await self._purge_expired()
+        return self._connection
+
+    async def _purge_expired(self):
+        """Удаляет записи с истёкшим сроком жизни."""
+        await self._connection.execute(
+            'DELETE FROM fsm_storage WHERE expires_at <= ?', (time.time(),))
+        await self._connection.commit()
+
+    async def _read(self, key: str) -> Optional[str]:
+        connection = await self._connect()
+        async with connection.execute(
+                'SELECT value FROM fsm_storage WHERE key = ? '
+                'AND (expires_at IS NULL OR expires_at > ?)',
+                (key, time.time())) as cursor:
+            row = await cursor.fetchone()
+        return row[0] if row else None
+
+    async def _write(self, key: str, value: Optional[str]):
+        connection = await self._connect()
+        if value is None:
+            await connection.execute(
+                'DELETE FROM fsm_storage WHERE key = ?', (key,))
+        else:
+            expires_at = time.time() + self.ttl if self.ttl else None
+            await connection.execute(
+                'INSERT INTO fsm_storage (key, value, expires_at) '
+                'VALUES (?, ?, ?) ON CONFLICT (key) DO UPDATE SET '
+                'value = excluded.value, expires_at = excluded.expires_at',
+                (key, value, expires_at))
+        await connection.commit()
+        self._writes += 1
+        if self._writes % PURGE_EVERY == 0:
+            await self._purge_expired()
+
+    async def set_state(self, key: StorageKey, state: StateType = None):
+        value = state.state if isinstance(state, State) else state
+        await self._write(self.key_builder.build(key, 'state'), value)
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        return await self._read(self.key_builder.build(key, 'state'))
+
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]):
+        await self._write(self.key_builder.build(key, 'data'),
+                          dumps(data) if data else None)
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        value = await self._read(self.key_builder.build(key, 'data'))
+        return loads(value) if value else {}
+
+    async def close(self):
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
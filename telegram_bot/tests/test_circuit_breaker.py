@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from api.circuit_breaker import CircuitBreaker
+from api.client import ApiClient, ApiUnavailableError
+
+pytestmark = pytest.mark.anyio
+
+
+def open_breaker(breaker):
+    """Размыкает выключатель с истёкшей паузой: следующий запрос — проба."""
+    breaker.state = breaker.OPEN
+    breaker._opened_at = -breaker.reset_timeout
+
+
+def test_breaker_opens_after_failures_and_closes_on_success():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    assert breaker.state == breaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == breaker.OPEN
+    assert not breaker.allow_request()
+
+    open_breaker(breaker)
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == breaker.CLOSED
+
+
+def test_released_probe_can_be_retried():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    open_breaker(breaker)
+    assert breaker.allow_request()
+
+    breaker.release_probe()
+
+    assert breaker.state == breaker.HALF_OPEN
+    assert breaker.allow_request()
+
+
+@pytest.fixture
+async def api():
+    """Клиент API и сервер, отвечающий с задержкой или ошибкой 500."""
+    async def slow(request):
+        await asyncio.sleep(1)
+        return web.json_response([])
+
+    async def broken(request):
+        return web.json_response({}, status=500)
+
+    app = web.Application()
+    app.router.add_get('/slow', slow)
+    app.router.add_get('/broken', broken)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    client = ApiClient(f'http://127.0.0.1:{port}')
+    await client.start()
+    yield client
+    await client.close()
+    await runner.cleanup()
+
+
+async def test_cancelled_probe_is_not_a_failure(api):
+    """Отменённый пробный запрос не размыкает выключатель снова."""
+    open_breaker(api.breaker)
+    task = asyncio.create_task(api._send('GET', '/slow', timeout=5))
+    await asyncio.sleep(0.1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert api.breaker.state == api.breaker.HALF_OPEN
+    assert api.breaker._failures == 0
+    assert api.breaker.allow_request()
+
+
+async def test_server_error_is_a_failure(api):
+    open_breaker(api.breaker)
+    with pytest.raises(ApiUnavailableError):
+        await api._send('GET', '/broken', timeout=5)
+
+    assert api.breaker.state == api.breaker.OPEN
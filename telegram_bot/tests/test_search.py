@@ -0,0 +1,137 @@
+import pytest
+
+from search.catalog_index import CatalogSearchIndex
+from search.trie import PrefixIndex, tokenize
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeApi:
+    """API, возвращающий заданный каталог."""
+
+    def __init__(self, names):
+        self.catalog = [{'id': product_id, 'name': name}
+                        for product_id, name in enumerate(names, 1)]
+
+    async def load_all_products(self):
+        return self.catalog
+
+
+async def make_index(names):
+    index = CatalogSearchIndex(FakeApi(names), refresh_interval=60)
+    assert await index.refresh()
+    return index
+
+
+def found(index, query, limit=10):
+    return [product['name'] for product in index.search(query, limit)]
+
+
+def test_tokenize_folds_case_and_yo():
+    assert tokenize('Ёлка, ЗЕЛЁНАЯ (180 см)') == [
+        'елка', 'зеленая', '180', 'см']
+
+
+def test_prefix_index_matches_every_word():
+    index = PrefixIndex()
+    index.add(1, 'Чайник электрический')
+    index.add(2, 'Чайник заварочный')
+    index.add(3, 'Электрическая плита')
+
+    assert index.search('чай') == {1, 2}
+    assert index.search('эл ча') == {1}
+    assert index.search('электр') == {1, 3}
+    assert index.search('чайник утюг') == set()
+    assert index.search('!!!') == set()
+
+
+def test_prefix_index_folds_yo():
+    index = PrefixIndex()
+    index.add(1, 'Ёлка')
+    index.add(2, 'Елочный шар')
+
+    assert index.search('елк') == {1}
+    assert index.search('ёл') == {1, 2}
+
+
+def test_prefix_index_replace_and_remove():
+    """Замена и удаление документа не оставляют следов в дереве."""
+    index = PrefixIndex()
+    index.add(1, 'Чайник')
+    index.add(1, 'Утюг')
+
+    assert index.search('чай') == set()
+    assert index.search('утюг') == {1}
+
+    index.remove(1)
+    assert len(index) == 0
+    assert index.search('у') == set()
+    assert not index._root.children
+
+
+async def test_name_prefix_matches_go_first():
+    """Сначала названия, начинающиеся с запроса, затем по алфавиту."""
+    index = await make_index([
+        'Электрический чайник', 'Чайник заварочный', 'Чайный сервиз',
+        'Набор для чайной церемонии', 'Чайник электрический'])
+
+    assert found(index, 'чай') == [
+        'Чайник заварочный', 'Чайник электрический', 'Чайный сервиз',
+        'Набор для чайной церемонии', 'Электрический чайник']
+    assert found(index, 'чайник эл') == [
+        'Чайник электрический', 'Электрический чайник']
+    assert found(index, 'чай', limit=2) == [
+        'Чайник заварочный', 'Чайник электрический']
+
+
+async def test_search_folds_yo():
+    index = await make_index(['Ёлка искусственная', 'Шар на елку'])
+
+    assert found(index, 'елка') == ['Ёлка искусственная']
+    assert found(index, 'ЁЛК') == ['Ёлка искусственная', 'Шар на елку']
+
+
+async def test_empty_query_lists_catalog_alphabetically():
+    index = await make_index(['Утюг', 'Ёлка', 'Ваза'])
+
+    assert found(index, '') == ['Ваза', 'Ёлка', 'Утюг']
+
+
+async def test_few_and_many_matches_keep_alphabetical_order():
+    """Отбор через кучу и обход по порядку дают алфавитный порядок."""
+    names = [f'Красный товар {number:03}' for number in range(200, 0, -1)]
+    names += ['Новый стул', 'Ещё стул', 'Стул']
+    index = await make_index(names)
+
+    # Немного совпадений после названий с префиксом — отбор через кучу
+    assert found(index, 'стул') == ['Стул', 'Ещё стул', 'Новый стул']
+    # Совпадает почти весь каталог — обход по алфавитному порядку
+    assert found(index, 'товар', limit=3) == [
+        'Красный товар 001', 'Красный товар 002', 'Красный товар 003']
+    assert found(index, '199 тов') == ['Красный товар 199']
+
+
+async def test_refresh_applies_changes():
+    """Обновление удаляет, переименовывает и добавляет товары."""
+    api = FakeApi(['Чайник', 'Утюг'])
+    index = CatalogSearchIndex(api, refresh_interval=60)
+    await index.refresh()
+
+    api.catalog = [{'id': 1, 'name': 'Самовар'}, {'id': 3, 'name': 'Ваза'}]
+    assert await index.refresh()
+
+    assert len(index) == 2
+    assert found(index, 'утюг') == []
+    assert found(index, 'чайник') == []
+    assert found(index, 'сам') == ['Самовар']
+    assert found(index, '') == ['Ваза', 'Самовар']
+
+
+async def test_failed_refresh_keeps_index():
+    api = FakeApi(['Чайник'])
+    index = CatalogSearchIndex(api, refresh_interval=60)
+    await index.refresh()
+
+    api.catalog = None
+    assert not await index.refresh()
+    assert found(index, 'чай') == ['Чайник']
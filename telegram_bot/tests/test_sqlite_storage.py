@@ -0,0 +1,109 @@
+import statistics
+import time
+
+import aiosqlite
+import pytest
+from aiogram.fsm.storage.base import StorageKey
+
+from storage.sqlite import SQLiteStorage
+
+pytestmark = pytest.mark.anyio
+
+KEY = StorageKey(bot_id=1, chat_id=10, user_id=10)
+NOW = 1_700_000_000.0
+
+# Число обращений к хранилищу в замере задержки и верхняя граница медианы:
+# граница заведомо свободная, тест ловит только деградацию на порядки
+ROUND_TRIPS = 200
+MAX_MEDIAN_SECONDS = 0.02
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Управляемое время хранилища."""
+    now = [NOW]
+    monkeypatch.setattr('storage.sqlite.time.time', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'fsm.sqlite3')
+
+
+async def test_state_survives_restart(path):
+    """Состояние и данные сохраняются между экземплярами хранилища."""
+    storage = SQLiteStorage(path)
+    await storage.set_state(KEY, 'Order:address')
+    await storage.set_data(KEY, {'address': 'Москва'})
+    await storage.close()
+
+    storage = SQLiteStorage(path)
+    assert await storage.get_state(KEY) == 'Order:address'
+    assert await storage.get_data(KEY) == {'address': 'Москва'}
+    await storage.close()
+
+
+async def test_expired_keys_are_not_read(path, clock):
+    """Ключ читается до истечения ttl и не читается после."""
+    storage = SQLiteStorage(path, ttl=10)
+    await storage.set_state(KEY, 'Order:address')
+    await storage.set_data(KEY, {'address': 'Москва'})
+
+    clock[0] = NOW + 9
+    assert await storage.get_state(KEY) == 'Order:address'
+
+    clock[0] = NOW + 11
+    assert await storage.get_state(KEY) is None
+    assert await storage.get_data(KEY) == {}
+    await storage.close()
+
+
+async def test_write_extends_ttl(path, clock):
+    """Повторная запись продлевает срок жизни ключа."""
+    storage = SQLiteStorage(path, ttl=10)
+    await storage.set_state(KEY, 'Order:address')
+    clock[0] = NOW + 8
+    await storage.set_state(KEY, 'Order:phone')
+
+    clock[0] = NOW + 15
+    assert await storage.get_state(KEY) == 'Order:phone'
+    await storage.close()
+
+
+async def test_expired_keys_are_purged_on_start(path, clock):
+    """При открытии хранилища просроченные записи удаляются из файла."""
+    storage = SQLiteStorage(path, ttl=10)
+    await storage.set_state(KEY, 'Order:address')
+    await storage.close()
+
+    clock[0] = NOW + 11
+    storage = SQLiteStorage(path, ttl=10)
+    await storage.get_state(KEY)
+    await storage.close()
+
+    async with aiosqlite.connect(path) as connection:
+        async with connection.execute(
+                'SELECT COUNT(*) FROM fsm_storage') as cursor:
+            assert await cursor.fetchone() == (0,)
+
+
+async def test_round_trip_latency(path):
+    """Запись и чтение состояния с данными укладываются в миллисекунды."""
+    storage = SQLiteStorage(path, ttl=3600)
+    timings = []
+    for chat_id in range(ROUND_TRIPS):
+        key = StorageKey(bot_id=1, chat_id=chat_id, user_id=chat_id)
+        started = time.perf_counter()
+        await storage.set_state(key, 'Order:address')
+        await storage.set_data(key, {'address': 'Москва'})
+        assert await storage.get_state(key) == 'Order:address'
+        assert await storage.get_data(key) == {'address': 'Москва'}
+        timings.append(time.perf_counter() - started)
+    await storage.close()
+
+    median = statistics.median(timings)
+    p95 = statistics.quantiles(timings, n=20)[-1]
+    print(f'\nSQLiteStorage: медиана {median * 1000:.2f} мс, '
+          f'p95 {p95 * 1000:.2f} мс на цикл из двух записей и двух чтений')
+    assert median < MAX_MEDIAN_SECONDS
@@ -0,0 +1,128 @@
+import asyncio
+import random
+import time
+
+import pytest
+from aiogram.types import Update
+
+from webhook.update_queue import ChatUpdateQueue
+
+pytestmark = pytest.mark.anyio
+
+# Время обработки одного обновления в замере пропускной способности
+HANDLER_SECONDS = 0.005
+
+
+def make_update(update_id: int, chat_id: int) -> Update:
+    return Update.model_validate({
+        'update_id': update_id,
+        'message': {
+            'message_id': update_id,
+            'date': 0,
+            'chat': {'id': chat_id, 'type': 'private'},
+            'from': {'id': chat_id, 'is_bot': False, 'first_name': 'Иван'},
+            'text': str(update_id),
+        },
+    })
+
+
+class RecordingDispatcher:
+    """Диспетчер, записывающий порядок и параллельность обработки."""
+
+    def __init__(self, fail_ids=()):
+        self.processed = []
+        self.fail_ids = set(fail_ids)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def feed_update(self, bot, update):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(random.uniform(0, 0.005))
+            if update.update_id in self.fail_ids:
+                raise RuntimeError('сбой обработчика')
+            self.processed.append(
+                (update.message.chat.id, update.update_id))
+        finally:
+            self.in_flight -= 1
+
+
+class SleepingDispatcher:
+    """Диспетчер с постоянным временем обработки, как при ожидании API."""
+
+    async def feed_update(self, bot, update):
+        await asyncio.sleep(HANDLER_SECONDS)
+
+
+async def measure_throughput(concurrency: int, chats: int,
+                             updates: int) -> float:
+    """Число обновлений в секунду при заданном параллелизме."""
+    queue = ChatUpdateQueue(SleepingDispatcher(), bot=None,
+                            concurrency=concurrency, chat_limit=updates)
+    started = time.perf_counter()
+    for update_id in range(updates):
+        queue.submit(make_update(update_id, update_id % chats))
+    await queue.close()
+    return updates / (time.perf_counter() - started)
+
+
+def chat_order(processed, chat_id):
+    return [update_id for chat, update_id in processed if chat == chat_id]
+
+
+async def test_updates_of_one_chat_are_processed_in_order():
+    """Обновления чата обрабатываются по порядку, чаты — параллельно."""
+    random.seed(1)
+    dispatcher = RecordingDispatcher()
+    queue = ChatUpdateQueue(dispatcher, bot=None, concurrency=4,
+                            chat_limit=100)
+    chats = (1, 2, 3, 4, 5)
+    for update_id in range(100):
+        queue.submit(make_update(update_id, chats[update_id % len(chats)]))
+    await queue.close()
+
+    assert len(dispatcher.processed) == 100
+    for chat_id in chats:
+        order = chat_order(dispatcher.processed, chat_id)
+        assert order == sorted(order)
+    assert 1 < dispatcher.max_in_flight <= 4
+
+
+async def test_failed_update_does_not_block_chat():
+    """Ошибка обработчика не останавливает очередь чата."""
+    dispatcher = RecordingDispatcher(fail_ids={1})
+    queue = ChatUpdateQueue(dispatcher, bot=None, concurrency=2,
+                            chat_limit=10)
+    for update_id in range(3):
+        queue.submit(make_update(update_id, 7))
+    await queue.close()
+
+    assert chat_order(dispatcher.processed, 7) == [0, 2]
+
+
+async def test_chat_queue_limit():
+    """Обновления сверх лимита очереди чата отбрасываются."""
+    dispatcher = RecordingDispatcher()
+    queue = ChatUpdateQueue(dispatcher, bot=None, concurrency=2,
+                            chat_limit=3)
+    for update_id in range(5):
+        queue.submit(make_update(update_id, 7))
+    await queue.close()
+
+    assert chat_order(dispatcher.processed, 7) == [0, 1, 2]
+
+
+async def test_throughput_scales_with_concurrency():
+    """Параллельная обработка чатов ускоряет очередь в разы."""
+    serial = await measure_throughput(concurrency=1, chats=10, updates=100)
+    parallel = await measure_throughput(concurrency=10, chats=10,
+                                        updates=100)
+    one_chat = await measure_throughput(concurrency=10, chats=1,
+                                        updates=100)
+
+    print(f'\nChatUpdateQueue: {serial:.0f} обн./с последовательно, '
+          f'{parallel:.0f} обн./с на 10 чатах, '
+          f'{one_chat:.0f} обн./с в одном чате')
+    assert parallel > 3 * serial
+    assert one_chat < 2 * serial
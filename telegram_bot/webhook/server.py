@@ -0,0 +1,69 @@
+import asyncio
+import logging
+
+from aiogram import Bot, Dispatcher
+from aiogram.types import Update
+from aiogram.webhook.aiohttp_server import setup_application
+from aiohttp import web
+
+from config.settings import (CHAT_QUEUE_LIMIT, UPDATE_CONCURRENCY,
+                             WEBHOOK_HOST, WEBHOOK_PATH, WEBHOOK_PORT,
+                             WEBHOOK_SECRET, WEBHOOK_URL)
+from webhook.update_queue import ChatUpdateQueue
+
+logger = logging.getLogger(__name__)
+
+# Заголовок с секретом, который Telegram передаёт в каждом запросе
+SECRET_HEADER = 'X-Telegram-Bot-Api-Secret-Token'
+
+
+def create_webhook_app(bot: Bot, dp: Dispatcher) -> web.Application:
+    """
+    Создаёт веб-приложение для приёма обновлений через вебхук.
+
+    Обновление сразу ставится в очередь его чата, а Telegram получает
+    ответ, не дожидаясь обработки.
+    """
+    update_queue = ChatUpdateQueue(dp, bot, UPDATE_CONCURRENCY,
+                                   CHAT_QUEUE_LIMIT)
+
+    async def handle_update(request: web.Request) -> web.Response:
+        if WEBHOOK_SECRET and (
+                request.headers.get(SECRET_HEADER) != WEBHOOK_SECRET):
+            return web.Response(status=401)
+        update = Update.model_validate(await request.json(),
+                                       context={'bot': bot})
+        update_queue.submit(update)
+        return web.Response()
+
+    async def set_webhook(bot: Bot):
+        await bot.set_webhook(
+            f'{WEBHOOK_URL.rstrip("/")}{WEBHOOK_PATH}',
+            secret_token=WEBHOOK_SECRET,
+            allowed_updates=dp.resolve_used_update_types())
+
+    async def drain_updates(app: web.Application):
+        await update_queue.close()
+
+    app = web.Application()
+    app.router.add_post(WEBHOOK_PATH, handle_update)
+    app.on_shutdown.append(drain_updates)
+    dp.startup.register(set_webhook)
+    setup_application(app, dp, bot=bot)
+    return app
+
+
+async def run_webhook(bot: Bot, dp: Dispatcher):
+    """Запускает веб-сервер вебхука и работает до остановки процесса."""
+    if not WEBHOOK_URL:
+        raise RuntimeError('Для режима webhook требуется WEBHOOK_URL.')
+    runner = web.AppRunner(create_webhook_app(bot, dp))
+    await runner.setup()
+    await web.TCPSite(runner, WEBHOOK_HOST, WEBHOOK_PORT).start()
+    logger.info('Вебхук слушает %s:%s%s', WEBHOOK_HOST, WEBHOOK_PORT,
+                WEBHOOK_PATH)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+        await bot.session.close()
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+from collections import deque
+
+from aiogram import Bot, Dispatcher
+from aiogram.dispatcher.middlewares.user_context import UserContextMiddleware
+from aiogram.types import Update
+
+logger = logging.getLogger(__name__)
+
+
+class ChatUpdateQueue:
+    """
+    Параллельная обработка обновлений с сохранением порядка внутри чата.
+
+    Обновления одного чата обрабатываются строго по очереди отдельной
+    задачей, которая создаётся при поступлении обновления и завершается,
+    когда очередь чата пуста. Разные чаты обрабатываются параллельно,
+    а общее число одновременно обрабатываемых обновлений ограничено.
+    """
+
+    def __init__(self, dispatcher: Dispatcher, bot: Bot, concurrency: int,
+                 chat_limit: int):
+        self.dispatcher = dispatcher
+        self.bot = bot
+        self.chat_limit = chat_limit
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._queues = {}
+        self._workers = {}
+
+    def submit(self, update: Update):
+        """Ставит обновление в очередь его чата."""
+        context = UserContextMiddleware.resolve_event_context(update)
+        chat_key = context.chat_id or context.user_id
+        if chat_key is None:
+            task = asyncio.create_task(self._process(update))
+            self._workers[('update', update.update_id)] = task
+            task.add_done_callback(lambda _: self._workers.pop(
+                ('update', update.update_id), None))
+            return
+        queue = self._queues.setdefault(chat_key, deque())
+        if len(queue) >= self.chat_limit:
+            logger.warning('Очередь чата %s переполнена, обновление %s '
+                           'пропущено', chat_key, update.update_id)
+            return
+        queue.append(update)
+        if chat_key not in self._workers:
+            self._workers[chat_key] = asyncio.create_task(
+                self._drain(chat_key))
+
+    async def _drain(self, chat_key):
+        """Обрабатывает очередь чата, пока она не опустеет."""
+        queue = self._queues[chat_key]
+        try:
+            while queue:
+                await self._process(queue.popleft())
+        finally:
+            del self._queues[chat_key]
+            del self._workers[chat_key]
+
+    async def _process(self, update: Update):
+        async with self._semaphore:
+            try:
+                await self.dispatcher.feed_update(self.bot, update)
+            except Exception:
+                logger.exception('Ошибка обработки обновления %s',
+                                 update.update_id)
+
+    async def close(self):
+        """Дожидается обработки всех поставленных в очередь обновлений."""
+        while self._workers:
+            await asyncio.gather(*self._workers.values())
@@ -2,20 +2,20 @@ from aiogram_dialog import Window
 from aiogram_dialog.widgets.kbd import Button, Column, Select
 from aiogram_dialog.widgets.text import Const, Format
 
-from config.settings import API_URL
+from api.client import api_client
 from handlers.category import CategoryService
 from handlers.products import ProductService
 from states.main import MainSG
 
-service = CategoryService(API_URL)
-service_product = ProductService(API_URL)
+service = CategoryService(api_client)
+service_product = ProductService(api_client)
 
 # Окно списка категорий
 categories_list_window = Window(
     Const("Список категорий:"),
     Column(
         Select(
-            Format("📚 {item[name]}"),
+            Format("📚 {item[name]} ({item[product_count]})"),
             items="categories",
             item_id_getter=lambda x: x["id"],
             on_click=service.category_selected,
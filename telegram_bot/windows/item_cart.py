@@ -3,11 +3,11 @@ from aiogram_dialog.widgets.input import TextInput
 from aiogram_dialog.widgets.kbd import Button, Column, Select
 from aiogram_dialog.widgets.text import Const, Format
 
-from config.settings import API_URL
+from api.client import api_client
 from handlers.item_cart import CartService
 from states.main import MainSG
 
-service = CartService(API_URL)
+service = CartService(api_client)
 
 # Окно просмотра корзины
 item_cart_window = Window(
@@ -30,7 +30,7 @@ edit_cart_window = Window(
         Select(
             Format("📍 {item[product][name]}"),
             items="cart_items",
-            item_id_getter=lambda x: x["id"],
+            item_id_getter=lambda x: x["product"]["id"],
             on_click=service.selected_item,
             id="select_item"
         )),
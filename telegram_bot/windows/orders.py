@@ -2,15 +2,15 @@ from aiogram_dialog import Window
 from aiogram_dialog.widgets.kbd import Button, Column
 from aiogram_dialog.widgets.text import Const, Format
 
-from config.settings import API_URL
+from api.client import api_client
 from handlers.item_cart import CartService
 from handlers.orders import OrderService
 from handlers.users import UserService
 from states.main import MainSG
 
-user_service = UserService(API_URL)
-cart_service = CartService(API_URL)
-order_service = OrderService(API_URL, user_service, cart_service)
+user_service = UserService(api_client)
+cart_service = CartService(api_client)
+order_service = OrderService(api_client, user_service, cart_service)
 
 order_confirmation_window = Window(
     Format("""
@@ -2,13 +2,13 @@ from aiogram_dialog import Window
 from aiogram_dialog.widgets.kbd import Button, Column, Select
 from aiogram_dialog.widgets.text import Const, Format
 
-from config.settings import API_URL
+from api.client import api_client
 from handlers.item_cart import CartService
 from handlers.products import ProductService
 from states.main import MainSG
 
-service = ProductService(API_URL)
-service_item = CartService(API_URL)
+service = ProductService(api_client)
+service_item = CartService(api_client)
 
 # Окно списка товаров
 product_list_window = Window(
@@ -3,11 +3,11 @@ from aiogram_dialog.widgets.input import TextInput
 from aiogram_dialog.widgets.kbd import Button, Column, Row
 from aiogram_dialog.widgets.text import Const, Format
 
-from config.settings import API_URL
+from api.client import api_client
 from handlers.users import UserService
 from states.main import MainSG
 
-service = UserService(API_URL)
+service = UserService(api_client)
 
 # Окно личного кабинета
 profile_window = Window(